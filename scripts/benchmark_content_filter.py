@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Content Filter Microbenchmark
+Compares the keyword automaton against per-keyword substring scans
+
+Generates synthetic titles and descriptions seeded with filter keywords,
+times ContentFilter.should_filter against the previous substring-scan
+implementation, and reports how many decisions differ between the two.
+
+Usage:
+    python scripts/benchmark_content_filter.py
+    python scripts/benchmark_content_filter.py --articles 50000 --topics crypto nft
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.processors.content_filter import ContentFilter  # noqa: E402
+
+FILLER_WORDS = [
+    "council",
+    "budget",
+    "inflation",
+    "report",
+    "analysts",
+    "market",
+    "policy",
+    "state",
+    "river",
+    "county",
+    "infrastructure",
+    "plan",
+    "vote",
+    "hearing",
+    "energy",
+    "grid",
+    "housing",
+    "transit",
+    "school",
+    "board",
+]
+
+
+def substring_should_filter(content_filter: ContentFilter, title: str, description: str):
+    """Previous implementation: one substring scan per keyword, first reason wins"""
+    text = f"{title} {description}".lower()
+    for topic in content_filter.excluded_topics:
+        if topic in text:
+            return True, f"excluded_topic:{topic}"
+
+    if sum(1 for keyword in ContentFilter.SPORTS_KEYWORDS if keyword in text) >= 2:
+        return True, "sports"
+
+    title_lower = title.lower()
+    if any(keyword in title_lower for keyword in ContentFilter.CLICKBAIT_KEYWORDS):
+        return True, "clickbait"
+    if title.count("!") >= 2 or title.count("?") >= 2:
+        return True, "clickbait"
+    if len([w for w in title.split() if w.isupper() and len(w) > 3]) >= 2:
+        return True, "clickbait"
+    patterns = [r"\d+ (reasons|ways|things|tips|tricks)", r"number \d+", r"#\d+ will"]
+    if any(re.search(pattern, title_lower) for pattern in patterns):
+        return True, "clickbait"
+
+    if any(keyword in text for keyword in ContentFilter.ENTERTAINMENT_KEYWORDS):
+        return True, "entertainment"
+
+    return False, None
+
+
+def generate_articles(count: int, keyword_rate: float, seed: int) -> list[tuple[str, str]]:
+    """Synthetic (title, description) pairs with keywords sprinkled in"""
+    rng = random.Random(seed)
+    keywords = sorted(
+        ContentFilter.SPORTS_KEYWORDS
+        | ContentFilter.CLICKBAIT_KEYWORDS
+        | ContentFilter.ENTERTAINMENT_KEYWORDS
+    )
+
+    articles = []
+    for _ in range(count):
+        title_words = rng.choices(FILLER_WORDS, k=10)
+        description_words = rng.choices(FILLER_WORDS, k=30)
+        for words in (title_words, description_words):
+            if rng.random() < keyword_rate:
+                words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        articles.append((" ".join(title_words).title(), " ".join(description_words)))
+    return articles
+
+
+def time_filter(fn, articles: list[tuple[str, str]]) -> tuple[float, list]:
+    started = time.perf_counter()
+    decisions = [fn(title, description) for title, description in articles]
+    return time.perf_counter() - started, decisions
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark ContentFilter keyword matching")
+    parser.add_argument("--articles", type=int, default=20000)
+    parser.add_argument("--keyword-rate", type=float, default=0.3)
+    parser.add_argument("--topics", nargs="*", default=["crypto", "nft"])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    profile = type("Profile", (), {"get_excluded_topics": lambda _self: args.topics})()
+    content_filter = ContentFilter(user_profile=profile)
+    articles = generate_articles(args.articles, args.keyword_rate, args.seed)
+
+    substring_seconds, substring_decisions = time_filter(
+        lambda t, d: substring_should_filter(content_filter, t, d), articles
+    )
+    automaton_seconds, automaton_decisions = time_filter(content_filter.should_filter, articles)
+
+    differing = [
+        {"title": title, "substring": old, "automaton": new}
+        for (title, _), old, new in zip(
+            articles, substring_decisions, automaton_decisions, strict=True
+        )
+        if old != new
+    ]
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "content_filter",
+                "articles": args.articles,
+                "substring_us_per_article": round(substring_seconds / args.articles * 1e6, 2),
+                "automaton_us_per_article": round(automaton_seconds / args.articles * 1e6, 2),
+                "speedup": round(substring_seconds / automaton_seconds, 2),
+                "differing_decisions": len(differing),
+                "differing_examples": differing[:5],
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
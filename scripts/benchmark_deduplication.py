@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Deduplication Benchmark
+Runs ArticleDeduplicator against synthetic corpora with known duplicates
+
+Each corpus is written to a temporary SQLite database with controlled rates of
+exact, URL and near (title) duplicates. Per-article find_exact_duplicates/
+find_near_duplicates lookups are measured over a sample, then each stage of
+deduplicate_recent_articles() (URL, exact, title, story merge) is run in turn
+on one session the way that method runs them. Each is timed, its peak Python
+memory is traced, and its duplicates are scored against the ground truth for
+precision and recall.
+
+Usage:
+    python scripts/benchmark_deduplication.py --sizes 10000 100000
+    python scripts/benchmark_deduplication.py --sizes 1000000 --output results.json
+"""
+
+import argparse
+import json
+import logging
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+
+from src.database.connection import SessionLocal  # noqa: E402
+from src.database.models import Article, Base, RSSFeed  # noqa: E402
+from src.processors.deduplicator import ArticleDeduplicator  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+VOCABULARY_SIZE = 5000
+FEED_COUNT = 50
+INSERT_CHUNK = 10000
+
+
+def generate_corpus(
+    size: int,
+    exact_rate: float,
+    url_rate: float,
+    near_rate: float,
+    near_edit_fraction: float,
+    seed: int,
+) -> tuple[list[dict], dict[str, int], dict[str, str]]:
+    """
+    Generate synthetic article rows with ground-truth story groups
+
+    Args:
+        size: Total number of articles
+        exact_rate: Fraction that copy an earlier article's title and body
+        url_rate: Fraction that reuse an earlier article's URL with new wording
+        near_rate: Fraction that restate an earlier title under a new URL and body
+        near_edit_fraction: Share of near duplicates that also change one title word
+            (the rest differ only in case and punctuation)
+        seed: Random seed for reproducible corpora
+
+    Returns:
+        (article rows, mapping of guid to ground-truth group,
+         mapping of duplicate guid to its kind: "exact", "url" or "near")
+    """
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(VOCABULARY_SIZE)]
+    base_time = datetime.utcnow() - timedelta(hours=23)
+
+    rows: list[dict] = []
+    truth: dict[str, int] = {}
+    kinds: dict[str, str] = {}
+    originals: list[int] = []
+
+    for i in range(size):
+        guid = f"bench-{i}"
+        roll = rng.random()
+        fetched_at = base_time + timedelta(milliseconds=i)
+        feed_id = rng.randint(1, FEED_COUNT)
+
+        if originals and roll < exact_rate:
+            source = rows[rng.choice(originals)]
+            kinds[guid] = "exact"
+            row = {**source, "url": f"https://mirror{feed_id}.example.com/{i}"}
+        elif originals and roll < exact_rate + url_rate:
+            source = rows[rng.choice(originals)]
+            kinds[guid] = "url"
+            row = {
+                **source,
+                "title": " ".join(rng.choices(words, k=9)),
+                "normalized_content": " ".join(rng.choices(words, k=60)),
+            }
+        elif originals and roll < exact_rate + url_rate + near_rate:
+            source = rows[rng.choice(originals)]
+            kinds[guid] = "near"
+            title_words = source["title"].split()
+            if rng.random() < near_edit_fraction:
+                title_words[rng.randrange(len(title_words))] = rng.choice(words)
+            row = {
+                **source,
+                "title": " ".join(title_words).upper() + "!",
+                "normalized_content": " ".join(rng.choices(words, k=60)),
+                "url": f"https://rewrite{feed_id}.example.com/{i}",
+            }
+        else:
+            source = None
+            row = {
+                "title": " ".join(rng.choices(words, k=9)),
+                "normalized_content": " ".join(rng.choices(words, k=60)),
+                "url": f"https://feed{feed_id}.example.com/story/{i}",
+            }
+
+        row.update({"guid": guid, "feed_id": feed_id, "fetched_at": fetched_at})
+        truth[guid] = truth[source["guid"]] if source else i
+        if source is None:
+            originals.append(i)
+        rows.append(row)
+
+    return rows, truth, kinds
+
+
+def load_corpus(engine, rows: list[dict]) -> None:
+    """Bulk insert feeds and articles with Core inserts"""
+    with engine.begin() as conn:
+        conn.execute(
+            insert(RSSFeed),
+            [
+                {"id": i, "url": f"https://feed{i}.example.com/rss", "name": f"Feed {i}"}
+                for i in range(1, FEED_COUNT + 1)
+            ],
+        )
+        for start in range(0, len(rows), INSERT_CHUNK):
+            conn.execute(insert(Article), rows[start : start + INSERT_CHUNK])
+
+
+def score_edges(edges: list[tuple[int, int]], truth_by_id: dict[int, int]) -> dict[str, int]:
+    """Count true and false positive duplicate edges against ground truth"""
+    true_positives = sum(1 for a, b in edges if truth_by_id[a] == truth_by_id[b])
+    return {"detected": len(edges), "true_positives": true_positives}
+
+
+def score_stage(
+    edges: list[tuple[int, int]],
+    truth_by_id: dict[int, int],
+    kind_by_id: dict[int, str],
+    kind: str,
+    expected: int,
+) -> dict:
+    """Precision of a stage's edges, and its recall over the duplicates of its kind"""
+    scored = score_edges(edges, truth_by_id)
+    found = {b for a, b in edges if truth_by_id[a] == truth_by_id[b] and kind_by_id.get(b) == kind}
+    return {
+        **scored,
+        "expected": expected,
+        "precision": round(scored["true_positives"] / scored["detected"], 4)
+        if scored["detected"]
+        else None,
+        "recall": round(len(found) / expected, 4) if expected else None,
+    }
+
+
+def measure(args: argparse.Namespace, run) -> tuple[object, dict]:
+    """Call run(), returning its result with wall time, peak memory and any error"""
+    if args.memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    result = error = None
+    try:
+        result = run()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] if args.memory else None
+    if args.memory:
+        tracemalloc.stop()
+    return result, {
+        "wall_seconds": round(elapsed, 4),
+        "peak_memory_mb": round(peak / 1024 / 1024, 2) if peak is not None else None,
+        "error": error,
+    }
+
+
+def score_lookups(
+    found: dict[int, list[int]], truth_by_id: dict[int, int], group_sizes: Counter
+) -> dict:
+    """Precision and recall of per-article lookups against each article's true group"""
+    detected = sum(len(ids) for ids in found.values())
+    true_positives = sum(
+        1
+        for article_id, ids in found.items()
+        for other in ids
+        if truth_by_id[other] == truth_by_id[article_id]
+    )
+    expected = sum(group_sizes[truth_by_id[article_id]] - 1 for article_id in found)
+    return {
+        "lookups": len(found),
+        "detected": detected,
+        "true_positives": true_positives,
+        "precision": round(true_positives / detected, 4) if detected else None,
+        "recall": round(true_positives / expected, 4) if expected else None,
+    }
+
+
+def run_benchmark(size: int, args: argparse.Namespace) -> dict:
+    """Generate, load and deduplicate one corpus, returning its measurements"""
+    rows, truth, kinds = generate_corpus(
+        size, args.exact_rate, args.url_rate, args.near_rate, args.near_edit_fraction, args.seed
+    )
+    expected_duplicates = size - len(set(truth.values()))
+    group_sizes = Counter(truth.values())
+    expected_by_kind = Counter(kinds.values())
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(f"sqlite:///{Path(tmp_dir) / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+        SessionLocal.configure(bind=engine)
+
+        load_start = time.perf_counter()
+        load_corpus(engine, rows)
+        load_seconds = time.perf_counter() - load_start
+        del rows
+
+        session = SessionLocal()
+        try:
+            id_rows = session.query(Article.id, Article.guid).all()
+            truth_by_id = {article_id: truth[guid] for article_id, guid in id_rows}
+            kind_by_id = {article_id: kinds[guid] for article_id, guid in id_rows if guid in kinds}
+            sample_ids = random.Random(args.seed).sample(
+                sorted(truth_by_id), min(args.lookups, len(truth_by_id))
+            )
+            sample = session.query(Article).filter(Article.id.in_(sample_ids)).all()
+
+            deduplicator = ArticleDeduplicator()
+            stage_results = []
+            lookups = [
+                ("exact_lookup", deduplicator.find_exact_duplicates),
+                ("near_lookup", deduplicator.find_near_duplicates),
+            ]
+            for name, find in lookups:
+                found, result = measure(
+                    args,
+                    lambda find=find: {
+                        article.id: [match.id for match in find(article, session)]
+                        for article in sample
+                    },
+                )
+                if found is not None:
+                    result.update(score_lookups(found, truth_by_id, group_sizes))
+                stage_results.append({"stage": name, **result})
+                logger.info(f"[{size}] {name}: {result['wall_seconds']:.2f}s")
+
+            # The stages of deduplicate_recent_articles(), run and measured one at a time
+            cutoff = datetime.utcnow() - timedelta(hours=24)
+            recent_ids = [
+                article_id
+                for (article_id,) in session.query(Article.id)
+                .filter(Article.fetched_at >= cutoff)
+                .order_by(Article.fetched_at.desc())
+            ]
+            unprocessed_ids = list(recent_ids)
+            tracker = deduplicator.story_tracker
+            stages = [
+                ("url", "url", deduplicator._stage1_url_duplicates),
+                ("exact", "exact", deduplicator._stage2_exact_duplicates),
+                ("title", "near", deduplicator._stage3_title_similarity),
+            ]
+            edges: list[tuple[int, int]] = []
+            for name, kind, stage in stages:
+                edge_start = len(tracker.edges)
+                _stats, result = measure(
+                    args, lambda stage=stage: stage(session, unprocessed_ids, cutoff)
+                )
+                if result["error"]:
+                    session.rollback()
+                stage_edges = tracker.edges[edge_start:]
+                edges.extend(stage_edges)
+                result.update(
+                    score_stage(stage_edges, truth_by_id, kind_by_id, kind, expected_by_kind[kind])
+                )
+                stage_results.append({"stage": name, **result})
+                logger.info(
+                    f"[{size}] stage {name}: {result['wall_seconds']:.2f}s"
+                    + (f" ({result['error']})" if result["error"] else "")
+                )
+
+            def merge_stories() -> dict[str, int]:
+                # apply() clears the tracked edges, so they were collected above
+                story_stats = tracker.apply(session, recent_ids)
+                session.commit()
+                return story_stats
+
+            stats, result = measure(args, merge_stories)
+            stage_results.append({"stage": "stories", **result, **(stats or {})})
+            logger.info(f"[{size}] stage stories: {result['wall_seconds']:.2f}s")
+        finally:
+            session.close()
+            engine.dispose()
+
+    totals = score_edges(edges, truth_by_id)
+    detected_duplicates = {b for a, b in edges if truth_by_id[a] == truth_by_id[b]}
+
+    return {
+        "corpus_size": size,
+        "expected_duplicates": expected_duplicates,
+        "load_seconds": round(load_seconds, 4),
+        "stages": stage_results,
+        "total_wall_seconds": round(sum(s["wall_seconds"] for s in stage_results), 4),
+        "precision": round(totals["true_positives"] / totals["detected"], 4)
+        if totals["detected"]
+        else None,
+        "recall": round(len(detected_duplicates) / expected_duplicates, 4)
+        if expected_duplicates
+        else None,
+    }
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark ArticleDeduplicator at scale")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000])
+    parser.add_argument("--exact-rate", type=float, default=0.05)
+    parser.add_argument("--url-rate", type=float, default=0.05)
+    parser.add_argument("--near-rate", type=float, default=0.05)
+    parser.add_argument("--near-edit-fraction", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--lookups",
+        type=int,
+        default=200,
+        help="Articles sampled for the per-article find_* lookups",
+    )
+    parser.add_argument(
+        "--no-memory",
+        dest="memory",
+        action="store_false",
+        help="Skip tracemalloc (faster, no peak memory figures)",
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results here instead of stdout")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stderr)
+    # Stage-level INFO logs from the deduplicator are noise at benchmark scale
+    logging.getLogger("src.processors").setLevel(logging.WARNING)
+
+    results = {
+        "benchmark": "deduplication",
+        "generated_at": datetime.utcnow().isoformat(),
+        "parameters": {
+            "exact_rate": args.exact_rate,
+            "url_rate": args.url_rate,
+            "near_rate": args.near_rate,
+            "near_edit_fraction": args.near_edit_fraction,
+            "seed": args.seed,
+            "lookups": args.lookups,
+        },
+        "runs": [run_benchmark(size, args) for size in args.sizes],
+    }
+
+    payload = json.dumps(results, indent=2)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(payload)
+        logger.info(f"Results written to {args.output}")
+    else:
+        print(payload)
+
+
+if __name__ == "__main__":
+    main()
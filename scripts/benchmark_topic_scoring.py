@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Topic Scoring Benchmark
+Compares per-article TopicMatcher.analyze against the batch topic scorer
+
+Generates synthetic articles seeded with topic keywords, place names and entities,
+scores them with both paths, verifies the results are identical and reports
+articles per minute.
+
+Usage:
+    python scripts/benchmark_topic_scoring.py
+    python scripts/benchmark_topic_scoring.py --articles 200000
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.context.batch_scorer import BatchTopicScorer  # noqa: E402
+from src.context.gazetteer import PLACES  # noqa: E402
+from src.context.topic_matcher import TOPIC_KEYWORDS, TopicMatcher  # noqa: E402
+
+LOCATION = {"city": "Fairfax", "region": "Northern Virginia", "state": "Virginia"}
+
+FILLER_WORDS = [
+    "officials",
+    "said",
+    "the",
+    "report",
+    "on",
+    "tuesday",
+    "after",
+    "residents",
+    "announced",
+    "new",
+    "plan",
+    "for",
+    "next",
+    "year",
+    "according",
+    "to",
+    "sources",
+    "budget",
+    "meeting",
+    "local",
+]
+
+FEED_CATEGORIES = ["Local News", "Technology", "Cybersecurity", "World", "State Politics", None]
+
+
+def generate_articles(count: int, seed: int) -> list[SimpleNamespace]:
+    """Synthetic articles with a few topic keywords and place names each"""
+    rng = random.Random(seed)
+    keywords = sorted(
+        {
+            term
+            for categories in TOPIC_KEYWORDS.values()
+            for words in categories.values()
+            for term in words
+        }
+        | {alias for place in PLACES.values() for alias in (place.name, *place.aliases)}
+    )
+    entities = ["CISA", "Microsoft", "Fairfax County", "OpenAI", "Congress", "Nvidia"]
+    feeds = [SimpleNamespace(category=category) for category in FEED_CATEGORIES]
+
+    def text(words: int, hits: int) -> str:
+        tokens = rng.choices(FILLER_WORDS, k=words)
+        for _ in range(hits):
+            tokens.insert(rng.randrange(len(tokens) + 1), rng.choice(keywords))
+        return " ".join(tokens)
+
+    return [
+        SimpleNamespace(
+            id=None,
+            title=text(10, rng.randint(0, 2)).title(),
+            description=text(30, rng.randint(0, 3)),
+            normalized_content=text(120, rng.randint(0, 6)),
+            entities=rng.sample(entities, rng.randint(0, 3)),
+            feed=rng.choice(feeds),
+        )
+        for _ in range(count)
+    ]
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark batch topic scoring")
+    parser.add_argument("--articles", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    articles = generate_articles(args.articles, args.seed)
+
+    matcher = TopicMatcher()
+    started = time.perf_counter()
+    scalar = [matcher.analyze(article, LOCATION) for article in articles]
+    scalar_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = BatchTopicScorer(LOCATION).score(articles)
+    batch_seconds = time.perf_counter() - started
+
+    mismatches = sum(1 for a, b in zip(scalar, batch, strict=True) if a != b)
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "topic_scoring",
+                "articles": args.articles,
+                "scalar_articles_per_minute": round(args.articles / scalar_seconds * 60),
+                "batch_articles_per_minute": round(args.articles / batch_seconds * 60),
+                "speedup": round(scalar_seconds / batch_seconds, 2),
+                "mismatches": mismatches,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ from .colors import accent, header, muted
 from .forecast import forecast_command
 from .frames import frames_command
 from .output import set_debug_mode
+from .search import search_command
 
 # Maps command prefix to its Click command object.
 # Order matters: longer prefixes checked first via startswith().
@@ -20,6 +21,7 @@ COMMAND_DISPATCH = {
     "brief": brief_group,
     "forecast": forecast_command,
     "frames": frames_command,
+    "search": search_command,
 }
 
 
@@ -27,7 +29,7 @@ def print_command_refresher():
     """Print a short refresher of available commands."""
     refresher = (
         f"\n{header('Commands:')} {accent('brief')} | {accent('forecast')} | "
-        f"{accent('frames')} | help | exit\n"
+        f"{accent('frames')} | {accent('search')} | help | exit\n"
     )
     click.echo(refresher)
 
@@ -38,6 +40,7 @@ def print_help():
     click.echo(f"  {accent('brief')}               - Generate intelligence brief and report")
     click.echo(f"  {accent('forecast')}            - Generate long-term trend forecasts")
     click.echo(f"  {accent('frames')}              - Manage narrative frame glossary")
+    click.echo(f"  {accent('search')} <words>      - Full-text search over fetched articles")
     click.echo(f"  {accent('help')}                - Show this help message")
     click.echo(f"  {accent('exit')}                - Exit InsightWeaver")
     click.echo()
@@ -48,6 +51,7 @@ def print_help():
     click.echo(
         muted("  Scope filters:   --local (-l), --state (-s), --national (-n), --global (-g)")
     )
+    click.echo(muted('  Text filter:     --search "words"'))
     click.echo()
     click.echo(header("Forecast command options:"))
     click.echo(f"  {accent('--horizon')} [6mo|1yr|3yr|5yr]  - Specific time horizon (default: all)")
@@ -65,6 +69,11 @@ def print_help():
     click.echo(f"  {accent('frames edit')} <id>     - Edit a frame in $EDITOR")
     click.echo(f"  {accent('frames gaps')}          - Show recurring perspective gaps")
     click.echo()
+    click.echo(header("Search command options:"))
+    click.echo(f"  {accent('--hours N')}           - Only articles fetched in the last N hours")
+    click.echo(f"  {accent('--topic')} <topic>     - Only articles with keywords of a topic")
+    click.echo(f"  {accent('--limit N')}           - Maximum results (default: 20)")
+    click.echo()
     click.echo(header("Examples:"))
     click.echo(muted("  brief                  (24-hour brief, all topics)"))
     click.echo(muted("  brief -cs -n           (national cybersecurity news)"))
@@ -73,6 +82,8 @@ def print_help():
     click.echo(muted("  forecast --horizon 1yr --full  (1-year detailed forecast)"))
     click.echo(muted("  frames list            (view narrative frame glossary)"))
     click.echo(muted("  frames gaps            (view perspective gaps in your feeds)"))
+    click.echo(muted("  search ransomware hospital --hours 168  (week of matching articles)"))
+    click.echo(muted("  search --similar --topic housing  (articles closest to a topic)"))
     click.echo()
     click.echo(muted("Tip: Add --debug to any command to see detailed logs"))
     click.echo()
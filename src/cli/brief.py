@@ -85,6 +85,12 @@ def setup_database():
 @click.option(
     "--global", "-g", "filter_global", is_flag=True, help="Filter to global/international news only"
 )
+@click.option(
+    "--search",
+    "search_text",
+    default=None,
+    help="Only include articles containing all of these words (full-text index)",
+)
 def brief_group(
     ctx,
     hours,
@@ -95,6 +101,7 @@ def brief_group(
     filter_state,
     filter_national,
     filter_global,
+    search_text,
 ):
     """
     Run intelligence brief pipeline and generate report
@@ -139,6 +146,9 @@ def brief_group(
         if scopes:
             topic_filters["scopes"] = scopes
 
+        if search_text:
+            topic_filters["search"] = search_text
+
         # Store in context for subcommands
         ctx.ensure_object(dict)
         ctx.obj["topic_filters"] = topic_filters
@@ -153,6 +163,8 @@ def brief_group(
                 filter_desc.append(f"{', '.join(topics)}")
             if scopes:
                 filter_desc.append(f"{', '.join(scopes)}")
+            if search_text:
+                filter_desc.append(f"'{search_text}'")
             loading_msg = f"Generating {' '.join(filter_desc)} brief"
         else:
             loading_msg = "Generating intelligence brief"
@@ -197,6 +209,8 @@ def brief_group(
                     click.echo(f"  Topics: {', '.join(topic_filters['topics'])}")
                 if "scopes" in topic_filters:
                     click.echo(f"  Scopes: {', '.join(topic_filters['scopes'])}")
+                if "search" in topic_filters:
+                    click.echo(f"  Search: {topic_filters['search']}")
                 click.echo("\nSuggestions:")
                 click.echo("  • Try expanding the time window: --hours 48 or --hours 168")
                 click.echo("  • Use fewer filters (remove -s or -cs)")
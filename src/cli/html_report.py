@@ -102,6 +102,15 @@ def _render_situation(situation: dict, index: int) -> str:
     futures = situation.get("where_this_goes", {})
     causal = situation.get("causal_structure", {})
     gaps = situation.get("information_gaps", [])
+    coverage = situation.get("story_coverage", {})
+
+    # Cross-day story coverage
+    coverage_html = ""
+    if coverage.get("feed_count", 0) > 1 and coverage.get("first_seen"):
+        since = datetime.fromisoformat(coverage["first_seen"]).strftime("%B %d")
+        coverage_html = (
+            f'<p class="meta">Story seen in {coverage["feed_count"]} feeds since {since}</p>'
+        )
 
     # Narrative paragraphs
     narrative_html = ""
@@ -212,6 +221,7 @@ def _render_situation(situation: dict, index: int) -> str:
     return f"""
     <article class="situation">
         <h2><span class="situation-number">{index}</span> {title}</h2>
+        {coverage_html}
         <div class="narrative">{narrative_html}</div>
         {actors_html}
         {power_html}
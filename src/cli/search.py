@@ -0,0 +1,102 @@
+"""
+Search Command - Full-Text Article Search
+Keyword search over the article corpus via the SQLite FTS5 index,
+or similarity search via the article vector index.
+"""
+
+from datetime import datetime, timedelta
+
+import click
+from sqlalchemy.orm import joinedload
+
+from ..context.topic_matcher import TOPIC_KEYWORDS, TopicMatcher
+from ..context.vector_index import VectorIndex, embed_text, interest_text
+from ..database.connection import get_db
+from ..database.models import Article
+from ..database.search_index import ArticleSearchIndex, match_all
+from .colors import accent, error, header, muted
+
+
+@click.command(name="search")
+@click.argument("words", nargs=-1)
+@click.option("--hours", type=int, default=None, help="Only articles fetched in the last N hours")
+@click.option("--limit", type=int, default=20, help="Maximum results to show (default: 20)")
+@click.option(
+    "--topic",
+    "topics",
+    multiple=True,
+    type=click.Choice(sorted(TOPIC_KEYWORDS)),
+    help="Only articles mentioning a keyword of this topic (repeatable)",
+)
+@click.option(
+    "--similar",
+    is_flag=True,
+    help="Rank by similarity to WORDS and topics instead of requiring keywords",
+)
+def search_command(words, hours, limit, topics, similar):
+    """Search articles for WORDS (all must appear), best matches first."""
+    since = datetime.utcnow() - timedelta(hours=hours) if hours else None
+    if similar:
+        _similar_articles(words, topics, since, limit)
+        return
+
+    expressions = []
+    if words:
+        expressions.append(match_all(" ".join(words)))
+    if topics:
+        expressions.append(TopicMatcher().search_expression(list(topics)))
+    expressions = [expression for expression in expressions if expression]
+    if not expressions:
+        click.echo(error("Give search words and/or --topic"))
+        return
+
+    expression = " AND ".join(f"({expression})" for expression in expressions)
+
+    with get_db() as session:
+        index = ArticleSearchIndex(session)
+        if not index.available():
+            click.echo(error("Full-text index not found. Run 'make db-migrate' to create it."))
+            return
+
+        if since is not None:
+            index.index_missing(since)
+        articles = index.search(expression, since=since, limit=limit)
+
+        _print_articles(articles)
+
+
+def _similar_articles(words, topics, since, limit):
+    """Articles whose vectors are closest to the words plus the topics' keywords"""
+    query = embed_text(" ".join([*words, *(interest_text(topic) for topic in topics)]))
+    if not query:
+        click.echo(error("Give search words and/or --topic"))
+        return
+
+    with get_db() as session:
+        index = VectorIndex(session)
+        index.index_missing(since or datetime.min)
+        ranked = [
+            article_id for article_id, score in index.search(query, limit, since) if score > 0
+        ]
+
+        articles = {
+            article.id: article
+            for article in session.query(Article)
+            .options(joinedload(Article.feed))
+            .filter(Article.id.in_(ranked))
+        }
+        _print_articles([articles[article_id] for article_id in ranked if article_id in articles])
+
+
+def _print_articles(articles):
+    if not articles:
+        click.echo(muted("No matching articles."))
+        return
+
+    click.echo(header(f"{len(articles)} matching articles"))
+    click.echo("=" * 70)
+    for article in articles:
+        fetched = article.fetched_at.strftime("%Y-%m-%d") if article.fetched_at else "?"
+        source = article.feed.name if article.feed else "unknown feed"
+        click.echo(f"{muted(fetched)}  {accent(article.title or '(untitled)')}")
+        click.echo(muted(f"            {source}  {article.url or ''}"))
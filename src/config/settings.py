@@ -22,6 +22,19 @@ class Settings(BaseSettings):
     # API Keys
     anthropic_api_key: str = os.getenv("ANTHROPIC_API_KEY", "")
 
+    # Claude API request scheduling (shared by all calls from one client)
+    claude_max_concurrent_requests: int = int(os.getenv("CLAUDE_MAX_CONCURRENT_REQUESTS", "4"))
+    claude_requests_per_minute: int = int(os.getenv("CLAUDE_REQUESTS_PER_MINUTE", "50"))
+    # Claude response cache: "off", "on" (read and write) or "replay" (cached responses only)
+    claude_response_cache: str = os.getenv("CLAUDE_RESPONSE_CACHE", "off").lower()
+    claude_response_cache_ttl_hours: int = int(os.getenv("CLAUDE_RESPONSE_CACHE_TTL_HOURS", "72"))
+    claude_response_cache_max_mb: int = int(os.getenv("CLAUDE_RESPONSE_CACHE_MAX_MB", "200"))
+    # Send Pass 2 synthesis and forecast requests as Message Batches on latency-tolerant
+    # runs (e.g. the scheduled daily brief); clustering and frame discovery stay direct
+    claude_batch_mode: bool = os.getenv("CLAUDE_BATCH_MODE", "False").lower() == "true"
+    claude_batch_poll_seconds: int = int(os.getenv("CLAUDE_BATCH_POLL_SECONDS", "30"))
+    claude_batch_timeout_minutes: int = int(os.getenv("CLAUDE_BATCH_TIMEOUT_MINUTES", "60"))
+
     # Application
     debug: bool = os.getenv("DEBUG", "False").lower() == "true"
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
@@ -31,6 +44,18 @@ class Settings(BaseSettings):
     smart_rss_fetch_threshold_minutes: int = int(
         os.getenv("SMART_RSS_FETCH_THRESHOLD_MINUTES", "60")
     )
+    enable_known_article_filter: bool = (
+        os.getenv("ENABLE_KNOWN_ARTICLE_FILTER", "True").lower() == "true"
+    )
+    known_article_filter_rebuild_hours: int = int(
+        os.getenv("KNOWN_ARTICLE_FILTER_REBUILD_HOURS", "24")
+    )
+    enable_curation_cache: bool = os.getenv("ENABLE_CURATION_CACHE", "True").lower() == "true"
+
+    # Context Diversity (maximal marginal relevance article selection)
+    mmr_lambda: float = float(os.getenv("MMR_LAMBDA", "0.7"))
+    mmr_source_cap: int = int(os.getenv("MMR_SOURCE_CAP", "8"))
+    mmr_pool_factor: int = int(os.getenv("MMR_POOL_FACTOR", "3"))
 
     # Data Retention Policies (in days)
     retention_articles_days: int = int(os.getenv("RETENTION_ARTICLES_DAYS", "90"))
@@ -0,0 +1,85 @@
+"""
+Article Records
+Column-only article loading for context curation
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy.orm import Query
+
+from src.database.models import Article, ArticleBody, RSSFeed, decompress_body
+
+
+@dataclass(frozen=True)
+class FeedRecord:
+    """The feed fields curation reads"""
+
+    name: str | None
+    category: str | None
+
+
+@dataclass
+class ArticleRecord:
+    """
+    The article fields curation reads, detached from the ORM
+
+    Duck-types Article for formatting, topic matching and selection, but
+    never carries raw HTML content or triggers lazy loads.
+    """
+
+    id: int
+    title: str | None
+    description: str | None
+    url: str | None
+    published_date: datetime | None
+    fetched_at: datetime | None
+    entities: list | None
+    embedding_summary: str | None
+    relevance_score: float | None
+    story_id: int | None
+    normalized_content: str | None
+    feed: FeedRecord | None
+
+
+RECORD_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.description,
+    Article.url,
+    Article.published_date,
+    Article.fetched_at,
+    Article.entities,
+    Article.embedding_summary,
+    Article.relevance_score,
+    Article.story_id,
+    Article._normalized_content,
+    ArticleBody.compressed_text,
+    RSSFeed.id,
+    RSSFeed.name,
+    RSSFeed.category,
+)
+
+
+def load_article_records(query: Query, limit: int | None = None) -> list[ArticleRecord]:
+    """
+    Run an Article query selecting only record columns, in one statement
+
+    Filters, joins and ordering already on the query are kept; the feed and
+    shared body are outer-joined rather than loaded per article.
+    """
+    query = (
+        query.outerjoin(RSSFeed, RSSFeed.id == Article.feed_id)
+        .outerjoin(ArticleBody, ArticleBody.id == Article.body_id)
+        .with_entities(*RECORD_COLUMNS)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+
+    records = []
+    for row in query:
+        (*fields, inline_text, compressed_text, feed_id, feed_name, feed_category) = row
+        normalized = decompress_body(compressed_text) if compressed_text else inline_text
+        feed = FeedRecord(name=feed_name, category=feed_category) if feed_id else None
+        records.append(ArticleRecord(*fields, normalized_content=normalized, feed=feed))
+    return records
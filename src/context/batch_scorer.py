@@ -0,0 +1,193 @@
+"""
+Batch Topic Scorer
+Scores many articles at once as a sparse term-document matrix times a topic-weight matrix
+"""
+
+import logging
+from collections.abc import Sequence
+
+from src.database.models import Article
+from src.processors.keyword_automaton import KeywordAutomaton, tokenize
+
+from .gazetteer import get_gazetteer
+from .topic_matcher import (
+    CATEGORY_WEIGHTS,
+    SCOPE_CATEGORY_WORDS,
+    TOPIC_KEYWORDS,
+    ArticleSignals,
+)
+
+logger = logging.getLogger(__name__)
+
+# Extra topic weight for a matching entity and for a matching feed category
+ENTITY_WEIGHT = 3.0
+FEED_CATEGORY_WEIGHT = 2.0
+
+
+class BatchTopicScorer:
+    """
+    Batch equivalent of TopicMatcher.analyze for backfills and re-scoring
+
+    Every distinct keyword string is a term column. Each article becomes a
+    sparse row of the terms it contains, and the row is multiplied by a
+    term-by-topic weight matrix whose entries sum CATEGORY_WEIGHTS over every
+    (topic, category) list that contains the term - the same sum the scalar
+    path builds per article. Entity and feed-category contributions repeat
+    heavily across a batch and are computed once per distinct string.
+
+    numpy/scipy are not dependencies of this project, so both matrices are
+    kept as sparse Python rows (term ids per article, (topic, weight) pairs
+    per term); the product is the same.
+    """
+
+    def __init__(self, user_location: dict | None = None):
+        self.gazetteer = get_gazetteer(user_location)
+        self.topics = list(TOPIC_KEYWORDS)
+
+        place_aliases = {
+            alias: place_id
+            for place_id, aliases in self.gazetteer.aliases().items()
+            for alias in aliases
+        }
+        terms = sorted(
+            {
+                term
+                for categories in TOPIC_KEYWORDS.values()
+                for words in categories.values()
+                for term in words
+            }
+            | set(place_aliases)
+        )
+        self.term_ids = {term: index for index, term in enumerate(terms)}
+
+        # Sparse term x topic weight matrix, plus per-term entity/core flags and place
+        weights: list[dict[int, float]] = [{} for _ in terms]
+        entity_topics: list[set[int]] = [set() for _ in terms]
+        core_topics: list[set[int]] = [set() for _ in terms]
+        for topic_index, topic in enumerate(self.topics):
+            for category, words in TOPIC_KEYWORDS[topic].items():
+                weight = CATEGORY_WEIGHTS.get(category, 1.0)
+                for term in set(words):
+                    term_id = self.term_ids[term]
+                    row = weights[term_id]
+                    row[topic_index] = row.get(topic_index, 0.0) + weight
+                    if category == "entities":
+                        entity_topics[term_id].add(topic_index)
+                    elif category == "core":
+                        core_topics[term_id].add(topic_index)
+        self.weights = [tuple(row.items()) for row in weights]
+        self.entity_topics = [frozenset(topics) for topics in entity_topics]
+        self.core_topics = [frozenset(topics) for topics in core_topics]
+        self.term_places = [place_aliases.get(term) for term in terms]
+
+        self.automaton = KeywordAutomaton({"term": set(terms)})
+        self._entity_cache: dict[str, tuple[frozenset[int], set[str]]] = {}
+        self._feed_category_cache: dict[str, tuple[tuple[int, ...], set[str]]] = {}
+
+    def term_matrix(self, articles: Sequence[Article]) -> tuple[list[set[int]], list[set[str]]]:
+        """
+        Build the sparse term-document matrix for a batch
+
+        Returns:
+            (rows, places) - distinct term ids per article, and the places
+            mentioned in each article's title/description
+        """
+        term_ids = self.term_ids
+        term_places = self.term_places
+        rows = []
+        places = []
+        for article in articles:
+            # Places come from title and description; topics also see the first 500 chars of content
+            scope_tokens = tokenize(f"{article.title or ''} {article.description or ''}")
+            tokens = scope_tokens + tokenize((article.normalized_content or "")[:500])
+            scope_end = len(scope_tokens)
+
+            row: set[int] = set()
+            place_hits = []
+            for _label, keyword, start, end in self.automaton.find(tokens):
+                term_id = term_ids[keyword]
+                row.add(term_id)
+                if end <= scope_end and term_places[term_id]:
+                    place_hits.append((term_places[term_id], start, end))
+            rows.append(row)
+            places.append(self.gazetteer.select_longest(place_hits))
+        return rows, places
+
+    def score(self, articles: Sequence[Article]) -> list[ArticleSignals]:
+        """
+        Score every topic and scope for a batch of articles
+
+        Returns:
+            One ArticleSignals per article, identical to TopicMatcher.analyze
+        """
+        rows, places = self.term_matrix(articles)
+        topics = self.topics
+        weights = self.weights
+
+        results = []
+        for article, row, article_places in zip(articles, rows, places, strict=True):
+            # Sparse row x weight matrix
+            totals: dict[int, float] = {}
+            for term_id in row:
+                for topic_index, weight in weights[term_id]:
+                    totals[topic_index] = totals.get(topic_index, 0.0) + weight
+
+            for entity in article.entities or []:
+                entity_topics, entity_places = self._entity_signals(entity)
+                for topic_index in entity_topics:
+                    totals[topic_index] = totals.get(topic_index, 0.0) + ENTITY_WEIGHT
+                article_places |= entity_places
+
+            if article.feed and article.feed.category:
+                boosted, category_places = self._feed_category_signals(article.feed.category)
+                for topic_index in boosted:
+                    totals[topic_index] = totals.get(topic_index, 0.0) + FEED_CATEGORY_WEIGHT
+                article_places |= category_places
+
+            results.append(
+                ArticleSignals(
+                    topic_scores={topics[index]: score for index, score in totals.items()},
+                    places=article_places,
+                    scopes=self.gazetteer.scopes(article_places),
+                )
+            )
+        return results
+
+    def _hits(self, text: str) -> tuple[set[int], set[str]]:
+        """Distinct term ids and longest-match places in a short string"""
+        term_ids = set()
+        place_hits = []
+        for _label, keyword, start, end in self.automaton.find(tokenize(text)):
+            term_id = self.term_ids[keyword]
+            term_ids.add(term_id)
+            if self.term_places[term_id]:
+                place_hits.append((self.term_places[term_id], start, end))
+        return term_ids, self.gazetteer.select_longest(place_hits)
+
+    def _entity_signals(self, entity: str) -> tuple[frozenset[int], set[str]]:
+        cached = self._entity_cache.get(entity)
+        if cached is None:
+            term_ids, entity_places = self._hits(entity)
+            entity_topics = frozenset().union(*(self.entity_topics[t] for t in term_ids))
+            cached = self._entity_cache[entity] = (entity_topics, entity_places)
+        return cached
+
+    def _feed_category_signals(self, category: str) -> tuple[tuple[int, ...], set[str]]:
+        cached = self._feed_category_cache.get(category)
+        if cached is None:
+            category_lower = category.lower()
+            category_words = set(tokenize(category))
+            term_ids, category_places = self._hits(category)
+
+            core_hits = frozenset().union(*(self.core_topics[t] for t in term_ids))
+            boosted = tuple(
+                index
+                for index, topic in enumerate(self.topics)
+                if topic in category_lower or index in core_hits
+            )
+            for scope, words in SCOPE_CATEGORY_WORDS.items():
+                home = self.gazetteer.home_places[scope]
+                if category_words & words and home:
+                    category_places.add(home)
+            cached = self._feed_category_cache[category] = (boosted, category_places)
+        return cached
@@ -0,0 +1,265 @@
+"""
+Candidate Pool Cache
+Formatted, token-counted curation candidates for a window, shared across filter variants and runs
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.config.settings import settings
+from src.database.models import Article, ArticleTopicScore
+
+from .article_records import ArticleRecord, FeedRecord
+from .gazetteer import SCOPES
+from .topic_matcher import TOPIC_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# Bump when the pool file layout or what a pool holds changes
+POOL_FORMAT_VERSION = 1
+
+CACHE_DIRNAME = "curation_cache"
+
+# Pools older than this are rebuilt even if no articles arrived
+POOL_TTL_MINUTES = 60
+
+# Candidates held per pool; filter variants of a larger window query the database
+POOL_MAX_ARTICLES = 1000
+
+# Pool files kept on disk (oldest are removed first)
+MAX_CACHED_POOLS = 8
+
+DATETIME_FIELDS = ("published_date", "fetched_at")
+
+
+@dataclass
+class PoolArticle:
+    """One cached candidate: its record, formatted entry and the scores filters need"""
+
+    record: ArticleRecord
+    entry: dict[str, Any]  # Formatted as by ContextCurator._format_articles, with story coverage
+    tokens: int
+    topics: dict[str, float]  # Stored topic scores at the pool's location
+    scopes: list[str]
+
+    def to_json(self) -> dict[str, Any]:
+        record = dict(vars(self.record))
+        for field in DATETIME_FIELDS:
+            record[field] = record[field].isoformat() if record[field] else None
+        record["feed"] = vars(self.record.feed) if self.record.feed else None
+        return {
+            "record": record,
+            "entry": self.entry,
+            "tokens": self.tokens,
+            "topics": self.topics,
+            "scopes": self.scopes,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "PoolArticle":
+        record = dict(data["record"])
+        for field in DATETIME_FIELDS:
+            record[field] = datetime.fromisoformat(record[field]) if record[field] else None
+        record["feed"] = FeedRecord(**record["feed"]) if record["feed"] else None
+        return cls(
+            record=ArticleRecord(**record),
+            entry=data["entry"],
+            tokens=data["tokens"],
+            topics=data["topics"],
+            scopes=data["scopes"],
+        )
+
+
+@dataclass
+class CandidatePool:
+    """
+    Every story-representative candidate of a window, in relevance order
+
+    Topic and scope variants are answered in memory with the same rules as
+    TopicScoreIndex.apply_filters, so `brief` and `brief --cybersecurity`
+    share one pool.
+    """
+
+    key: str
+    built_at: datetime
+    cutoff: datetime
+    complete: bool  # False when the window held more than POOL_MAX_ARTICLES candidates
+    articles: list[PoolArticle]
+
+    def select(self, topic_filters: dict, cutoff: datetime, limit: int) -> list[PoolArticle] | None:
+        """
+        Candidates for a filter variant, or None when the pool cannot answer it
+
+        Full-text search needs the FTS index, and a filtered variant of an
+        incomplete pool could miss matches beyond the pooled ones.
+        """
+        if topic_filters.get("search"):
+            return None
+        topics = topic_filters.get("topics", [])
+        scopes = topic_filters.get("scopes", [])
+        if (topics or scopes) and not self.complete:
+            return None
+
+        # The window slides while the pool is reused
+        articles = [
+            article
+            for article in self.articles
+            if article.record.fetched_at and article.record.fetched_at >= cutoff
+        ]
+
+        if scopes and all(scope in SCOPES for scope in scopes):
+            wanted = set(scopes)
+            articles = [article for article in articles if wanted & set(article.scopes)]
+
+        if topics:
+            scored = [
+                (max(article.topics.get(topic, 0.0) for topic in topics), article)
+                for article in articles
+            ]
+            # Stable sort: ties keep relevance order
+            articles = [
+                article
+                for score, article in sorted(scored, key=lambda pair: -pair[0])
+                if score >= TOPIC_THRESHOLD
+            ]
+
+        return articles[:limit]
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "version": POOL_FORMAT_VERSION,
+            "key": self.key,
+            "built_at": self.built_at.isoformat(),
+            "cutoff": self.cutoff.isoformat(),
+            "complete": self.complete,
+            "articles": [article.to_json() for article in self.articles],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "CandidatePool":
+        return cls(
+            key=data["key"],
+            built_at=datetime.fromisoformat(data["built_at"]),
+            cutoff=datetime.fromisoformat(data["cutoff"]),
+            complete=data["complete"],
+            articles=[PoolArticle.from_json(article) for article in data["articles"]],
+        )
+
+
+class CandidatePoolCache:
+    """
+    On-disk candidate pools keyed by window, data watermark and profile
+
+    The watermark (newest article id and fetch time, the number of articles
+    filtered out, the count and sum of relevance scores, the sum of story ids
+    and the count and sum of stored topic scores) changes whenever articles
+    arrive, are filtered, are merged into other stories by deduplication or
+    have their relevance or topics rescored, so a stale pool is never
+    found; the profile key is the RelevanceScorer
+    version, which covers location, interests and source trust. Pools are
+    JSON files in the data directory so separate CLI runs share them.
+    """
+
+    def __init__(self, cache_dir: Path | None = None):
+        self.cache_dir = Path(cache_dir or settings.data_dir / CACHE_DIRNAME)
+
+    @staticmethod
+    def watermark(session: Session) -> list[Any]:
+        # Scalar subqueries keep the whole watermark to one statement per lookup
+        topic_rows = select(func.count()).select_from(ArticleTopicScore).scalar_subquery()
+        topic_total = select(func.total(ArticleTopicScore.score)).scalar_subquery()
+        (
+            newest_id,
+            newest_fetch,
+            filtered,
+            scored,
+            score_total,
+            story_total,
+            topic_count,
+            topic_score_total,
+        ) = session.query(
+            func.max(Article.id),
+            func.max(Article.fetched_at),
+            func.count(Article.id).filter(Article.filtered.is_(True)),
+            func.count(Article.relevance_score),
+            func.total(Article.relevance_score),
+            func.total(Article.story_id),
+            topic_rows,
+            topic_total,
+        ).one()
+        return [
+            newest_id,
+            newest_fetch.isoformat() if newest_fetch else None,
+            filtered,
+            scored,
+            round(score_total, 6),
+            story_total,
+            topic_count,
+            round(topic_score_total or 0.0, 6),
+        ]
+
+    @staticmethod
+    def key(hours: int, watermark: list[Any], profile_version: str) -> str:
+        fingerprint = json.dumps([POOL_FORMAT_VERSION, hours, watermark, profile_version])
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:24]
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"pool-{key}.json"
+
+    def load(self, key: str) -> CandidatePool | None:
+        """The pool for a key, if cached and younger than POOL_TTL_MINUTES"""
+        path = self._path(key)
+        try:
+            with path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable candidate pool {path.name}: {e}")
+            return None
+
+        if data.get("version") != POOL_FORMAT_VERSION:
+            return None
+        pool = CandidatePool.from_json(data)
+        if datetime.utcnow() - pool.built_at > timedelta(minutes=POOL_TTL_MINUTES):
+            return None
+        logger.info(f"Candidate pool cache hit ({len(pool.articles)} articles)")
+        return pool
+
+    def save(self, pool: CandidatePool):
+        """Write a pool atomically and drop the oldest pools beyond MAX_CACHED_POOLS"""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(pool.key)
+            tmp_path = path.with_suffix(".tmp")
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(pool.to_json(), f)
+            os.replace(tmp_path, path)
+
+            pools = sorted(self.cache_dir.glob("pool-*.json"), key=lambda p: p.stat().st_mtime)
+            for old in pools[:-MAX_CACHED_POOLS]:
+                old.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not save candidate pool: {e}")
+
+
+_pool_cache: CandidatePoolCache | None = None
+
+
+def get_candidate_pool_cache() -> CandidatePoolCache | None:
+    """Return the process-wide pool cache, or None when disabled in settings"""
+    global _pool_cache
+    if not settings.enable_curation_cache:
+        return None
+    if _pool_cache is None:
+        _pool_cache = CandidatePoolCache()
+    return _pool_cache
@@ -3,55 +3,144 @@ Minimal Claude API Client
 Simple wrapper focused on context-driven analysis
 """
 
+import asyncio
 import logging
+import time
+from dataclasses import asdict, dataclass
 from typing import Any
 
 from anthropic import AsyncAnthropic
 
 from ..config.settings import settings
+from ..utils.error_handling import ResponseCacheMiss
+from .message_batches import MessageBatcher
+from .response_cache import ResponseCache, get_response_cache
 
 logger = logging.getLogger(__name__)
 
+# A system prompt is plain text or ordered text blocks (see system_blocks)
+SystemPrompt = str | list[dict[str, Any]]
+
+CACHE_CONTROL = {"type": "ephemeral"}
+
+
+@dataclass
+class CallUsage:
+    """Token usage of one API call, including prompt-cache writes and reads"""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+    @classmethod
+    def from_response(cls, response: Any) -> "CallUsage":
+        # Cache fields are None when the request used no cache_control
+        usage = getattr(response, "usage", None)
+        values = {field: getattr(usage, field, None) for field in cls.__dataclass_fields__}
+        return cls(**{field: value for field, value in values.items() if isinstance(value, int)})
+
+
+def system_blocks(cached: list[str], uncached: list[str] | None = None) -> list[dict[str, Any]]:
+    """
+    Ordered system text blocks with a cache breakpoint after the stable prefix
+
+    Everything up to and including the last cached block is written to the
+    prompt cache on the first call and read back by later calls that send
+    the same prefix; uncached blocks follow and may differ per call.
+    """
+    blocks = [{"type": "text", "text": text} for text in cached if text]
+    if blocks:
+        blocks[-1]["cache_control"] = CACHE_CONTROL
+    blocks.extend({"type": "text", "text": text} for text in (uncached or []) if text)
+    return blocks
+
 
 class ClaudeClient:
-    """Minimal Claude API client for context-driven analysis"""
+    """
+    Minimal Claude API client for context-driven analysis
+
+    Concurrent callers share one request scheduler: at most
+    max_concurrent requests are in flight, and request starts are spaced
+    to stay under requests_per_minute. Requests sent with batch=True and
+    issued together go out as one Message Batch instead (see MessageBatcher);
+    callers opt in only where the added latency is acceptable.
+    """
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        max_concurrent: int | None = None,
+        requests_per_minute: int | None = None,
+        response_cache: ResponseCache | None = None,
+    ):
         """
         Initialize Claude client
 
         Args:
             api_key: Anthropic API key (defaults to settings.anthropic_api_key)
+            max_concurrent: Max in-flight requests (defaults to settings)
+            requests_per_minute: Request start rate limit (defaults to settings)
+            response_cache: Response cache (defaults to the CLAUDE_RESPONSE_CACHE mode)
         """
+        self.response_cache = response_cache if response_cache is not None else get_response_cache()
+        self.cached_responses = 0
+
+        # Replay serves only cached responses, so it runs without an API key
         self.api_key = api_key or settings.anthropic_api_key
-        if not self.api_key:
+        replay = self.response_cache is not None and self.response_cache.replay
+        if not self.api_key and not replay:
             raise ValueError("ANTHROPIC_API_KEY not configured")
 
-        self.client = AsyncAnthropic(api_key=self.api_key, timeout=300.0)  # 5 min timeout
+        self.client = (
+            AsyncAnthropic(api_key=self.api_key, timeout=300.0)  # 5 min timeout
+            if self.api_key
+            else None
+        )
         self.model = "claude-sonnet-4-20250514"  # Latest Sonnet model
         self.max_tokens = 16384  # Increased for complete synthesis JSON output
+        self.usage: list[CallUsage] = []  # One entry per call, in completion order
+
+        self.max_concurrent = max_concurrent or settings.claude_max_concurrent_requests
+        self.requests_per_minute = requests_per_minute or settings.claude_requests_per_minute
+        self.request_slots = asyncio.Semaphore(self.max_concurrent)
+        self.next_request_time = 0.0
+
+        self.batcher = (
+            MessageBatcher(
+                self.client.messages.batches,
+                fallback=self._create_message,
+                poll_seconds=settings.claude_batch_poll_seconds,
+                timeout_seconds=settings.claude_batch_timeout_minutes * 60,
+            )
+            if self.client
+            else None
+        )
 
     async def analyze(
         self,
-        system_prompt: str,
+        system_prompt: SystemPrompt,
         user_message: str,
         temperature: float = 1.0,
         max_tokens: int | None = None,
+        batch: bool = False,
     ) -> str:
         """
         Send analysis request to Claude
 
         Args:
-            system_prompt: System context and instructions
+            system_prompt: System context and instructions, as text or system_blocks()
             user_message: User query/request
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum tokens in response
+            batch: Send as part of a Message Batch (lower cost, higher latency)
 
         Returns:
             Claude's response text
         """
         try:
-            response = await self.client.messages.create(
+            return await self._complete(
+                batch,
                 model=self.model,
                 max_tokens=max_tokens or self.max_tokens,
                 temperature=temperature,
@@ -59,34 +148,35 @@ class ClaudeClient:
                 messages=[{"role": "user", "content": user_message}],
             )
 
-            return response.content[0].text
-
         except Exception as e:
             logger.error(f"Claude API error: {e}")
             raise
 
     async def analyze_conversation(
         self,
-        system_prompt: str,
+        system_prompt: SystemPrompt,
         messages: list[dict[str, str]],
         temperature: float = 1.0,
         max_tokens: int | None = None,
+        batch: bool = False,
     ) -> str:
         """
         Send conversation request to Claude with message history
 
         Args:
-            system_prompt: System context and instructions
+            system_prompt: System context and instructions, as text or system_blocks()
             messages: List of message dicts with 'role' and 'content' keys
                       Roles must alternate: user, assistant, user, assistant...
             temperature: Sampling temperature (0-1)
             max_tokens: Maximum tokens in response
+            batch: Send as part of a Message Batch (lower cost, higher latency)
 
         Returns:
             Claude's response text
         """
         try:
-            response = await self.client.messages.create(
+            return await self._complete(
+                batch,
                 model=self.model,
                 max_tokens=max_tokens or self.max_tokens,
                 temperature=temperature,
@@ -94,14 +184,17 @@ class ClaudeClient:
                 messages=messages,
             )
 
-            return response.content[0].text
-
         except Exception as e:
             logger.error(f"Claude API error: {e}")
             raise
 
     async def analyze_with_context(
-        self, context: dict[str, Any], task: str, temperature: float = 1.0
+        self,
+        context: dict[str, Any],
+        task: str,
+        temperature: float = 1.0,
+        cached_prefix: list[str] | None = None,
+        batch: bool = False,
     ) -> str:
         """
         Analyze using curated context
@@ -110,16 +203,90 @@ class ClaudeClient:
             context: Curated context dictionary from ContextCurator
             task: Task description/question
             temperature: Sampling temperature
+            cached_prefix: Stable text sent ahead of the context and cached with
+                the user profile and instructions (e.g. analysis rules)
+            batch: Send as part of a Message Batch (lower cost, higher latency)
 
         Returns:
             Claude's response text
         """
-        system_prompt = self._build_system_prompt(context)
-        return await self.analyze(system_prompt, task, temperature)
+        system_prompt = self._build_system_blocks(context, cached_prefix)
+        return await self.analyze(system_prompt, task, temperature, batch=batch)
+
+    async def _complete(self, batch: bool, **request) -> str:
+        """Response text for a Messages request, from the response cache when enabled"""
+        cache = self.response_cache
+        key = cache.key(request) if cache else None
+        if cache:
+            cached = cache.get(key)
+            if cached is not None:
+                self.cached_responses += 1
+                logger.info(f"Claude response cache hit ({key[:12]})")
+                return cached
+            if cache.replay:
+                raise ResponseCacheMiss(
+                    f"No cached response for request {key[:12]} in replay mode",
+                    context={"key": key, "model": request.get("model")},
+                )
+
+        if batch and self.batcher:
+            response = await self.batcher.submit(request)
+        else:
+            response = await self._create_message(**request)
+        self._record_usage(response)
+        text = response.content[0].text
+        if cache:
+            cache.put(key, text, request["model"])
+        return text
+
+    async def _create_message(self, **kwargs) -> Any:
+        """Send one Messages API request through the concurrency and rate limits"""
+        async with self.request_slots:
+            # Reserve the next start time before sleeping so concurrent callers queue up
+            now = time.monotonic()
+            start = max(now, self.next_request_time)
+            self.next_request_time = start + 60.0 / self.requests_per_minute
+            if start > now:
+                await asyncio.sleep(start - now)
+            return await self.client.messages.create(**kwargs)
+
+    def usage_totals(self) -> dict[str, int]:
+        """Token usage summed over every call made by this client"""
+        totals = asdict(CallUsage())
+        for usage in self.usage:
+            for field, value in asdict(usage).items():
+                totals[field] += value
+        totals["calls"] = len(self.usage)
+        totals["cached_responses"] = self.cached_responses
+        return totals
+
+    def _record_usage(self, response: Any):
+        usage = CallUsage.from_response(response)
+        self.usage.append(usage)
+        logger.info(
+            f"Claude call: {usage.input_tokens} input, {usage.output_tokens} output, "
+            f"{usage.cache_creation_input_tokens} cache write, "
+            f"{usage.cache_read_input_tokens} cache read tokens"
+        )
+
+    def _build_system_blocks(
+        self, context: dict[str, Any], cached_prefix: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Build system blocks from curated context: a cached stable prefix, then the context
+
+        The prefix (caller text, user profile, instructions) is identical across
+        calls that share a profile, so it is marked for prompt caching; articles
+        and memory differ per call and follow the breakpoint.
+        """
+        stable = [*(cached_prefix or []), self._build_profile_section(context)]
+        if "instructions" in context:
+            stable.append(f"## Instructions\n{context['instructions']}\n")
+        return system_blocks(stable, [self._build_context_section(context)])
 
     def _build_system_prompt(self, context: dict[str, Any]) -> str:
         """
-        Build system prompt from curated context with few-shot examples
+        Build system prompt text from curated context
 
         Args:
             context: Curated context dictionary
@@ -127,18 +294,25 @@ class ClaudeClient:
         Returns:
             Formatted system prompt
         """
-        parts = []
+        return "\n".join(block["text"] for block in self._build_system_blocks(context))
 
-        # Add user profile context
-        if "user_profile" in context:
-            profile = context["user_profile"]
-            parts.append("## User Context")
-            parts.append(f"Location: {profile.get('location', 'Unknown')}")
-            parts.append(
-                f"Professional Domains: {', '.join(profile.get('professional_domains', []))}"
-            )
-            parts.append(f"Civic Interests: {', '.join(profile.get('civic_interests', []))}")
-            parts.append("")
+    def _build_profile_section(self, context: dict[str, Any]) -> str:
+        """User context section of the system prompt"""
+        if "user_profile" not in context:
+            return ""
+        profile = context["user_profile"]
+        parts = [
+            "## User Context",
+            f"Location: {profile.get('location', 'Unknown')}",
+            f"Professional Domains: {', '.join(profile.get('professional_domains', []))}",
+            f"Civic Interests: {', '.join(profile.get('civic_interests', []))}",
+            "",
+        ]
+        return "\n".join(parts)
+
+    def _build_context_section(self, context: dict[str, Any]) -> str:
+        """Articles and historical memory section of the system prompt"""
+        parts = []
 
         # Add recent articles context
         if "articles" in context:
@@ -161,10 +335,4 @@ class ClaudeClient:
             parts.append(context["memory"])
             parts.append("")
 
-        # Add instructions
-        if "instructions" in context:
-            parts.append("## Instructions")
-            parts.append(context["instructions"])
-            parts.append("")
-
         return "\n".join(parts)
@@ -0,0 +1,220 @@
+"""
+Context Selector
+Chooses the most valuable articles per token under a budget, truncating where that pays
+"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from .token_counter import TokenCounter, truncate_to_tokens
+
+logger = logging.getLogger(__name__)
+
+# How an article's value is built from its signals (each in 0-1)
+VALUE_WEIGHTS = {"relevance": 0.4, "recency": 0.3, "topic": 0.3}
+
+# Recency halves every this many hours since publication
+RECENCY_HALF_LIFE_HOURS = 24
+
+# Each further article from an already-selected source is worth this much less
+SOURCE_DIVERSITY_DECAY = 0.75
+
+# Content kept when an article is truncated instead of dropped
+TRUNCATED_CONTENT_TOKENS = 120
+TRUNCATION_MARKER = " [...]"
+
+# Headline, source and lead carry this share of an article's value
+LEAD_VALUE_SHARE = 0.5
+
+
+@dataclass
+class SelectionSignals:
+    """Per-article inputs to selection value; neutral when unknown"""
+
+    relevance: float = 0.5
+    recency: float = 0.5
+    topic: float = 0.0
+
+    @property
+    def value(self) -> float:
+        return (
+            VALUE_WEIGHTS["relevance"] * self.relevance
+            + VALUE_WEIGHTS["recency"] * self.recency
+            + VALUE_WEIGHTS["topic"] * self.topic
+        )
+
+
+@dataclass
+class _Candidate:
+    entry: dict[str, Any]
+    signals: SelectionSignals
+    source: str
+    # (entry, tokens, value share) for the truncated then full variant; the
+    # truncated variant is absent when the content is already short
+    variants: list[tuple[dict[str, Any], int, float]] = field(default_factory=list)
+    chosen: int | None = None  # Index into variants
+    base_value: float = 0.0  # Value after source decay, fixed when the article is added
+
+
+def recency_signal(published: datetime | None, now: datetime | None = None) -> float:
+    """1.0 for just-published articles, halving every RECENCY_HALF_LIFE_HOURS"""
+    if published is None:
+        return 0.5
+    age_hours = max(((now or datetime.utcnow()) - published).total_seconds() / 3600, 0.0)
+    return 0.5 ** (age_hours / RECENCY_HALF_LIFE_HOURS)
+
+
+class ContextSelector:
+    """
+    Relevance-per-token article selection (a multiple-choice knapsack)
+
+    Every article can be left out, included truncated to its lead, or
+    included in full. Selection is greedy on marginal value per token: each
+    step takes the best-ratio move among adding an article (in either form)
+    and upgrading an included truncated article to its full text. Value
+    decays for repeat sources, so moves are re-scored after every pick.
+    Selected articles keep their original order.
+    """
+
+    def __init__(self, token_counter: TokenCounter):
+        self.token_counter = token_counter
+
+    def select(
+        self,
+        entries: list[dict[str, Any]],
+        signals: dict[Any, SelectionSignals],
+        budget: int,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """
+        Pick the best article set that fits a token budget
+
+        Args:
+            entries: Formatted articles
+            signals: SelectionSignals keyed by article id (missing ids get neutral signals)
+            budget: Token budget for the serialized article list
+
+        Returns:
+            (selected entries, selection log) - the log has one record per
+            input article saying whether and how it was included, and why
+        """
+        candidates = [self._candidate(entry, signals.get(entry.get("id"))) for entry in entries]
+        source_counts: Counter = Counter()
+        remaining = budget - 1  # List brackets
+
+        while True:
+            best = None
+            for candidate in candidates:
+                move = self._best_move(candidate, source_counts, remaining)
+                if move and (best is None or move[0] > best[0]):
+                    best = (*move, candidate)
+            if best is None:
+                break
+
+            _ratio, variant_index, extra_tokens, candidate = best
+            if candidate.chosen is None:
+                candidate.base_value = self._base_value(candidate, source_counts)
+                source_counts[candidate.source] += 1
+            candidate.chosen = variant_index
+            remaining -= extra_tokens
+
+        selected = [c.variants[c.chosen][0] for c in candidates if c.chosen is not None]
+        log = [self._log_record(c) for c in candidates]
+
+        truncated = sum(1 for record in log if record["decision"] == "truncated")
+        logger.info(
+            f"Selected {len(selected)}/{len(entries)} articles ({truncated} truncated) "
+            f"in {budget - remaining - 1}/{budget} tokens"
+        )
+        for record in log:
+            logger.debug(
+                f"  {record['decision']:>9} #{record['id']} value={record['value']:.2f} "
+                f"tokens={record['tokens']} ({record['reason']}) {record['title']}"
+            )
+        return selected, log
+
+    def _candidate(self, entry: dict[str, Any], signals: SelectionSignals | None) -> _Candidate:
+        candidate = _Candidate(
+            entry=entry,
+            signals=signals or SelectionSignals(recency=self._entry_recency(entry)),
+            source=entry.get("source") or "Unknown",
+        )
+        # Each list item also costs a separator
+        full_tokens = self.token_counter.count_article(entry) + 1
+
+        content = entry.get("content") or ""
+        content_tokens = self.token_counter.count_text(content)
+        if content_tokens > TRUNCATED_CONTENT_TOKENS:
+            short = {
+                **entry,
+                "content": truncate_to_tokens(content, TRUNCATED_CONTENT_TOKENS)
+                + TRUNCATION_MARKER,
+            }
+            short_share = LEAD_VALUE_SHARE + (1 - LEAD_VALUE_SHARE) * (
+                TRUNCATED_CONTENT_TOKENS / content_tokens
+            )
+            candidate.variants.append(
+                (short, self.token_counter.count_article(short) + 1, short_share)
+            )
+        candidate.variants.append((entry, full_tokens, 1.0))
+        return candidate
+
+    @staticmethod
+    def _base_value(candidate: _Candidate, source_counts: Counter) -> float:
+        return candidate.signals.value * SOURCE_DIVERSITY_DECAY ** source_counts[candidate.source]
+
+    @staticmethod
+    def _entry_recency(entry: dict[str, Any]) -> float:
+        published = entry.get("published_date")
+        try:
+            return recency_signal(datetime.fromisoformat(published) if published else None)
+        except (TypeError, ValueError):
+            return 0.5
+
+    def _best_move(
+        self, candidate: _Candidate, source_counts: Counter, remaining: int
+    ) -> tuple[float, int, int] | None:
+        """Best (value per token, variant index, extra tokens) move for a candidate"""
+        if candidate.chosen is None:
+            # A new article shares value with those already taken from its source
+            base = self._base_value(candidate, source_counts)
+            current_tokens, current_share = 0, 0.0
+        else:
+            base = candidate.base_value
+            _entry, current_tokens, current_share = candidate.variants[candidate.chosen]
+
+        best = None
+        start = 0 if candidate.chosen is None else candidate.chosen + 1
+        for index in range(start, len(candidate.variants)):
+            _entry, tokens, share = candidate.variants[index]
+            extra_tokens = tokens - current_tokens
+            extra_value = base * (share - current_share)
+            if extra_tokens > remaining or extra_value <= 0:
+                continue
+            ratio = extra_value / max(extra_tokens, 1)
+            if best is None or ratio > best[0]:
+                best = (ratio, index, extra_tokens)
+        return best
+
+    def _log_record(self, candidate: _Candidate) -> dict[str, Any]:
+        signals = candidate.signals
+        if candidate.chosen is None:
+            decision = "dropped"
+            tokens = candidate.variants[-1][1]
+        else:
+            is_full = candidate.chosen == len(candidate.variants) - 1
+            decision = "full" if is_full else "truncated"
+            tokens = candidate.variants[candidate.chosen][1]
+        return {
+            "id": candidate.entry.get("id"),
+            "title": (candidate.entry.get("title") or "")[:60],
+            "decision": decision,
+            "value": round(signals.value, 3),
+            "tokens": tokens,
+            "reason": (
+                f"relevance {signals.relevance:.2f}, recency {signals.recency:.2f}, "
+                f"topic {signals.topic:.2f}, source {candidate.source}"
+            ),
+        }
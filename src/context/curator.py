@@ -4,18 +4,35 @@ Builds optimal context for Claude API calls from database and user profile
 Implements token budget management following Anthropic's context engineering guidance
 """
 
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
 
 from ..database.connection import get_db
 from ..database.models import Article, NarrativeSynthesis
+from ..database.search_index import ArticleSearchIndex, match_all
+from ..processors.story_tracker import get_story_stats
 from ..utils.profile_loader import UserProfile, get_user_profile
 from ..utils.profiler import profile
-from .topic_matcher import TopicMatcher
+from .article_records import ArticleRecord, load_article_records
+from .candidate_pool import (
+    POOL_MAX_ARTICLES,
+    CandidatePool,
+    CandidatePoolCache,
+    PoolArticle,
+    get_candidate_pool_cache,
+)
+from .context_selector import ContextSelector, SelectionSignals, recency_signal
+from .diversity import DiversityParams, DiversitySelector
+from .memory_digest import format_memory_digest
+from .relevance import RelevanceScorer, base_relevance
+from .token_counter import get_token_counter
+from .topic_matcher import TOPIC_KEYWORDS, TOPIC_THRESHOLD, TopicMatcher
+from .topic_scores import TopicScoreIndex
+from .vector_index import VectorIndex
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +53,15 @@ class ContextCurator:
     # Allocated: 73,000 tokens (system + articles + historical + response)
     # Safety margin: 127,000 tokens
 
+    # Past syntheses whose memory digests are included (each capped at DIGEST_MAX_TOKENS)
+    MEMORY_SYNTHESES = 5
+
     def __init__(
         self,
         user_profile: UserProfile | None = None,
         topic_filters: dict | None = None,
+        diversity: DiversityParams | None = None,
+        pool_cache: CandidatePoolCache | None = None,
     ):
         """
         Initialize context curator
@@ -47,7 +69,10 @@ class ContextCurator:
         Args:
             user_profile: User profile for personalization
             perspective_id: Perspective to use for analysis framing (defaults to user preference or daily_intelligence_brief)
-            topic_filters: Optional topic/scope filters dict (e.g., {'topics': ['cybersecurity'], 'scopes': ['local']})
+            topic_filters: Optional topic/scope filters dict (e.g., {'topics': ['cybersecurity'], 'scopes': ['local']});
+                a 'search' key restricts articles to full-text matches for its words
+            diversity: MMR selection parameters (defaults to the MMR_* settings)
+            pool_cache: Candidate pool cache (defaults to the shared on-disk cache when enabled)
         """
         try:
             self.user_profile = user_profile or get_user_profile()
@@ -58,6 +83,9 @@ class ContextCurator:
         # Topic filtering
         self.topic_filters = topic_filters or {}
         self.topic_matcher = TopicMatcher() if self.topic_filters else None
+        self.token_counter = get_token_counter()
+        self.diversity = diversity or DiversityParams.from_settings()
+        self.pool_cache = pool_cache if pool_cache is not None else get_candidate_pool_cache()
 
     async def curate_for_narrative_synthesis(
         self, hours: int = 48, max_articles: int = 50
@@ -74,16 +102,39 @@ class ContextCurator:
         """
         with profile("CONTEXT_CURATION_TOTAL"):
             with get_db() as session:
-                # Get recent unfiltered articles
+                # Get recent unfiltered articles: a candidate pool for diversity selection
+                pool_size = max_articles * self.diversity.pool_factor
                 with profile("DB_QUERY_ARTICLES"):
-                    articles = self._get_recent_articles(session, hours, max_articles)
+                    pooled = self._get_pooled_candidates(session, hours, pool_size)
+                    if pooled is not None:
+                        candidates = [candidate.record for candidate in pooled]
+                    else:
+                        candidates = self._get_recent_articles(session, hours, pool_size)
+                signals = self._selection_signals(
+                    candidates,
+                    {c.record.id: c.topics for c in pooled} if pooled is not None else None,
+                )
+
+                # Balance relevance against redundancy (same story, near-duplicate text, feed)
+                with profile("DIVERSITY_SELECTION"):
+                    articles, diversity = DiversitySelector(self.diversity).select(
+                        candidates,
+                        {article_id: s.value for article_id, s in signals.items()},
+                        max_articles,
+                    )
 
                 # Get historical context from prior syntheses
                 with profile("DB_QUERY_SYNTHESES"):
                     memory = self._get_historical_memory(session)
 
-                # Format articles while session is still active (prevents DetachedInstanceError)
-                formatted_articles = self._format_articles(articles)
+                if pooled is not None:
+                    # Pooled entries are formatted with story coverage already
+                    entries = {c.record.id: c.entry for c in pooled}
+                    formatted_articles = [dict(entries[a.id]) for a in articles]
+                else:
+                    # Cross-day coverage for each article's story
+                    story_stats = get_story_stats(session, [a.story_id for a in articles])
+                    formatted_articles = self._format_articles(articles, story_stats)
 
             # Build initial context
             context = {
@@ -91,10 +142,11 @@ class ContextCurator:
                 "articles": formatted_articles,
                 "memory": memory,
                 "instructions": self._get_synthesis_instructions(),
+                "_diversity": diversity,
             }
 
             # Enforce token budget
-            context = self._enforce_token_budget(context)
+            context = self._enforce_token_budget(context, signals)
 
             return context
 
@@ -119,9 +171,125 @@ class ContextCurator:
 
         return context
 
+    @staticmethod
+    def _window_query(session: Session, cutoff_time: datetime) -> Query:
+        """
+        Recent unfiltered articles, one representative per story
+
+        The representative is the story's most relevant article in the window,
+        preferring the story root (the original the copies were folded into)
+        and then the newest article on ties.
+        """
+        ranked = (
+            session.query(
+                Article.id,
+                func.row_number()
+                .over(
+                    partition_by=func.coalesce(Article.story_id, Article.id),
+                    order_by=(
+                        Article.relevance_score.desc().nulls_last(),
+                        (Article.id == Article.story_id).desc(),
+                        Article.id.desc(),
+                    ),
+                )
+                .label("story_rank"),
+            )
+            .filter(Article.fetched_at >= cutoff_time, Article.filtered.is_(False))
+            .subquery()
+        )
+        story_representatives = session.query(ranked.c.id).filter(ranked.c.story_rank == 1)
+        return session.query(Article).filter(
+            Article.fetched_at >= cutoff_time,
+            Article.filtered.is_(False),
+            Article.id.in_(story_representatives),
+        )
+
+    def _backfill_scores(self, session: Session, cutoff_time: datetime) -> TopicScoreIndex:
+        """Topic-score, embed and relevance-score window articles the ingest path missed"""
+        score_index = TopicScoreIndex(self.user_profile.get_primary_location())
+        with profile("TOPIC_SCORE_BACKFILL"):
+            score_index.score_unscored(session, cutoff_time)
+        with profile("VECTOR_BACKFILL"):
+            VectorIndex(session).index_missing(cutoff_time)
+        with profile("RELEVANCE_REFRESH"):
+            RelevanceScorer(self.user_profile).refresh(session, cutoff_time)
+        return score_index
+
+    def _get_pooled_candidates(
+        self, session: Session, hours: int, max_articles: int
+    ) -> list[PoolArticle] | None:
+        """
+        Candidates from the cached pool for this window, or None to query directly
+
+        The pool is built on a miss (and whenever articles arrived or the
+        profile changed) and reused by later runs and filter variants.
+        """
+        if self.pool_cache is None or not self.user_profile or self.topic_filters.get("search"):
+            return None
+
+        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        profile_version = RelevanceScorer(self.user_profile).version
+        pool = self.pool_cache.load(
+            self.pool_cache.key(hours, self.pool_cache.watermark(session), profile_version)
+        )
+        if pool is None:
+            with profile("CANDIDATE_POOL_BUILD"):
+                score_index = self._backfill_scores(session, cutoff_time)
+                # Keyed after the backfill's scoring so a rerun over unchanged data hits it
+                key = self.pool_cache.key(
+                    hours, self.pool_cache.watermark(session), profile_version
+                )
+                pool = self._build_candidate_pool(session, key, cutoff_time, score_index)
+            self.pool_cache.save(pool)
+
+        candidates = pool.select(self.topic_filters, cutoff_time, max_articles)
+        if candidates is not None:
+            for candidate in candidates:
+                self.token_counter.seed_article(candidate.entry, candidate.tokens)
+        return candidates
+
+    def _build_candidate_pool(
+        self, session: Session, key: str, cutoff_time: datetime, score_index: TopicScoreIndex
+    ) -> CandidatePool:
+        """Load and format every (already scored) candidate of a window, best relevance first"""
+        records = load_article_records(
+            self._window_query(session, cutoff_time).order_by(
+                Article.relevance_score.desc(), Article.fetched_at.desc()
+            ),
+            POOL_MAX_ARTICLES + 1,
+        )
+        complete = len(records) <= POOL_MAX_ARTICLES
+        records = records[:POOL_MAX_ARTICLES]
+
+        ids = [record.id for record in records]
+        topic_scores = score_index.topic_scores(session, ids)
+        scopes = score_index.article_scopes(session, ids)
+        entries = self._format_articles(
+            records, get_story_stats(session, [r.story_id for r in records])
+        )
+
+        pool = CandidatePool(
+            key=key,
+            built_at=datetime.utcnow(),
+            cutoff=cutoff_time,
+            complete=complete,
+            articles=[
+                PoolArticle(
+                    record=record,
+                    entry=entry,
+                    tokens=self.token_counter.count_article(entry),
+                    topics=topic_scores.get(record.id, {}),
+                    scopes=sorted(scopes.get(record.id, ())),
+                )
+                for record, entry in zip(records, entries, strict=True)
+            ],
+        )
+        logger.info(f"Built candidate pool of {len(records)} articles (complete={complete})")
+        return pool
+
     def _get_recent_articles(
         self, session: Session, hours: int, max_articles: int
-    ) -> list[Article]:
+    ) -> list[ArticleRecord]:
         """
         Get recent unfiltered articles from database with optional topic filtering
 
@@ -131,43 +299,57 @@ class ContextCurator:
             max_articles: Maximum articles to return
 
         Returns:
-            List of articles (filtered by topic/scope if filters provided)
+            Article records (filtered by topic/scope if filters provided), loaded
+            with their feed and body in one column-only query
         """
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+        query = self._window_query(session, cutoff_time)
 
-        # Base query: recent, unfiltered articles
-        query = session.query(Article).filter(
-            Article.fetched_at >= cutoff_time, Article.filtered.is_(False)
-        )
+        # Articles the ingest path missed get topic and relevance scores now
+        if self.user_profile:
+            score_index = self._backfill_scores(session, cutoff_time)
 
-        # If no topic filters, use existing logic
+        # If no topic filters, rank by precomputed (recency-decayed) relevance
         if not self.topic_filters:
-            articles = query.order_by(Article.fetched_at.desc()).limit(max_articles).all()
+            articles = load_article_records(
+                query.order_by(Article.relevance_score.desc(), Article.fetched_at.desc()),
+                max_articles,
+            )
 
             logger.info(f"Curated {len(articles)} articles from last {hours} hours (no filters)")
             return articles
 
-        # Fetch 2x candidates for filtering buffer
-        candidate_articles = query.order_by(Article.fetched_at.desc()).limit(max_articles * 2).all()
-
-        logger.info(
-            f"Fetched {len(candidate_articles)} candidate articles for filtering "
-            f"with filters: {self.topic_filters}"
-        )
+        search_index = ArticleSearchIndex(session)
+        if search_index.available():
+            with profile("SEARCH_INDEX_BACKFILL"):
+                search_index.index_missing(cutoff_time)
+            if self.topic_filters.get("search"):
+                query = search_index.restrict(query, match_all(self.topic_filters["search"]))
+        elif self.topic_filters.get("search"):
+            logger.warning("Full-text index unavailable, ignoring search filter")
 
-        # Apply topic filters using TopicMatcher
-        if self.topic_matcher and self.user_profile:
-            filtered_articles = self.topic_matcher.filter_articles(
-                articles=candidate_articles,
-                topic_filters=self.topic_filters,
-                user_profile=self.user_profile,
+        # Filter in SQL against ingest-time scores rather than over a candidate window
+        if self.user_profile:
+            query = score_index.apply_filters(query, self.topic_filters)
+            final_articles = load_article_records(query, max_articles)
+        elif self.topic_filters.get("topics") and search_index.available():
+            # No location to score under: the full-text index generates keyword
+            # candidates and the matcher applies the topic threshold to them
+            logger.warning("User profile missing, skipping scope filters")
+            topics = self.topic_filters["topics"]
+            candidates = load_article_records(
+                search_index.restrict(query, self.topic_matcher.search_expression(topics)).order_by(
+                    Article.fetched_at.desc()
+                )
             )
+            final_articles = self.topic_matcher.filter_articles(
+                candidates, {"topics": topics}, self.user_profile
+            )[:max_articles]
         else:
-            logger.warning("TopicMatcher not initialized or user_profile missing, skipping filters")
-            filtered_articles = candidate_articles
-
-        # Limit to max_articles after filtering
-        final_articles = filtered_articles[:max_articles]
+            logger.warning("User profile missing, skipping topic filters")
+            final_articles = load_article_records(
+                query.order_by(Article.fetched_at.desc()), max_articles
+            )
 
         # Warn if too few matches
         if len(final_articles) == 0:
@@ -182,7 +364,7 @@ class ContextCurator:
             )
 
         logger.info(
-            f"Curated {len(final_articles)} articles from {len(candidate_articles)} candidates "
+            f"Curated {len(final_articles)} articles "
             f"(last {hours} hours, filters: {self.topic_filters})"
         )
 
@@ -190,18 +372,22 @@ class ContextCurator:
 
     def _get_historical_memory(self, session: Session) -> str:
         """
-        Get enhanced historical context from past syntheses
+        Get historical context from the digests of past syntheses
 
-        Includes:
-        - Last 5 synthesis summaries (increased from 3)
-        - Tracked trends and predictions
-        - Identified patterns
+        Reads only the compact memory digest (situation titles, key actors,
+        open questions) stored with each of the last MEMORY_SYNTHESES
+        syntheses, never their full synthesis JSON. Syntheses stored before
+        digests existed fall back to their executive summary.
         """
-        # Get last 5 narrative syntheses (increased from 3)
         syntheses = (
             session.query(NarrativeSynthesis)
+            .with_entities(
+                NarrativeSynthesis.generated_at,
+                NarrativeSynthesis.memory_digest,
+                NarrativeSynthesis.executive_summary,
+            )
             .order_by(NarrativeSynthesis.generated_at.desc())
-            .limit(5)
+            .limit(self.MEMORY_SYNTHESES)
             .all()
         )
 
@@ -210,43 +396,15 @@ class ContextCurator:
 
         memory_parts = ["<historical_context>"]
         memory_parts.append("## Recent Intelligence Summaries")
-        memory_parts.append("Previous analyses for trend tracking and prediction verification:\n")
+        memory_parts.append("Previous analyses for trend tracking and prediction verification:")
 
-        for i, synth in enumerate(syntheses, 1):
-            date_str = synth.generated_at.strftime("%Y-%m-%d")
-
-            # Use bottom_line summary if available (new format), fallback to executive_summary (old format)
-            if synth.synthesis_data:
-                try:
-                    import json
-
-                    data = (
-                        json.loads(synth.synthesis_data)
-                        if isinstance(synth.synthesis_data, str)
-                        else synth.synthesis_data
-                    )
-                    bottom_line = data.get("bottom_line", {})
-                    summary = bottom_line.get("summary", "")
-
-                    if summary:
-                        memory_parts.append(f"\n**{date_str} ({i} days ago):**")
-                        memory_parts.append(summary)
-
-                        # Include immediate actions if present
-                        actions = bottom_line.get("immediate_actions", [])
-                        if actions:
-                            memory_parts.append(
-                                "  Key actions identified: " + "; ".join(actions[:2])
-                            )
-                    elif synth.executive_summary:
-                        # Fallback to old format
-                        memory_parts.append(f"\n**{date_str}:** {synth.executive_summary[:400]}...")
-                except Exception:
-                    # If parsing fails, use executive_summary
-                    if synth.executive_summary:
-                        memory_parts.append(f"\n**{date_str}:** {synth.executive_summary[:400]}...")
-            elif synth.executive_summary:
-                memory_parts.append(f"\n**{date_str}:** {synth.executive_summary[:400]}...")
+        now = datetime.utcnow()
+        for generated_at, digest, executive_summary in syntheses:
+            if digest and digest.get("situations"):
+                memory_parts.append("\n" + format_memory_digest(digest, generated_at, now))
+            elif executive_summary:
+                date_str = generated_at.strftime("%Y-%m-%d")
+                memory_parts.append(f"\n**{date_str}:** {executive_summary[:400]}")
 
         memory_parts.append("\n## Analysis Continuity")
         memory_parts.append("Use the above summaries to:")
@@ -258,19 +416,22 @@ class ContextCurator:
 
         return "\n".join(memory_parts)
 
-    def _enforce_token_budget(self, context: dict[str, Any]) -> dict[str, Any]:
+    def _enforce_token_budget(
+        self, context: dict[str, Any], signals: dict[int, SelectionSignals] | None = None
+    ) -> dict[str, Any]:
         """
         Enforce token budget by compressing context if needed
 
         Strategy:
         1. Count current tokens
-        2. If over budget, compress in this order:
-           - Reduce articles (50 → 30 → 20)
-           - Trim historical memory (keep top 2 summaries)
-           - Truncate article content (1000 → 500 tokens)
+        2. If articles exceed their allocation, pick the most valuable set
+           per token with ContextSelector (truncating articles where that
+           beats dropping them) and record the decisions in "_selection"
+        3. If still over budget, trim historical memory (keep top 2 summaries)
 
         Args:
             context: Raw context dictionary
+            signals: Selection signals keyed by article id (neutral when missing)
 
         Returns:
             Token-optimized context dictionary
@@ -288,28 +449,19 @@ class ContextCurator:
             + self.TOKEN_BUDGET["historical"]
         )
 
-        if budget_used <= budget_limit:
+        if budget_used <= budget_limit and tokens["articles"] <= self.TOKEN_BUDGET["articles"]:
             logger.info(f"Within token budget: {budget_used}/{budget_limit} tokens")
             context["_token_metadata"] = tokens
             return context
 
         logger.warning(f"Over token budget: {budget_used}/{budget_limit} tokens, compressing...")
 
-        # Compression step 1: Reduce article count
-        if len(context["articles"]) > 30:
-            logger.info(f"Reducing articles from {len(context['articles'])} to 30")
-            context["articles"] = context["articles"][:30]
-            tokens = self._estimate_tokens(context)
-            budget_used = tokens["system"] + tokens["articles"] + tokens["historical"]
-
-        if budget_used <= budget_limit:
-            context["_token_metadata"] = tokens
-            return context
-
-        # Compression step 2: Further reduce articles
-        if len(context["articles"]) > 20:
-            logger.info(f"Further reducing articles from {len(context['articles'])} to 20")
-            context["articles"] = context["articles"][:20]
+        # Compression step 1: Best value-per-token article set within the article allocation
+        if tokens["articles"] > self.TOKEN_BUDGET["articles"]:
+            with profile("CONTEXT_SELECTION"):
+                context["articles"], context["_selection"] = ContextSelector(
+                    self.token_counter
+                ).select(context["articles"], signals or {}, self.TOKEN_BUDGET["articles"])
             tokens = self._estimate_tokens(context)
             budget_used = tokens["system"] + tokens["articles"] + tokens["historical"]
 
@@ -317,24 +469,68 @@ class ContextCurator:
             context["_token_metadata"] = tokens
             return context
 
-        # Compression step 3: Trim historical memory
+        # Compression step 2: Trim historical memory
         if "Recent Intelligence Summaries" in context["memory"]:
             logger.info("Trimming historical memory to last 2 summaries")
-            memory_lines = context["memory"].split("\n")
-            # Keep header + first 2 summaries (approximately)
-            context["memory"] = "\n".join(memory_lines[:8])
+            context["memory"] = self._trim_memory(context["memory"], keep=2)
             tokens = self._estimate_tokens(context)
 
         context["_token_metadata"] = tokens
         logger.info(f"Compressed context: ~{tokens['total']} tokens")
         return context
 
+    @staticmethod
+    def _trim_memory(memory: str, keep: int) -> str:
+        """Keep the header, the newest `keep` synthesis blocks and the closing tag"""
+        blocks = memory.split("\n\n**")
+        if len(blocks) <= keep + 1:
+            return memory
+        return "\n\n**".join(blocks[: keep + 1]) + "\n</historical_context>"
+
+    def _selection_signals(
+        self,
+        articles: list[ArticleRecord],
+        stored_topic_scores: dict[int, dict[str, float]] | None = None,
+    ) -> dict[int, SelectionSignals]:
+        """
+        Relevance, recency and topic-match signals for budgeted article selection
+
+        Topic match is the best score among the filtered topics (or any known
+        topic when unfiltered), reaching 1.0 at twice the match threshold.
+        Stored (ingest-time) topic scores are used when given instead of
+        re-analyzing the text.
+        """
+        matcher = self.topic_matcher or TopicMatcher()
+        topics = self.topic_filters.get("topics") or list(TOPIC_KEYWORDS)
+        now = datetime.utcnow()
+
+        signals = {}
+        for article in articles:
+            if stored_topic_scores is not None:
+                topic_scores = stored_topic_scores.get(article.id, {})
+            else:
+                topic_scores = matcher.analyze(article).topic_scores
+            best_topic = max((topic_scores.get(topic, 0.0) for topic in topics), default=0.0)
+            published = article.published_date or article.fetched_at
+            relevance = (
+                base_relevance(article.relevance_score, published)
+                if article.relevance_score is not None
+                else 0.5
+            )
+            signals[article.id] = SelectionSignals(
+                relevance=relevance,
+                recency=recency_signal(published, now),
+                topic=min(best_topic / (2 * TOPIC_THRESHOLD), 1.0),
+            )
+        return signals
+
     def _estimate_tokens(self, context: dict[str, Any]) -> dict[str, int]:
         """
         Estimate token count for context components
 
-        Uses rough approximation: 1 token ≈ 4 characters
-        This is conservative for English text
+        Articles are counted one by one through the shared TokenCounter, so
+        re-estimating after a compression step sums cached per-article counts
+        instead of re-serializing the whole context.
 
         Args:
             context: Context dictionary
@@ -342,22 +538,18 @@ class ContextCurator:
         Returns:
             Token count breakdown
         """
-
-        def count_chars(obj):
-            return len(json.dumps(obj)) if obj else 0
-
-        system_chars = count_chars(context.get("user_profile", {})) + len(
+        counter = self.token_counter
+        system = counter.count_json(context.get("user_profile", {})) + counter.count_text(
             context.get("instructions", "")
         )
-
-        articles_chars = count_chars(context.get("articles", []))
-        memory_chars = len(context.get("memory", ""))
+        articles = counter.count_articles(context.get("articles", []))
+        historical = counter.count_text(context.get("memory", ""))
 
         return {
-            "system": system_chars // 4,
-            "articles": articles_chars // 4,
-            "historical": memory_chars // 4,
-            "total": (system_chars + articles_chars + memory_chars) // 4,
+            "system": system,
+            "articles": articles,
+            "historical": historical,
+            "total": system + articles + historical,
         }
 
     def _format_user_profile(self) -> dict[str, Any]:
@@ -380,8 +572,16 @@ class ContextCurator:
             "civic_interests": self.user_profile.get_civic_interests(),
         }
 
-    def _format_articles(self, articles: list[Article]) -> list[dict[str, Any]]:
-        """Format articles for context inclusion"""
+    def _format_articles(
+        self, articles: list[Article | ArticleRecord], story_stats: dict[int, dict] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Format articles for context inclusion
+
+        Args:
+            articles: Articles to format
+            story_stats: Optional story coverage keyed by story id (from get_story_stats)
+        """
         formatted = []
 
         for article in articles:
@@ -390,19 +590,23 @@ class ContextCurator:
                 article.embedding_summary or article.normalized_content or article.description or ""
             )
 
-            formatted.append(
-                {
-                    "id": article.id,  # Include ID for tracking
-                    "title": article.title,
-                    "source": article.feed.name if article.feed else "Unknown",
-                    "published_date": article.published_date.isoformat()
-                    if article.published_date
-                    else None,
-                    "content": content,
-                    "url": article.url,
-                    "entities": article.entities if article.entities else [],
-                }
-            )
+            entry = {
+                "id": article.id,  # Include ID for tracking
+                "title": article.title,
+                "source": article.feed.name if article.feed else "Unknown",
+                "published_date": article.published_date.isoformat()
+                if article.published_date
+                else None,
+                "content": content,
+                "url": article.url,
+                "entities": article.entities if article.entities else [],
+            }
+
+            if story_stats and article.story_id in story_stats:
+                entry["story_id"] = article.story_id
+                entry["story"] = story_stats[article.story_id]
+
+            formatted.append(entry)
 
         return formatted
 
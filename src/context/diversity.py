@@ -0,0 +1,159 @@
+"""
+Diversity Selection
+Maximal marginal relevance over curated articles using shingle, story and feed similarity
+"""
+
+import logging
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from src.config.settings import settings
+
+from .article_records import ArticleRecord
+
+logger = logging.getLogger(__name__)
+
+# Words per shingle, and the words of title and lead that are shingled
+SHINGLE_SIZE = 3
+SHINGLE_WORDS = 80
+
+# Similarity of two articles from the same feed with no shared text
+SAME_FEED_SIMILARITY = 0.3
+
+
+@dataclass(frozen=True)
+class DiversityParams:
+    """
+    MMR parameters
+
+    lambda_: Weight of relevance against novelty (1.0 ignores redundancy)
+    source_cap: Articles taken from one feed before other feeds are preferred
+    pool_factor: Candidates loaded per article kept
+    """
+
+    lambda_: float = 0.7
+    source_cap: int = 8
+    pool_factor: int = 3
+
+    @classmethod
+    def from_settings(cls) -> "DiversityParams":
+        return cls(
+            lambda_=settings.mmr_lambda,
+            source_cap=settings.mmr_source_cap,
+            pool_factor=settings.mmr_pool_factor,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {key.rstrip("_"): value for key, value in asdict(self).items()}
+
+
+def shingles(text: str) -> frozenset[int]:
+    """Hashed word shingles of the start of a text"""
+    words = text.lower().split()[:SHINGLE_WORDS]
+    if len(words) < SHINGLE_SIZE:
+        return frozenset([hash(tuple(words))]) if words else frozenset()
+    return frozenset(
+        hash(tuple(words[i : i + SHINGLE_SIZE])) for i in range(len(words) - SHINGLE_SIZE + 1)
+    )
+
+
+def _article_shingles(article: ArticleRecord) -> frozenset[int]:
+    body = article.embedding_summary or article.description or article.normalized_content or ""
+    return shingles(f"{article.title or ''} {body}")
+
+
+def _feed(article: ArticleRecord) -> str | None:
+    return article.feed.name if article.feed else None
+
+
+class DiversitySelector:
+    """
+    Greedy maximal marginal relevance
+
+    Each step takes the candidate maximizing
+        lambda * relevance - (1 - lambda) * max similarity to those already taken
+    where similarity is 1.0 within a story, shingle Jaccard overlap for
+    near-duplicate text, and SAME_FEED_SIMILARITY for a shared feed. Feeds
+    at their source cap are passed over, and only used if every other
+    candidate has been taken. Kept articles stay in candidate order.
+    """
+
+    def __init__(self, params: DiversityParams | None = None):
+        self.params = params or DiversityParams()
+
+    def similarity(self, a: ArticleRecord, b: ArticleRecord, shingles_a, shingles_b) -> float:
+        if a.story_id is not None and a.story_id == b.story_id:
+            return 1.0
+        overlap = 0.0
+        if shingles_a and shingles_b:
+            overlap = len(shingles_a & shingles_b) / len(shingles_a | shingles_b)
+        if _feed(a) is not None and _feed(a) == _feed(b):
+            overlap = max(overlap, SAME_FEED_SIMILARITY)
+        return overlap
+
+    def select(
+        self, articles: list[ArticleRecord], relevance: dict[int, float], k: int
+    ) -> tuple[list[ArticleRecord], dict[str, Any]]:
+        """
+        Pick k relevant, mutually novel articles
+
+        Args:
+            articles: Candidates
+            relevance: 0-1 relevance keyed by article id (missing ids count 0.5)
+            k: Articles to keep
+
+        Returns:
+            (kept articles, summary stats with the parameters used)
+        """
+        lambda_ = self.params.lambda_
+        article_shingles = [_article_shingles(article) for article in articles]
+        max_similarity = [0.0] * len(articles)
+        remaining = set(range(len(articles)))
+        source_counts: Counter = Counter()
+        chosen: list[int] = []
+        capped: list[int] = []
+
+        while remaining and len(chosen) < k:
+            best, best_score = None, None
+            for i in remaining:
+                score = (
+                    lambda_ * relevance.get(articles[i].id, 0.5)
+                    - (1 - lambda_) * (max_similarity[i])
+                )
+                if best_score is None or score > best_score:
+                    best, best_score = i, score
+            remaining.discard(best)
+
+            feed = _feed(articles[best])
+            if feed is not None and source_counts[feed] >= self.params.source_cap:
+                capped.append(best)
+                continue
+            source_counts[feed] += 1
+            chosen.append(best)
+
+            for i in remaining:
+                max_similarity[i] = max(
+                    max_similarity[i],
+                    self.similarity(
+                        articles[i], articles[best], article_shingles[i], article_shingles[best]
+                    ),
+                )
+
+        # The cap is soft: capped articles fill slots the other feeds could not
+        backfill = capped[: k - len(chosen)]
+        chosen.extend(backfill)
+
+        kept = [articles[i] for i in sorted(chosen)]
+        stats = {
+            **self.params.as_dict(),
+            "candidates": len(articles),
+            "selected": len(kept),
+            "source_capped": len(capped) - len(backfill),
+            "sources": len({_feed(articles[i]) for i in chosen}),
+        }
+        logger.info(
+            f"Diversity selection kept {len(kept)}/{len(articles)} articles "
+            f"from {stats['sources']} sources ({stats['source_capped']} over source cap)"
+        )
+        return kept, stats
@@ -0,0 +1,451 @@
+"""
+Gazetteer - Place names, aliases and containment for geographic scope
+Resolves place mentions to stable place ids and classifies them relative to the user
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+
+from src.processors.keyword_automaton import KeywordAutomaton, tokenize
+
+WORLD = "world"
+UNITED_STATES = "us"
+
+
+@dataclass(frozen=True)
+class Place:
+    """A named place and the place that contains it"""
+
+    id: str
+    name: str
+    kind: str  # world, region, country, state, district, county, city
+    parent: str | None
+    aliases: tuple[str, ...] = ()
+
+
+# US states: postal code -> (name, extra aliases, cities)
+# Ambiguous names (person names, common words, cities shared by several states
+# or countries) are deliberately left out so a mention never resolves wrongly.
+US_STATES = {
+    "al": ("Alabama", (), ("Montgomery", "Huntsville")),
+    "ak": ("Alaska", (), ("Anchorage", "Juneau", "Fairbanks")),
+    "az": ("Arizona", (), ("Tucson", "Scottsdale", "Tempe")),
+    "ar": ("Arkansas", (), ("Little Rock",)),
+    "ca": (
+        "California",
+        (),
+        ("San Francisco", "San Diego", "San Jose", "Sacramento", "Oakland", "Fresno"),
+    ),
+    "co": ("Colorado", (), ("Denver", "Boulder", "Colorado Springs")),
+    "ct": ("Connecticut", (), ("Hartford", "New Haven", "Stamford")),
+    "de": ("Delaware", (), ("Wilmington",)),
+    "fl": ("Florida", (), ("Orlando", "Tampa", "Jacksonville", "Tallahassee")),
+    "ga": ("Georgia", (), ("Atlanta", "Savannah")),
+    "hi": ("Hawaii", (), ("Honolulu",)),
+    "id": ("Idaho", (), ("Boise",)),
+    "il": ("Illinois", (), ()),
+    "in": ("Indiana", (), ("Indianapolis",)),
+    "ia": ("Iowa", (), ("Des Moines",)),
+    "ks": ("Kansas", (), ("Wichita", "Topeka")),
+    "ky": ("Kentucky", (), ("Louisville",)),
+    "la": ("Louisiana", (), ("New Orleans", "Baton Rouge")),
+    "me": ("Maine", (), ("Bangor",)),
+    "md": ("Maryland", (), ("Baltimore", "Annapolis")),
+    "ma": ("Massachusetts", (), ("Boston",)),
+    "mi": ("Michigan", (), ("Detroit", "Lansing", "Grand Rapids", "Ann Arbor")),
+    "mn": ("Minnesota", (), ("Minneapolis", "St. Paul", "Saint Paul")),
+    "ms": ("Mississippi", (), ("Biloxi",)),
+    "mo": ("Missouri", (), ("St. Louis", "Saint Louis", "Kansas City")),
+    "mt": ("Montana", (), ("Billings",)),
+    "ne": ("Nebraska", (), ("Omaha",)),
+    "nv": ("Nevada", (), ("Las Vegas", "Reno")),
+    "nh": ("New Hampshire", (), ("Nashua",)),
+    "nj": ("New Jersey", (), ("Newark", "Jersey City", "Trenton")),
+    "nm": ("New Mexico", (), ("Albuquerque", "Santa Fe")),
+    "ny": (
+        "New York",
+        ("new york state", "state of new york"),
+        ("New York City", "NYC", "Manhattan", "Brooklyn", "Albany"),
+    ),
+    "nc": ("North Carolina", (), ("Raleigh", "Asheville")),
+    "nd": ("North Dakota", (), ("Fargo", "Bismarck")),
+    "oh": ("Ohio", (), ("Columbus", "Cleveland", "Cincinnati")),
+    "ok": ("Oklahoma", (), ("Oklahoma City", "Tulsa")),
+    "or": ("Oregon", (), ("Portland",)),
+    "pa": ("Pennsylvania", (), ("Philadelphia", "Pittsburgh", "Harrisburg")),
+    "ri": ("Rhode Island", (), ()),
+    "sc": ("South Carolina", (), ("Greenville",)),
+    "sd": ("South Dakota", (), ("Sioux Falls",)),
+    "tn": ("Tennessee", (), ("Nashville", "Memphis", "Knoxville", "Chattanooga")),
+    "tx": ("Texas", (), ("Dallas", "San Antonio", "Austin", "Fort Worth", "El Paso")),
+    "ut": ("Utah", (), ("Salt Lake City",)),
+    "vt": ("Vermont", (), ("Montpelier",)),
+    "va": (
+        "Virginia",
+        ("commonwealth of virginia",),
+        ("Richmond", "Virginia Beach", "Roanoke", "Charlottesville"),
+    ),
+    # Bare "washington" means the federal capital in news copy; the state needs qualifying
+    "wa": ("Washington State", ("state of washington",), ("Spokane", "Tacoma")),
+    "wv": ("West Virginia", (), ("Morgantown",)),
+    "wi": ("Wisconsin", (), ("Milwaukee",)),
+    "wy": ("Wyoming", (), ("Cheyenne",)),
+}
+
+# Counties, metro regions and the cities inside them: (id, name, kind, parent, aliases)
+US_SUBDIVISIONS = (
+    (
+        "us-dc",
+        "Washington, D.C.",
+        "district",
+        UNITED_STATES,
+        ("washington", "district of columbia", "d.c."),
+    ),
+    ("us-va/northern-virginia", "Northern Virginia", "region", "us-va", ("nova",)),
+    ("us-va/fairfax-county", "Fairfax County", "county", "us-va/northern-virginia", ()),
+    ("us-va/fairfax", "Fairfax", "city", "us-va/fairfax-county", ()),
+    ("us-va/reston", "Reston", "city", "us-va/fairfax-county", ()),
+    ("us-va/tysons", "Tysons", "city", "us-va/fairfax-county", ("tysons corner",)),
+    ("us-va/mclean", "McLean", "city", "us-va/fairfax-county", ()),
+    ("us-va/herndon", "Herndon", "city", "us-va/fairfax-county", ()),
+    (
+        "us-va/arlington-county",
+        "Arlington County",
+        "county",
+        "us-va/northern-virginia",
+        ("arlington",),
+    ),
+    ("us-va/alexandria", "Alexandria", "city", "us-va/northern-virginia", ()),
+    ("us-va/falls-church", "Falls Church", "city", "us-va/northern-virginia", ()),
+    ("us-va/loudoun-county", "Loudoun County", "county", "us-va/northern-virginia", ("loudoun",)),
+    ("us-va/ashburn", "Ashburn", "city", "us-va/loudoun-county", ()),
+    ("us-va/leesburg", "Leesburg", "city", "us-va/loudoun-county", ()),
+    (
+        "us-va/prince-william-county",
+        "Prince William County",
+        "county",
+        "us-va/northern-virginia",
+        (),
+    ),
+    ("us-va/manassas", "Manassas", "city", "us-va/prince-william-county", ()),
+    ("us-md/montgomery-county", "Montgomery County", "county", "us-md", ()),
+    ("us-md/bethesda", "Bethesda", "city", "us-md/montgomery-county", ()),
+    ("us-md/silver-spring", "Silver Spring", "city", "us-md/montgomery-county", ()),
+    ("us-md/rockville", "Rockville", "city", "us-md/montgomery-county", ()),
+    ("us-md/prince-georges-county", "Prince George's County", "county", "us-md", ()),
+    ("us-ca/los-angeles-county", "Los Angeles County", "county", "us-ca", ()),
+    ("us-ca/los-angeles", "Los Angeles", "city", "us-ca/los-angeles-county", ()),
+    ("us-il/cook-county", "Cook County", "county", "us-il", ()),
+    ("us-il/chicago", "Chicago", "city", "us-il/cook-county", ()),
+    ("us-tx/harris-county", "Harris County", "county", "us-tx", ()),
+    ("us-tx/houston", "Houston", "city", "us-tx/harris-county", ()),
+    ("us-az/maricopa-county", "Maricopa County", "county", "us-az", ()),
+    ("us-az/phoenix", "Phoenix", "city", "us-az/maricopa-county", ()),
+    ("us-wa/king-county", "King County", "county", "us-wa", ()),
+    ("us-wa/seattle", "Seattle", "city", "us-wa/king-county", ()),
+    ("us-fl/miami-dade-county", "Miami-Dade County", "county", "us-fl", ()),
+    ("us-fl/miami", "Miami", "city", "us-fl/miami-dade-county", ()),
+)
+
+# Federal institutions and national terms resolve to the country itself
+US_ALIASES = (
+    "united states",
+    "u.s.",
+    "usa",
+    "america",
+    "federal",
+    "congress",
+    "senate",
+    "house of representatives",
+    "white house",
+    "supreme court",
+    "pentagon",
+    "fbi",
+    "cia",
+    "dhs",
+    "nationwide",
+)
+
+# International bodies and worldwide terms resolve to the world
+WORLD_ALIASES = (
+    "international",
+    "global",
+    "worldwide",
+    "united nations",
+    "nato",
+    "g7",
+    "g20",
+    "world bank",
+    "imf",
+    "world health organization",
+)
+
+WORLD_REGIONS = {
+    "europe": ("Europe", ("european", "european union", "eu")),
+    "asia": ("Asia", ("asian", "asia pacific")),
+    "africa": ("Africa", ("african",)),
+    "middle-east": ("Middle East", ("middle eastern",)),
+    "latin-america": ("Latin America", ("south america", "central america")),
+}
+
+# Countries: ISO code -> (name, aliases incl. capitals, major cities, demonyms)
+COUNTRIES = {
+    "ca": ("Canada", ("canadian", "ottawa", "toronto", "vancouver", "montreal")),
+    "mx": ("Mexico", ("mexican", "mexico city")),
+    "br": ("Brazil", ("brazilian", "brasilia", "rio de janeiro", "sao paulo")),
+    "ar": ("Argentina", ("argentine", "buenos aires")),
+    "co": ("Colombia", ("colombian", "bogota")),
+    "ve": ("Venezuela", ("venezuelan", "caracas")),
+    "cl": ("Chile", ("chilean", "santiago")),
+    "pe": ("Peru", ("peruvian",)),
+    "cu": ("Cuba", ("cuban", "havana")),
+    "ht": ("Haiti", ("haitian", "port au prince")),
+    "gb": (
+        "United Kingdom",
+        ("uk", "britain", "great britain", "british", "england", "scotland", "wales", "london"),
+    ),
+    "ie": ("Ireland", ("irish", "dublin")),
+    "fr": ("France", ("french", "paris")),
+    "de": ("Germany", ("german", "berlin", "munich", "frankfurt")),
+    "it": ("Italy", ("italian", "rome", "milan")),
+    "es": ("Spain", ("spanish", "madrid", "barcelona")),
+    "pt": ("Portugal", ("portuguese", "lisbon")),
+    "nl": ("Netherlands", ("dutch", "amsterdam", "the hague")),
+    "be": ("Belgium", ("belgian", "brussels")),
+    "ch": ("Switzerland", ("swiss", "geneva", "zurich")),
+    "at": ("Austria", ("austrian",)),
+    "se": ("Sweden", ("swedish", "stockholm")),
+    "no": ("Norway", ("norwegian", "oslo")),
+    "dk": ("Denmark", ("danish", "copenhagen")),
+    "fi": ("Finland", ("finnish", "helsinki")),
+    "pl": ("Poland", ("polish", "warsaw")),
+    "ua": ("Ukraine", ("ukrainian", "kyiv", "kiev", "kharkiv", "odesa")),
+    "ru": ("Russia", ("russian", "moscow", "kremlin", "st petersburg")),
+    "by": ("Belarus", ("belarusian", "minsk")),
+    "tr": ("Turkey", ("turkish", "turkiye", "ankara", "istanbul")),
+    "gr": ("Greece", ("greek", "athens")),
+    "hu": ("Hungary", ("hungarian", "budapest")),
+    "ro": ("Romania", ("romanian", "bucharest")),
+    "rs": ("Serbia", ("serbian", "belgrade")),
+    "ge": ("Republic of Georgia", ("tbilisi",)),
+    "il": ("Israel", ("israeli", "jerusalem", "tel aviv")),
+    "ps": ("Palestinian Territories", ("palestinian", "gaza", "west bank")),
+    "lb": ("Lebanon", ("lebanese", "beirut")),
+    "sy": ("Syria", ("syrian", "damascus")),
+    "iq": ("Iraq", ("iraqi", "baghdad")),
+    "ir": ("Iran", ("iranian", "tehran")),
+    "sa": ("Saudi Arabia", ("saudi", "riyadh")),
+    "ae": ("United Arab Emirates", ("uae", "emirati", "dubai", "abu dhabi")),
+    "qa": ("Qatar", ("qatari", "doha")),
+    "ye": ("Yemen", ("yemeni", "houthi")),
+    "eg": ("Egypt", ("egyptian", "cairo")),
+    "ly": ("Libya", ("libyan", "tripoli")),
+    "sd": ("Sudan", ("sudanese", "khartoum")),
+    "et": ("Ethiopia", ("ethiopian", "addis ababa")),
+    "ke": ("Kenya", ("kenyan", "nairobi")),
+    "ng": ("Nigeria", ("nigerian", "lagos", "abuja")),
+    "za": ("South Africa", ("south african", "johannesburg", "cape town", "pretoria")),
+    "af": ("Afghanistan", ("afghan", "kabul", "taliban")),
+    "pk": ("Pakistan", ("pakistani", "islamabad", "karachi")),
+    "in": ("India", ("new delhi", "delhi", "mumbai", "bangalore")),
+    "bd": ("Bangladesh", ("bangladeshi", "dhaka")),
+    "cn": ("China", ("chinese", "beijing", "shanghai", "hong kong")),
+    "tw": ("Taiwan", ("taiwanese", "taipei")),
+    "jp": ("Japan", ("japanese", "tokyo")),
+    "kr": ("South Korea", ("south korean", "seoul")),
+    "kp": ("North Korea", ("north korean", "pyongyang")),
+    "ph": ("Philippines", ("filipino", "manila")),
+    "vn": ("Vietnam", ("vietnamese", "hanoi")),
+    "id": ("Indonesia", ("indonesian", "jakarta")),
+    "th": ("Thailand", ("thai", "bangkok")),
+    "sg": ("Singapore", ("singaporean",)),
+    "my": ("Malaysia", ("malaysian", "kuala lumpur")),
+    "mm": ("Myanmar", ("burma", "burmese")),
+    "au": ("Australia", ("australian", "sydney", "melbourne", "canberra")),
+    "nz": ("New Zealand", ("wellington", "auckland")),
+}
+
+SCOPES = ("local", "state", "national", "global")
+
+
+def slugify(name: str) -> str:
+    """Place id component for a name ("Prince George's County" -> "prince-george-s-county")"""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def build_places() -> dict[str, Place]:
+    """Assemble the static gazetteer"""
+    places = [
+        Place(WORLD, "World", "world", None, WORLD_ALIASES),
+        Place(UNITED_STATES, "United States", "country", WORLD, US_ALIASES),
+    ]
+    for code, (name, aliases) in WORLD_REGIONS.items():
+        places.append(Place(f"{WORLD}/{code}", name, "region", WORLD, aliases))
+    for code, (name, aliases) in COUNTRIES.items():
+        places.append(Place(code, name, "country", WORLD, aliases))
+    for code, (name, aliases, cities) in US_STATES.items():
+        state_id = f"us-{code}"
+        places.append(Place(state_id, name, "state", UNITED_STATES, aliases))
+        for city in cities:
+            places.append(Place(f"{state_id}/{slugify(city)}", city, "city", state_id))
+    places.extend(Place(*subdivision) for subdivision in US_SUBDIVISIONS)
+    return {place.id: place for place in places}
+
+
+def build_alias_index(places: Iterable[Place]) -> dict[str, str]:
+    """Tokenized name/alias -> place id; every alias must name exactly one place"""
+    index: dict[str, str] = {}
+    for place in places:
+        for alias in (place.name, *place.aliases):
+            key = " ".join(tokenize(alias))
+            if index.setdefault(key, place.id) != place.id:
+                raise ValueError(
+                    f"Gazetteer alias '{alias}' names both {index[key]} and {place.id}"
+                )
+    return index
+
+
+PLACES = build_places()
+
+
+class Gazetteer:
+    """
+    Place matcher and scope classifier for one user location
+
+    Every place name and alias is compiled into a word-boundary keyword
+    automaton. Overlapping mentions resolve to the longest one, so "west
+    virginia" never also counts as "virginia" and "washington state" is not
+    read as the capital. A place's scope is the most specific level that
+    contains it relative to the user: local (user's city, county or region),
+    state, national (elsewhere in the US) or global.
+    """
+
+    def __init__(self, user_location: dict | None = None):
+        location = user_location or {}
+        self.places = dict(PLACES)
+        self.alias_index = build_alias_index(self.places.values())
+
+        state_id = self.lookup(location.get("state", ""))
+        region_id = self._home_place(location.get("region", ""), "region", state_id, state_id)
+        city_id = self._home_place(
+            location.get("city", ""), "city", state_id, region_id or state_id
+        )
+
+        self.local_roots = {place_id for place_id in (city_id, region_id) if place_id}
+        if city_id and self.places[self.places[city_id].parent].kind == "county":
+            self.local_roots.add(self.places[city_id].parent)
+        # Infer the state from the city or region when the profile omits it
+        self.state_id = state_id or next(
+            (
+                ancestor
+                for root in (city_id, region_id)
+                if root
+                for ancestor in self.ancestors(root)
+                if self.places[ancestor].kind == "state"
+            ),
+            None,
+        )
+        # Representative place per scope, for feed categories like "Local News"
+        self.home_places = {
+            "local": city_id or region_id,
+            "state": self.state_id,
+            "national": UNITED_STATES,
+            "global": WORLD,
+        }
+
+        self._scopes = {place_id: self._classify(place_id) for place_id in self.places}
+        self.automaton = KeywordAutomaton(self.aliases())
+
+    def aliases(self) -> dict[str, set[str]]:
+        """Place id -> every name and alias that refers to it"""
+        aliases: dict[str, set[str]] = {}
+        for alias, place_id in self.alias_index.items():
+            aliases.setdefault(place_id, set()).add(alias)
+        return aliases
+
+    def lookup(self, name: str) -> str | None:
+        """Place id for an exact name or alias, if known"""
+        return self.alias_index.get(" ".join(tokenize(name or "")))
+
+    def resolve(self, text: str) -> set[str]:
+        """Place ids mentioned in text"""
+        return self.select_longest(
+            (place_id, start, end)
+            for place_id, _alias, start, end in self.automaton.find(tokenize(text))
+        )
+
+    @staticmethod
+    def select_longest(hits: Iterable[tuple[str, int, int]]) -> set[str]:
+        """Keep the leftmost-longest of overlapping (place_id, start, end) mentions"""
+        selected = set()
+        last_end = 0
+        for place_id, start, end in sorted(hits, key=lambda hit: (hit[1], hit[1] - hit[2])):
+            if start >= last_end:
+                selected.add(place_id)
+                last_end = end
+        return selected
+
+    def ancestors(self, place_id: str) -> list[str]:
+        """Containing places, innermost first"""
+        chain = []
+        parent = self.places[place_id].parent
+        while parent is not None:
+            chain.append(parent)
+            parent = self.places[parent].parent
+        return chain
+
+    def scope_of(self, place_id: str) -> str | None:
+        """Scope of a place relative to the user location"""
+        return self._scopes.get(place_id)
+
+    def scopes(self, place_ids: Iterable[str]) -> set[str]:
+        """Scopes covered by a set of places"""
+        return {self._scopes[place_id] for place_id in place_ids if place_id in self._scopes}
+
+    def scope_place_ids(self, scopes: Iterable[str]) -> set[str]:
+        """Every place id that falls in any of the given scopes"""
+        wanted = set(scopes)
+        return {place_id for place_id, scope in self._scopes.items() if scope in wanted}
+
+    def _classify(self, place_id: str) -> str:
+        chain = {place_id, *self.ancestors(place_id)}
+        if chain & self.local_roots:
+            return "local"
+        if self.state_id in chain:
+            return "state"
+        if UNITED_STATES in chain:
+            return "national"
+        return "global"
+
+    def _home_place(
+        self, name: str, kind: str, state_id: str | None, parent: str | None
+    ) -> str | None:
+        """Resolve the user's city/region, adding it when unknown or in another state"""
+        if not name:
+            return None
+        place_id = self.lookup(name)
+        if place_id and (state_id is None or state_id in self.ancestors(place_id)):
+            return place_id
+
+        place = Place(
+            f"{parent or UNITED_STATES}/{slugify(name)}", name, kind, parent or UNITED_STATES
+        )
+        self.places[place.id] = place
+        self.alias_index[" ".join(tokenize(name))] = place.id
+        return place.id
+
+
+@lru_cache(maxsize=8)
+def _gazetteer_for(location: tuple[str, str, str]) -> Gazetteer:
+    city, region, state = location
+    return Gazetteer({"city": city, "region": region, "state": state})
+
+
+def get_gazetteer(user_location: dict | None = None) -> Gazetteer:
+    """Shared gazetteer compiled once per user location"""
+    location = user_location or {}
+    return _gazetteer_for(
+        tuple(location.get(key, "").lower() for key in ("city", "region", "state"))
+    )
@@ -0,0 +1,100 @@
+"""
+Memory Digest
+Compact per-synthesis digest stored with each synthesis and read back as historical memory
+"""
+
+from datetime import datetime
+from typing import Any
+
+from .token_counter import get_token_counter, truncate_to_tokens
+
+# Items kept per digest; situations come first in synthesis order
+MAX_DIGEST_SITUATIONS = 5
+MAX_DIGEST_ACTORS = 4
+MAX_DIGEST_THIN = 5
+
+# Each text field is cut to this many tokens, and a whole digest to the cap below
+DIGEST_FIELD_TOKENS = 40
+DIGEST_MAX_TOKENS = 400
+
+
+def _clip(text: Any) -> str:
+    text = " ".join(str(text or "").split())
+    clipped = truncate_to_tokens(text, DIGEST_FIELD_TOKENS)
+    return clipped if clipped == text else clipped.rstrip() + "..."
+
+
+def _situation_digest(situation: dict[str, Any]) -> dict[str, Any]:
+    where_this_goes = situation.get("where_this_goes") or {}
+    actors = [
+        _clip(actor.get("name") if isinstance(actor, dict) else actor)
+        for actor in (situation.get("actors") or [])[:MAX_DIGEST_ACTORS]
+    ]
+    digest = {
+        "title": _clip(situation.get("title") or situation.get("narrative")),
+        "actors": [name for name in actors if name],
+        "open_question": _clip(where_this_goes.get("unresolved_question")),
+        "watch": _clip(where_this_goes.get("what_to_watch")),
+    }
+    return {key: value for key, value in digest.items() if value}
+
+
+def build_memory_digest(synthesis_data: dict[str, Any] | None) -> dict[str, Any]:
+    """
+    Digest a synthesis into situation titles, key actors and open questions
+
+    Reads the two-pass format (situations and thin_coverage); older syntheses
+    with a bottom_line become a single situation. The digest is capped at
+    DIGEST_MAX_TOKENS by dropping trailing items, so reading it back for
+    curation has a bounded token cost.
+    """
+    data = synthesis_data or {}
+    situations = [
+        _situation_digest(situation)
+        for situation in (data.get("situations") or [])[:MAX_DIGEST_SITUATIONS]
+        if isinstance(situation, dict)
+    ]
+    bottom_line = data.get("bottom_line") or {}
+    if not situations and isinstance(bottom_line, dict) and bottom_line.get("summary"):
+        situations = [
+            {
+                "title": _clip(bottom_line["summary"]),
+                "open_question": _clip("; ".join(bottom_line.get("immediate_actions", [])[:2])),
+            }
+        ]
+
+    digest = {
+        "situations": [situation for situation in situations if situation.get("title")],
+        "thin": [
+            _clip(item.get("title"))
+            for item in (data.get("thin_coverage") or [])[:MAX_DIGEST_THIN]
+            if isinstance(item, dict) and item.get("title")
+        ],
+    }
+
+    counter = get_token_counter()
+    while counter.count_json(digest) > DIGEST_MAX_TOKENS and (
+        digest["thin"] or digest["situations"]
+    ):
+        digest["thin" if digest["thin"] else "situations"].pop()
+    return digest
+
+
+def format_memory_digest(
+    digest: dict[str, Any], generated_at: datetime, now: datetime | None = None
+) -> str:
+    """One memory block: a dated heading, then a line per situation and the thin topics"""
+    days_ago = max(((now or datetime.utcnow()) - generated_at).days, 0)
+    lines = [f"**{generated_at.strftime('%Y-%m-%d')} ({days_ago} days ago):**"]
+    for situation in digest.get("situations", []):
+        line = f"- {situation['title']}"
+        if situation.get("actors"):
+            line += f" | Actors: {', '.join(situation['actors'])}"
+        if situation.get("open_question"):
+            line += f" | Open: {situation['open_question']}"
+        if situation.get("watch"):
+            line += f" | Watch: {situation['watch']}"
+        lines.append(line)
+    if digest.get("thin"):
+        lines.append(f"- Thin coverage: {'; '.join(digest['thin'])}")
+    return "\n".join(lines)
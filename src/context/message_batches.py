@@ -0,0 +1,153 @@
+"""
+Message Batches
+Collects concurrently issued Claude requests into one Message Batch and maps results back
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ..utils.error_handling import ClaudeAPIError
+
+logger = logging.getLogger(__name__)
+
+# Requests issued within this window of the first are submitted together
+BATCH_COLLECT_SECONDS = 0.05
+
+
+class MessageBatcher:
+    """
+    Turns concurrent Messages requests into Message Batches
+
+    Callers await submit() as they would a single request. Requests issued
+    together (e.g. every Pass 2 situation from one asyncio.gather) are
+    collected for BATCH_COLLECT_SECONDS, submitted as one batch, polled
+    until it ends, and matched back to their callers by custom_id.
+
+    If the batch has not ended by the timeout it is cancelled and its
+    requests are sent synchronously through the fallback; so are requests
+    the batch reports as canceled or expired. Errored requests raise
+    ClaudeAPIError for their caller only.
+
+    `batches` is the Message Batches resource (AsyncAnthropic().messages.batches)
+    or any stand-in with the same create/retrieve/results/cancel methods.
+    """
+
+    def __init__(
+        self,
+        batches: Any,
+        fallback: Callable[..., Awaitable[Any]],
+        poll_seconds: float,
+        timeout_seconds: float,
+    ):
+        self.batches = batches
+        self.fallback = fallback
+        self.poll_seconds = poll_seconds
+        self.timeout_seconds = timeout_seconds
+        self.pending: list[tuple[str, dict[str, Any], asyncio.Future]] = []
+        self.flush_task: asyncio.Task | None = None
+        self.request_count = 0
+        self.batch_ids: list[str] = []
+
+    async def submit(self, request: dict[str, Any]) -> Any:
+        """Queue a Messages request for the next batch and wait for its message"""
+        self.request_count += 1
+        future = asyncio.get_running_loop().create_future()
+        self.pending.append((f"request-{self.request_count}", request, future))
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self._flush())
+        return await future
+
+    async def _flush(self):
+        pending: list[tuple[str, dict[str, Any], asyncio.Future]] = []
+        try:
+            await asyncio.sleep(BATCH_COLLECT_SECONDS)
+            pending, self.pending = self.pending, []
+            # Requests arriving while this batch runs start the next one
+            self.flush_task = None
+
+            try:
+                outcomes = await self.run({custom_id: request for custom_id, request, _ in pending})
+            except Exception as e:
+                outcomes = {custom_id: e for custom_id, _request, _future in pending}
+        except BaseException:
+            # The flush itself was cancelled; do not leave its callers waiting forever
+            if self.flush_task is asyncio.current_task():
+                # Still collecting, so the callers are the ones queued so far
+                pending, self.pending = self.pending, []
+                self.flush_task = None
+            for _custom_id, _request, future in pending:
+                future.cancel()
+            raise
+
+        for custom_id, _request, future in pending:
+            # Callers cancelled while the batch ran have nothing left to resolve
+            if future.done():
+                continue
+            outcome = outcomes[custom_id]
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+    async def run(self, requests: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        """
+        Run requests as one batch
+
+        Returns:
+            Message or exception per custom_id
+        """
+        batch = await self.batches.create(
+            requests=[
+                {"custom_id": custom_id, "params": params} for custom_id, params in requests.items()
+            ]
+        )
+        self.batch_ids.append(batch.id)
+        logger.info(f"Submitted message batch {batch.id} with {len(requests)} requests")
+
+        deadline = time.monotonic() + self.timeout_seconds
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    f"Message batch {batch.id} did not finish in {self.timeout_seconds:.0f}s; "
+                    f"sending {len(requests)} requests synchronously"
+                )
+                try:
+                    await self.batches.cancel(batch.id)
+                except Exception as e:
+                    logger.warning(f"Could not cancel message batch {batch.id}: {e}")
+                return await self._run_fallback(requests)
+            await asyncio.sleep(self.poll_seconds)
+            batch = await self.batches.retrieve(batch.id)
+
+        outcomes: dict[str, Any] = {}
+        async for entry in await self.batches.results(batch.id):
+            if entry.custom_id not in requests:
+                continue
+            if entry.result.type == "succeeded":
+                outcomes[entry.custom_id] = entry.result.message
+            elif entry.result.type == "errored":
+                outcomes[entry.custom_id] = ClaudeAPIError(
+                    f"Batch request {entry.custom_id} errored: {entry.result.error}",
+                    context={"batch_id": batch.id},
+                )
+
+        # Canceled, expired or missing results are retried directly
+        unfinished = {
+            custom_id: params for custom_id, params in requests.items() if custom_id not in outcomes
+        }
+        if unfinished:
+            logger.warning(
+                f"Message batch {batch.id}: {len(unfinished)} requests unfinished, "
+                f"sending synchronously"
+            )
+            outcomes.update(await self._run_fallback(unfinished))
+        return outcomes
+
+    async def _run_fallback(self, requests: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        results = await asyncio.gather(
+            *(self.fallback(**params) for params in requests.values()), return_exceptions=True
+        )
+        return dict(zip(requests, results, strict=True))
@@ -0,0 +1,255 @@
+"""
+Relevance Scoring
+Maintains Article.relevance_score as a recency-decayed rank key so curation can ORDER BY it
+"""
+
+import hashlib
+import json
+import logging
+import math
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+from sqlalchemy import ColumnElement, func, or_, update
+from sqlalchemy.orm import Session
+
+from src.database.models import Article, ArticlePlace, ArticleTopicScore, RSSFeed
+from src.utils.profile_loader import UserProfile
+
+from .gazetteer import get_gazetteer
+from .topic_matcher import TOPIC_KEYWORDS, TOPIC_THRESHOLD
+from .topic_scores import location_key
+from .vector_index import EMBEDDING_VERSION, VectorIndex, interest_vectors, similarity
+
+logger = logging.getLogger(__name__)
+
+# Bump when the scoring rules change so stored scores are recomputed
+RELEVANCE_REVISION = 2
+
+# How the 0-1 base relevance is built from its components (each 0-1)
+RELEVANCE_WEIGHTS = {"topic": 0.45, "locality": 0.35, "source": 0.2}
+
+# Cosine similarity to an interest's vector that counts as a full topic match
+SEMANTIC_FULL_MATCH = 0.2
+
+# Locality of an article's best scope; articles with no resolved place get the floor
+SCOPE_RELEVANCE = {"local": 1.0, "state": 0.7, "national": 0.4, "global": 0.3}
+UNPLACED_RELEVANCE = 0.2
+
+# Trust for sources without a profile override
+DEFAULT_SOURCE_TRUST = 0.5
+
+# Relevance halves every this many hours since publication
+RELEVANCE_HALF_LIFE_HOURS = 24
+
+# Keeps log2() finite and IN (...) lists under SQLite's bound-parameter limit
+MIN_BASE_RELEVANCE = 0.01
+SCORE_BATCH_SIZE = 500
+
+EPOCH = datetime(1970, 1, 1)
+JULIAN_DAY_AT_EPOCH = 2440587.5
+
+
+def _decay_hours(timestamp: datetime | None) -> float:
+    """Half-lives elapsed between the epoch and a (naive UTC or aware) timestamp"""
+    if timestamp is None:
+        return 0.0
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(UTC).replace(tzinfo=None)
+    return (timestamp - EPOCH).total_seconds() / 3600 / RELEVANCE_HALF_LIFE_HOURS
+
+
+def rank_key(base: float, timestamp: datetime | None) -> float:
+    """
+    Store-once rank key for base * 0.5 ** (age / half-life)
+
+    log2(base * 2 ** -((now - t) / h)) = log2(base) + t / h - now / h, and
+    now / h is the same for every article, so ordering by
+    log2(base) + t / h is ordering by decayed relevance at any moment.
+    """
+    return math.log2(max(base, MIN_BASE_RELEVANCE)) + _decay_hours(timestamp)
+
+
+def base_relevance(score: float, timestamp: datetime | None) -> float:
+    """Recover the 0-1 base relevance from a stored rank key"""
+    return min(2 ** (score - _decay_hours(timestamp)), 1.0)
+
+
+def log_base_relevance() -> ColumnElement:
+    """
+    SQL expression for log2 of an article's base relevance (NULL when unscored)
+
+    Strips the time term from the stored rank key, so articles can be ranked
+    by relevance alone within a period (SQLite julianday()).
+    """
+    timestamp = func.coalesce(Article.published_date, Article.fetched_at)
+    half_lives = (func.julianday(timestamp) - JULIAN_DAY_AT_EPOCH) * 24 / RELEVANCE_HALF_LIFE_HOURS
+    return Article.relevance_score - half_lives
+
+
+class RelevanceScorer:
+    """
+    Computes relevance_score for articles under one user profile
+
+    The base relevance combines how well the article matches the user's
+    professional domains and policy areas (stored keyword topic scores, or
+    the article vector's similarity to each interest), how local its places
+    are, and the profile's trust override for the source. It is read from
+    article_topic_scores, article_places and article_vectors, so recomputing
+    after a profile change is a few column queries and a bulk UPDATE with no
+    text scanning. Each article records the scorer version it was scored under.
+    """
+
+    def __init__(self, user_profile: UserProfile | None = None):
+        location = user_profile.get_primary_location() if user_profile else None
+        self.location_key = location_key(location)
+        self.gazetteer = get_gazetteer(location)
+
+        interests = []
+        trust_overrides = {}
+        if user_profile:
+            interests = list(user_profile.get_professional_domains()) + list(
+                user_profile.get_civic_interests().get("policy_areas", [])
+            )
+            trust_overrides = dict(
+                user_profile.get_source_calibration().get("trust_overrides") or {}
+            )
+        self.interests = sorted({topic for topic in interests if topic in TOPIC_KEYWORDS})
+        self.trust_overrides = trust_overrides
+        self.interest_vectors = interest_vectors(self.interests)
+
+        fingerprint = json.dumps(
+            [
+                RELEVANCE_REVISION,
+                RELEVANCE_WEIGHTS,
+                SEMANTIC_FULL_MATCH,
+                EMBEDDING_VERSION,
+                SCOPE_RELEVANCE,
+                self.location_key,
+                self.interests,
+                sorted(trust_overrides.items()),
+            ]
+        )
+        self.version = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+    def semantic_match(self, vector: dict[int, float] | None) -> float:
+        """0-1 match of an article vector to the closest interest"""
+        if not vector:
+            return 0.0
+        best = max((similarity(vector, v) for v in self.interest_vectors.values()), default=0.0)
+        return min(max(best, 0.0) / SEMANTIC_FULL_MATCH, 1.0)
+
+    def base(
+        self,
+        topic_score: float,
+        place_ids: Iterable[str],
+        source: str | None,
+        semantic: float = 0.0,
+    ) -> float:
+        """
+        0-1 base relevance from an article's interest match, places and source
+
+        The topic component is the better of the keyword score (reaching 1.0
+        at twice the match threshold) and the semantic match, so articles
+        that discuss an interest without its exact keywords still rank.
+        """
+        topic = max(min(topic_score / (2 * TOPIC_THRESHOLD), 1.0), semantic)
+        scopes = self.gazetteer.scopes(set(place_ids))
+        locality = max((SCOPE_RELEVANCE[scope] for scope in scopes), default=UNPLACED_RELEVANCE)
+        source_trust = self.trust_overrides.get(source, DEFAULT_SOURCE_TRUST)
+        return (
+            RELEVANCE_WEIGHTS["topic"] * topic
+            + RELEVANCE_WEIGHTS["locality"] * locality
+            + RELEVANCE_WEIGHTS["source"] * source_trust
+        )
+
+    def score_articles(self, session: Session, article_ids: Iterable[int]) -> int:
+        """
+        Recompute and store relevance_score for articles
+
+        Topic scores are read for this scorer's location, so articles should
+        be topic-scored (TopicScoreIndex) and embedded (VectorIndex) first.
+
+        Returns:
+            Number of articles scored
+        """
+        article_ids = sorted(set(article_ids))
+        scored = 0
+        for start in range(0, len(article_ids), SCORE_BATCH_SIZE):
+            batch_ids = article_ids[start : start + SCORE_BATCH_SIZE]
+
+            rows = (
+                session.query(Article.id, Article.published_date, Article.fetched_at, RSSFeed.name)
+                .outerjoin(RSSFeed, RSSFeed.id == Article.feed_id)
+                .filter(Article.id.in_(batch_ids))
+                .all()
+            )
+            topic_scores = dict(
+                session.query(ArticleTopicScore.article_id, func.max(ArticleTopicScore.score))
+                .filter(
+                    ArticleTopicScore.article_id.in_(batch_ids),
+                    ArticleTopicScore.location_key == self.location_key,
+                    ArticleTopicScore.dimension == "topic",
+                    ArticleTopicScore.name.in_(self.interests),
+                )
+                .group_by(ArticleTopicScore.article_id)
+                .all()
+            )
+            vectors = VectorIndex(session).vectors(batch_ids) if self.interest_vectors else {}
+            places: dict[int, list[str]] = {}
+            for article_id, place_id in session.query(
+                ArticlePlace.article_id, ArticlePlace.place_id
+            ).filter(
+                ArticlePlace.article_id.in_(batch_ids),
+                ArticlePlace.location_key == self.location_key,
+            ):
+                places.setdefault(article_id, []).append(place_id)
+
+            updates = [
+                {
+                    "id": article_id,
+                    "relevance_score": rank_key(
+                        self.base(
+                            topic_scores.get(article_id, 0.0),
+                            places.get(article_id, []),
+                            source,
+                            self.semantic_match(vectors.get(article_id)),
+                        ),
+                        published_date or fetched_at,
+                    ),
+                    "relevance_version": self.version,
+                }
+                for article_id, published_date, fetched_at, source in rows
+            ]
+            if updates:
+                session.execute(update(Article), updates)
+            scored += len(updates)
+
+        session.commit()
+        if scored:
+            logger.info(f"Stored relevance scores for {scored} articles")
+        return scored
+
+    def refresh(self, session: Session, since: datetime) -> int:
+        """Score unfiltered articles fetched since a cutoff that are unscored or stale"""
+        stale_ids = [
+            article_id
+            for (article_id,) in session.query(Article.id).filter(
+                Article.fetched_at >= since,
+                Article.filtered.is_(False),
+                or_(
+                    Article.relevance_version.is_(None),
+                    Article.relevance_version != self.version,
+                ),
+            )
+        ]
+        return self.score_articles(session, stale_ids)
+
+
+if __name__ == "__main__":
+    from src.database.connection import get_db
+    from src.utils.profile_loader import get_user_profile
+
+    logging.basicConfig(level=logging.INFO)
+    with get_db() as db:
+        RelevanceScorer(get_user_profile()).refresh(db, datetime.min)
@@ -0,0 +1,130 @@
+"""
+Claude Response Cache
+On-disk Claude responses keyed by a hash of the request, for re-runs and offline replay
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when the key derivation or entry layout changes
+RESPONSE_CACHE_VERSION = 1
+
+CACHE_DIRNAME = "response_cache"
+
+CACHE_MODES = ("off", "on", "replay")
+
+
+class ResponseCache:
+    """
+    Claude response texts stored as one JSON file per request
+
+    The key hashes everything that determines the response: model,
+    max_tokens, temperature, system content and messages. Entries older
+    than the TTL are misses, except in replay mode, where any stored
+    response is served so recorded runs stay reproducible. Writes evict
+    the least recently written entries once the directory exceeds its size
+    bound; the directory size is scanned on the first write and then kept
+    as a running total, so it is only rescanned when that total passes
+    the bound.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        ttl_hours: int | None = None,
+        max_bytes: int | None = None,
+        replay: bool = False,
+    ):
+        self.cache_dir = Path(cache_dir or settings.data_dir / CACHE_DIRNAME)
+        if ttl_hours is None:
+            ttl_hours = settings.claude_response_cache_ttl_hours
+        if max_bytes is None:
+            max_bytes = settings.claude_response_cache_max_mb * 1024 * 1024
+        self.ttl = timedelta(hours=ttl_hours)
+        self.max_bytes = max_bytes
+        self.replay = replay
+        # Bytes in cache_dir as of the last scan plus this instance's writes since
+        self._size: int | None = None
+
+    @staticmethod
+    def key(request: dict[str, Any]) -> str:
+        """Content hash of a Messages API request"""
+        fingerprint = json.dumps([RESPONSE_CACHE_VERSION, request], sort_keys=True, default=str)
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> str | None:
+        """The cached response text for a key, if present (and fresh, outside replay)"""
+        path = self._path(key)
+        try:
+            with path.open(encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cached response {path.name}: {e}")
+            return None
+
+        if entry.get("version") != RESPONSE_CACHE_VERSION:
+            return None
+        if (
+            not self.replay
+            and datetime.utcnow() - datetime.fromisoformat(entry["created_at"]) > self.ttl
+        ):
+            return None
+        return entry["text"]
+
+    def put(self, key: str, text: str, model: str):
+        """Store a response atomically, then evict the oldest entries beyond max_bytes"""
+        entry = {
+            "version": RESPONSE_CACHE_VERSION,
+            "model": model,
+            "created_at": datetime.utcnow().isoformat(),
+            "text": text,
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            replaced = path.stat().st_size if path.exists() else 0
+            tmp_path = path.with_suffix(".tmp")
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+            if self._size is not None:
+                self._size += path.stat().st_size - replaced
+            if self._size is None or self._size > self.max_bytes:
+                self._evict()
+        except OSError as e:
+            logger.warning(f"Could not cache Claude response: {e}")
+
+    def _evict(self):
+        files = [(path, path.stat()) for path in self.cache_dir.glob("*.json")]
+        total = sum(stat.st_size for _path, stat in files)
+        for path, stat in sorted(files, key=lambda pair: pair[1].st_mtime):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+        self._size = total
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Response cache for the configured CLAUDE_RESPONSE_CACHE mode, or None when off"""
+    mode = settings.claude_response_cache
+    if mode not in CACHE_MODES:
+        logger.warning(f"Unknown CLAUDE_RESPONSE_CACHE mode '{mode}'; caching is off")
+        return None
+    if mode == "off":
+        return None
+    return ResponseCache(replay=mode == "replay")
@@ -6,6 +6,7 @@ Pass 2: For clusters with 3+ articles, produce examined situation narratives.
          For clusters with 1-2 articles, produce thin coverage summaries.
 """
 
+import asyncio
 import json
 import logging
 from datetime import datetime
@@ -21,6 +22,7 @@ from ..database.models import (
 from ..prompts import load_analysis_rules
 from ..prompts.synthesis import (
     CLUSTERING_PROMPT,
+    SITUATION_REQUEST_PROMPT,
     SITUATION_SYNTHESIS_PROMPT,
     THIN_COVERAGE_PROMPT,
 )
@@ -28,6 +30,8 @@ from ..utils.profiler import profile
 from .claude_client import ClaudeClient
 from .curator import ContextCurator
 from .frame_manager import FrameManager
+from .memory_digest import build_memory_digest
+from .token_counter import get_token_counter
 
 logger = logging.getLogger(__name__)
 
@@ -37,11 +41,21 @@ ANALYSIS_THRESHOLD = 2  # Minimum articles for full situation analysis
 class NarrativeSynthesizer:
     """Two-pass situation-based narrative synthesizer."""
 
-    def __init__(self, topic_filters: dict | None = None):
+    def __init__(self, topic_filters: dict | None = None, batch_mode: bool = False):
+        """
+        Args:
+            topic_filters: Optional topic/scope filters for curation
+            batch_mode: Send Pass 2 requests as Message Batches; clustering and
+                frame discovery are always sent directly
+        """
         self.topic_filters = topic_filters or {}
+        self.batch_mode = batch_mode
         self.curator = ContextCurator(topic_filters=self.topic_filters)
         self.client = ClaudeClient()
         self.analysis_rules = load_analysis_rules()
+        self.situation_prompt = SITUATION_SYNTHESIS_PROMPT.format(
+            analysis_rules=self.analysis_rules
+        )
         self.frame_manager = FrameManager(self.client)
 
     async def synthesize(self, hours: int = 48, max_articles: int = 50) -> dict[str, Any]:
@@ -101,80 +115,13 @@ class NarrativeSynthesizer:
                 # Build citation map from all articles
                 citation_map = self._build_citation_map(articles)
 
-                # Pass 2a: Full situation analysis for clusters with 3+ articles
-                situations = []
+                # Pass 2: situation analyses (with frame discovery) and thin coverage
+                # summaries run concurrently, bounded by the client's request limits
                 with profile("PASS_2_SITUATIONS"):
-                    for cluster in full_clusters:
-                        cluster_articles = [
-                            a
-                            for a in articles
-                            if a.get("id") in cluster["article_ids"]
-                            or articles.index(a) + 1 in cluster["article_ids"]
-                        ]
-                        if not cluster_articles:
-                            cluster_articles = [
-                                articles[i - 1]
-                                for i in cluster["article_ids"]
-                                if 0 < i <= len(articles)
-                            ]
-
-                        if not cluster_articles:
-                            continue
-
-                        # Check for known frames
-                        frame_prompt_addition = ""
-                        existing_cluster = self.frame_manager.find_matching_cluster(cluster)
-
-                        if existing_cluster:
-                            validated_frames = self.frame_manager.get_validated_frames(
-                                existing_cluster.id
-                            )
-                            if validated_frames:
-                                frame_prompt_addition = self.frame_manager.build_frame_aware_prompt(
-                                    existing_cluster.name, validated_frames
-                                )
-                                logger.info(
-                                    f"Injecting {len(validated_frames)} known frames "
-                                    f"for '{cluster['title']}'"
-                                )
-
-                        # Run situation synthesis
-                        situation = await self._analyze_situation(
-                            cluster_articles,
-                            cluster,
-                            citation_map,
-                            frame_prompt_addition=frame_prompt_addition,
-                        )
-
-                        if not situation:
-                            continue
-
-                        situations.append(situation)
-
-                        # Frame discovery: if no known frames, discover them
-                        if not existing_cluster:
-                            try:
-                                discovery = await self.frame_manager.discover_frames(
-                                    cluster_articles, cluster
-                                )
-                                if discovery:
-                                    self.frame_manager.store_discovered_frames(cluster, discovery)
-                            except Exception as e:
-                                logger.warning(
-                                    f"Frame discovery failed for '{cluster['title']}': {e}"
-                                )
-
-                        # Update gap tracking for existing clusters
-                        elif existing_cluster and situation.get("coverage_frame"):
-                            absent = situation.get("coverage_frame", {}).get("de_emphasized", "")
-                            if absent:
-                                self.frame_manager.update_frame_gaps(existing_cluster.id, [absent])
-
-                # Pass 2b: Thin coverage summaries
-                thin_coverage = []
-                if thin_clusters:
-                    with profile("PASS_2_THIN"):
-                        thin_coverage = await self._summarize_thin_clusters(thin_clusters, articles)
+                    situations, thin_coverage = await asyncio.gather(
+                        self._analyze_situations(full_clusters, articles, citation_map),
+                        self._summarize_thin_clusters(thin_clusters, articles),
+                    )
 
                 # Assemble output
                 synthesis_data = {
@@ -188,6 +135,7 @@ class NarrativeSynthesizer:
                         "analysis_threshold": f"{ANALYSIS_THRESHOLD}+ articles",
                         "generated_at": datetime.utcnow().isoformat(),
                         "citation_map": citation_map,
+                        "token_usage": self.client.usage_totals(),
                     },
                 }
 
@@ -254,6 +202,121 @@ class NarrativeSynthesizer:
     # Pass 2a: Full situation analysis
     # =========================================================================
 
+    async def _analyze_situations(
+        self, full_clusters: list[dict], articles: list[dict], citation_map: dict
+    ) -> list[dict]:
+        """
+        Analyze every full cluster concurrently, returning situations in cluster order.
+
+        Only the analysis requests run concurrently. Frame discovery and frame
+        writes happen afterwards one cluster at a time in cluster order, and a
+        cluster with no match is re-matched first, so one that overlaps a
+        cluster stored earlier in the run updates it instead of discovering
+        and storing a duplicate. A failing cluster is logged and skipped
+        without affecting the others.
+        """
+        plans = [self._plan_situation(cluster, articles) for cluster in full_clusters]
+        plans = [plan for plan in plans if plan]
+
+        results = await asyncio.gather(*(self._run_situation(plan, citation_map) for plan in plans))
+
+        situations = []
+        for plan, situation in zip(plans, results, strict=True):
+            if not situation:
+                continue
+            situations.append(situation)
+            try:
+                await self._apply_frame_updates(plan, situation)
+            except Exception as e:
+                logger.warning(f"Frame update failed for '{plan['cluster']['title']}': {e}")
+        return situations
+
+    def _plan_situation(self, cluster: dict, articles: list[dict]) -> dict | None:
+        """Resolve a cluster's articles and known frames ahead of its analysis request."""
+        cluster_articles = [
+            a
+            for a in articles
+            if a.get("id") in cluster["article_ids"]
+            or articles.index(a) + 1 in cluster["article_ids"]
+        ]
+        if not cluster_articles:
+            cluster_articles = [
+                articles[i - 1] for i in cluster["article_ids"] if 0 < i <= len(articles)
+            ]
+
+        if not cluster_articles:
+            return None
+
+        # Check for known frames
+        frame_prompt_addition = ""
+        existing_cluster = self.frame_manager.find_matching_cluster(cluster)
+
+        if existing_cluster:
+            validated_frames = self.frame_manager.get_validated_frames(existing_cluster.id)
+            if validated_frames:
+                frame_prompt_addition = self.frame_manager.build_frame_aware_prompt(
+                    existing_cluster.name, validated_frames
+                )
+                logger.info(
+                    f"Injecting {len(validated_frames)} known frames for '{cluster['title']}'"
+                )
+
+        return {
+            "cluster": cluster,
+            "cluster_articles": cluster_articles,
+            "existing_cluster": existing_cluster,
+            "frame_prompt_addition": frame_prompt_addition,
+        }
+
+    async def _run_situation(self, plan: dict, citation_map: dict) -> dict | None:
+        """Run the analysis request for one planned cluster, returning None on failure."""
+        cluster = plan["cluster"]
+        try:
+            situation = await self._analyze_situation(
+                plan["cluster_articles"],
+                cluster,
+                citation_map,
+                frame_prompt_addition=plan["frame_prompt_addition"],
+            )
+        except Exception as e:
+            logger.error(f"Situation analysis failed for '{cluster['title']}': {e}")
+            return None
+
+        if not situation:
+            return None
+
+        story_coverage = self._story_coverage(plan["cluster_articles"])
+        if story_coverage:
+            situation["story_coverage"] = story_coverage
+
+        return situation
+
+    async def _apply_frame_updates(self, plan: dict, situation: dict):
+        """Discover and store frames for a new cluster, or update gaps for a known one."""
+        cluster = plan["cluster"]
+        existing_cluster = plan["existing_cluster"]
+        if not existing_cluster:
+            # A cluster stored earlier in this run may now match
+            existing_cluster = self.frame_manager.find_matching_cluster(cluster)
+
+        if not existing_cluster:
+            # Frame discovery: if no known frames, discover them
+            try:
+                discovery = await self.frame_manager.discover_frames(
+                    plan["cluster_articles"], cluster
+                )
+            except Exception as e:
+                logger.warning(f"Frame discovery failed for '{cluster['title']}': {e}")
+                return
+            if discovery:
+                self.frame_manager.store_discovered_frames(cluster, discovery)
+
+        # Update gap tracking for existing clusters
+        elif situation.get("coverage_frame"):
+            absent = situation.get("coverage_frame", {}).get("de_emphasized", "")
+            if absent:
+                self.frame_manager.update_frame_gaps(existing_cluster.id, [absent])
+
     async def _analyze_situation(
         self,
         cluster_articles: list[dict],
@@ -277,18 +340,15 @@ class NarrativeSynthesizer:
             date = article.get("published_date", "No date")
             article_refs.append(f"[{i}] {title} - {source} ({date})")
 
-        article_ref_list = "\n".join(article_refs)
-
-        prompt = SITUATION_SYNTHESIS_PROMPT.format(
-            analysis_rules=self.analysis_rules,
-            article_ref_list=article_ref_list,
-        )
+        prompt = SITUATION_REQUEST_PROMPT.format(article_ref_list="\n".join(article_refs))
 
         # Inject frame-aware prompt if known frames exist
         if frame_prompt_addition:
             prompt = f"{prompt}\n\n{frame_prompt_addition}"
 
-        # Build context with full article content for this cluster
+        # Build context with full article content for this cluster. The
+        # situation rules, profile and instructions are the same for every
+        # cluster, so they form the cached system prefix; articles follow it.
         context = {
             "user_profile": self.curator._format_user_profile(),
             "articles": cluster_articles,
@@ -299,6 +359,8 @@ class NarrativeSynthesizer:
             context=context,
             task=prompt,
             temperature=1.0,
+            cached_prefix=[self.situation_prompt],
+            batch=self.batch_mode,
         )
 
         situation = self._parse_json_response(response)
@@ -318,6 +380,9 @@ class NarrativeSynthesizer:
         self, thin_clusters: list[dict], articles: list[dict]
     ) -> list[dict]:
         """Produce one-line summaries for clusters with insufficient coverage."""
+        if not thin_clusters:
+            return []
+
         cluster_descriptions = []
         for cluster in thin_clusters:
             # Gather source names for this cluster
@@ -339,6 +404,7 @@ class NarrativeSynthesizer:
             system_prompt="You are summarizing news topics with thin coverage.",
             user_message=prompt,
             temperature=0.0,
+            batch=self.batch_mode,
         )
 
         parsed = self._parse_json_response(response)
@@ -360,6 +426,21 @@ class NarrativeSynthesizer:
             }
         return citation_map
 
+    def _story_coverage(self, cluster_articles: list[dict]) -> dict | None:
+        """
+        Summarize cross-day coverage of the persistent stories behind a cluster.
+
+        Returns {"feed_count": int, "first_seen": iso date} for the widest-covered
+        story in the cluster, or None when no story data is attached.
+        """
+        stories = [a["story"] for a in cluster_articles if a.get("story")]
+        if not stories:
+            return None
+
+        widest = max(stories, key=lambda s: s.get("feed_count", 0))
+        first_seen = min((s["first_seen"] for s in stories if s.get("first_seen")), default=None)
+        return {"feed_count": widest.get("feed_count", 0), "first_seen": first_seen}
+
     def _parse_json_response(self, response: str) -> dict[str, Any]:
         """Parse Claude's JSON response, stripping markdown fences."""
         try:
@@ -410,6 +491,7 @@ class NarrativeSynthesizer:
                         user_profile_hash=self._hash_profile(context.get("user_profile")),
                         historical_summaries=context.get("memory", ""),
                         instructions=context.get("instructions", ""),
+                        diversity_params=context.get("_diversity"),
                     )
                     session.add(snapshot)
                     session.flush()
@@ -428,6 +510,7 @@ class NarrativeSynthesizer:
                     user_profile_version="1.0",
                     synthesis_data=synthesis_data,
                     executive_summary=exec_summary,
+                    memory_digest=build_memory_digest(synthesis_data),
                     articles_analyzed=articles_count,
                     generated_at=datetime.utcnow(),
                 )
@@ -459,8 +542,8 @@ class NarrativeSynthesizer:
             return None
 
     def _estimate_tokens(self, context: dict[str, Any]) -> int:
-        """Rough token count estimate (1 token ~ 4 chars)."""
-        return len(json.dumps(context)) // 4
+        """Approximate token count, reusing cached per-article counts."""
+        return get_token_counter().count_context(context)
 
     def _hash_profile(self, profile: dict[str, Any] | None) -> str:
         """Hash user profile for tracking."""
@@ -0,0 +1,155 @@
+"""
+Token Counter
+Local approximation of Claude token counts, cached per article so budgets cost O(articles)
+"""
+
+import json
+import logging
+import math
+import re
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# BPE-style pre-tokenization: contractions, words and digit groups (with their
+# leading space), punctuation runs, whitespace. Tokenizers never merge across
+# these boundaries, so each piece costs at least one token.
+PIECE_PATTERN = re.compile(
+    r"'(?:s|t|d|m|re|ve|ll)\b| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+|_+"
+)
+
+# Common English words are single tokens up to roughly this length; longer
+# ones split into about one token per this many characters
+CHARS_PER_WORD_TOKEN = 6
+
+# Punctuation merges less: about one token per this many characters
+CHARS_PER_SYMBOL_TOKEN = 2
+
+# Per-article counts kept before the cache is reset
+MAX_CACHED_ARTICLES = 20000
+
+
+def _piece_tokens(piece: str) -> int:
+    """Approximate tokens for one pre-tokenized piece"""
+    text = piece.lstrip(" ")
+    if not text or text.isspace():
+        return 1
+    if not text.isascii():
+        # Accented and non-Latin text is split far more finely
+        return len(text.encode("utf-8")) // 2 or 1
+    if text[0].isalpha():
+        return math.ceil(len(text) / CHARS_PER_WORD_TOKEN)
+    if text[0].isdigit():
+        return 1
+    return math.ceil(len(text) / CHARS_PER_SYMBOL_TOKEN)
+
+
+def _pieces(text: str) -> Iterator[tuple[str, int]]:
+    for match in PIECE_PATTERN.finditer(text):
+        piece = match.group()
+        yield piece, _piece_tokens(piece)
+
+
+@lru_cache(maxsize=1024)
+def count_text_tokens(text: str) -> int:
+    """
+    Approximate Claude tokens in a string
+
+    Cached by value; str hashes are memoized, so repeat lookups of the same
+    (large) string are O(1).
+    """
+    return sum(tokens for _piece, tokens in _pieces(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Longest prefix of text that fits in max_tokens, cut on a piece boundary where possible"""
+    used = 0
+    for match in PIECE_PATTERN.finditer(text):
+        piece = match.group()
+        tokens = _piece_tokens(piece)
+        if used + tokens > max_tokens:
+            # Keep the share of an oversized piece (a long URL or unbroken run) that fits
+            keep = len(piece) * (max_tokens - used) // tokens
+            return text[: match.start() + keep]
+        used += tokens
+    return text
+
+
+def _scalar(value: Any) -> Any:
+    return value if isinstance(value, str | int | float | bool | None) else repr(value)
+
+
+def _article_version(entry: dict[str, Any]) -> int:
+    """Content version of a formatted article; cheap because str hashes are memoized"""
+    return hash(tuple((key, _scalar(value)) for key, value in entry.items()))
+
+
+class TokenCounter:
+    """
+    Counts context tokens, caching each formatted article's count
+
+    Counts are for the article serialized as JSON, the way it is sent to
+    Claude. They are keyed by article id and content version, so re-counting
+    a context after each compression step only sums cached numbers, and a
+    later curation that includes the same article reuses its count.
+    """
+
+    def __init__(self):
+        self._article_counts: dict[tuple[Any, int], int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def count_text(self, text: str | None) -> int:
+        return count_text_tokens(text) if text else 0
+
+    def count_json(self, value: Any) -> int:
+        """Tokens in a value serialized as JSON"""
+        return count_text_tokens(json.dumps(value)) if value else 0
+
+    def count_article(self, entry: dict[str, Any]) -> int:
+        """Tokens in one formatted article, cached by (id, content version)"""
+        key = (entry.get("id"), _article_version(entry))
+        count = self._article_counts.get(key)
+        if count is not None:
+            self.hits += 1
+            return count
+
+        self.misses += 1
+        if len(self._article_counts) >= MAX_CACHED_ARTICLES:
+            self._article_counts.clear()
+        count = self._article_counts[key] = self.count_json(entry)
+        return count
+
+    def seed_article(self, entry: dict[str, Any], count: int):
+        """Record a known count for a formatted article (e.g. one loaded from the pool cache)"""
+        if len(self._article_counts) >= MAX_CACHED_ARTICLES:
+            self._article_counts.clear()
+        self._article_counts[(entry.get("id"), _article_version(entry))] = count
+
+    def count_articles(self, entries: list[dict[str, Any]]) -> int:
+        """Tokens in a JSON list of formatted articles (brackets and separators included)"""
+        if not entries:
+            return 0
+        return sum(self.count_article(entry) for entry in entries) + len(entries) + 1
+
+    def count_value(self, value: Any) -> int:
+        """Tokens in a context value: text as-is, article lists per article, the rest as JSON"""
+        if isinstance(value, str):
+            return self.count_text(value)
+        if isinstance(value, list) and value and all(isinstance(v, dict) for v in value):
+            return self.count_articles(value)
+        return self.count_json(value)
+
+    def count_context(self, context: dict[str, Any]) -> int:
+        """Total tokens of a context dict, skipping private metadata keys"""
+        return sum(
+            self.count_value(value) for key, value in context.items() if not key.startswith("_")
+        )
+
+
+@lru_cache(maxsize=1)
+def get_token_counter() -> TokenCounter:
+    """Process-wide counter, so article counts are shared across curations"""
+    return TokenCounter()
@@ -4,10 +4,16 @@ Uses keyword matching and metadata to filter articles without AI inference
 """
 
 import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from src.database.models import Article
+from src.database.search_index import match_any
+from src.processors.keyword_automaton import KeywordAutomaton, tokenize
 from src.utils.profile_loader import UserProfile
 
+from .gazetteer import SCOPES, Gazetteer, get_gazetteer
+
 logger = logging.getLogger(__name__)
 
 # Topic keyword dictionaries with broad interpretation
@@ -338,14 +344,192 @@ TOPIC_KEYWORDS = {
 }
 
 
+# Category weights (how strongly each keyword category signals relevance)
+CATEGORY_WEIGHTS = {
+    "core": 3.0,  # Core terms are strongest signal
+    "threats": 2.0,  # Specific threats/technologies
+    "policy": 2.0,  # Policy/governance terms
+    "geopolitical": 2.0,
+    "tech": 1.5,
+    "industry": 1.5,
+    "topics": 1.5,
+    "tools": 1.0,
+    "providers": 1.0,
+    "entities": 1.0,  # Mentioned companies/orgs
+}
+
+# Decision threshold: minimum score for a topic match
+TOPIC_THRESHOLD = 3.0
+
+# Feed category words that place a feed in a scope
+SCOPE_CATEGORY_WORDS = {
+    "local": {"local"},
+    "state": {"state", "regional"},
+    "national": {"national", "federal", "us", "usa"},
+    "global": {"global", "international", "world"},
+}
+
+
+@dataclass
+class ArticleSignals:
+    """Topic scores, resolved places and matched scopes for one article, from a single keyword scan"""
+
+    topic_scores: dict[str, float] = field(default_factory=dict)
+    places: set[str] = field(default_factory=set)
+    scopes: set[str] = field(default_factory=set)
+
+
+@lru_cache(maxsize=8)
+def _compile_matcher(location: tuple[str, str, str]) -> KeywordAutomaton:
+    """
+    Compile every topic keyword list and gazetteer place alias into one automaton
+
+    Labels are "topic:<topic>:<category>" or "place:<place id>". The user's own
+    city and region are added to the gazetteer when missing, so one automaton
+    is compiled per location.
+    """
+    keywords = {
+        f"topic:{topic}:{category}": set(terms)
+        for topic, categories in TOPIC_KEYWORDS.items()
+        for category, terms in categories.items()
+    }
+    for place_id, aliases in _gazetteer(location).aliases().items():
+        keywords[f"place:{place_id}"] = aliases
+    return KeywordAutomaton(keywords)
+
+
+def _gazetteer(location: tuple[str, str, str]) -> Gazetteer:
+    city, region, state = location
+    return get_gazetteer({"city": city, "region": region, "state": state})
+
+
 class TopicMatcher:
     """
     Matches articles to topics using metadata and keyword expansion
     Provides both topic filtering and geographic scope filtering
+
+    All topics and place mentions are found in one word-boundary keyword scan
+    per article; places resolve to scopes through the gazetteer. Results are
+    cached by article id for the lifetime of the matcher.
     """
 
     def __init__(self):
         self.topic_keywords = TOPIC_KEYWORDS
+        self._signals_cache: dict[tuple, ArticleSignals] = {}
+
+    def analyze(self, article: Article, user_location: dict | None = None) -> ArticleSignals:
+        """
+        Score every topic and scope for an article in a single pass
+
+        Args:
+            article: Article to analyze
+            user_location: User's location dict (city, state, region) for local/state scopes
+
+        Returns:
+            ArticleSignals with per-topic scores and matched scopes
+        """
+        location = tuple(
+            (user_location or {}).get(key, "").lower() for key in ("city", "region", "state")
+        )
+        # Unsaved articles have no id and are never cached
+        cache_key = (article.id, location) if article.id is not None else None
+        cached = self._signals_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            return cached
+
+        automaton = _compile_matcher(location)
+        gazetteer = _gazetteer(location)
+        signals = ArticleSignals()
+        topic_terms: dict[tuple[str, str], set[str]] = {}
+        place_hits: list[tuple[str, int, int]] = []
+
+        # Places come from title and description; topics also see the first 500 chars of content
+        scope_tokens = tokenize(f"{article.title or ''} {article.description or ''}")
+        tokens = scope_tokens + tokenize((article.normalized_content or "")[:500])
+        for label, keyword, start, end in automaton.find(tokens):
+            kind, _, name = label.partition(":")
+            if kind == "place":
+                if end <= len(scope_tokens):
+                    place_hits.append((name, start, end))
+            else:
+                topic, _, category = name.rpartition(":")
+                topic_terms.setdefault((topic, category), set()).add(keyword)
+        signals.places = gazetteer.select_longest(place_hits)
+
+        for (topic, category), terms in topic_terms.items():
+            weight = CATEGORY_WEIGHTS.get(category, 1.0)
+            signals.topic_scores[topic] = signals.topic_scores.get(topic, 0.0) + len(terms) * weight
+
+        # Entity matching (strong signal if relevant entities mentioned)
+        for entity in article.entities or []:
+            entity_topics = set()
+            entity_places = []
+            for label, _keyword, start, end in automaton.find(tokenize(entity)):
+                if label.startswith("topic:") and label.endswith(":entities"):
+                    entity_topics.add(label[len("topic:") : -len(":entities")])
+                elif label.startswith("place:"):
+                    entity_places.append((label[len("place:") :], start, end))
+            for topic in entity_topics:
+                signals.topic_scores[topic] = signals.topic_scores.get(topic, 0.0) + 3.0
+            signals.places |= gazetteer.select_longest(entity_places)
+
+        # Feed category matching
+        if article.feed and article.feed.category:
+            self._apply_feed_category(article.feed.category, automaton, gazetteer, signals)
+
+        signals.scopes = gazetteer.scopes(signals.places)
+
+        if cache_key:
+            self._signals_cache[cache_key] = signals
+        return signals
+
+    def _apply_feed_category(
+        self,
+        category: str,
+        automaton: KeywordAutomaton,
+        gazetteer: Gazetteer,
+        signals: ArticleSignals,
+    ):
+        """Boost topics and add places implied by the article's feed category"""
+        category_lower = category.lower()
+        category_words = set(tokenize(category))
+        hits = automaton.find(tokenize(category))
+        labels = {label for label, _keyword, _start, _end in hits}
+
+        # Topic name or one of its core keywords in the feed category
+        for topic in self.topic_keywords:
+            if topic in category_lower or f"topic:{topic}:core" in labels:
+                signals.topic_scores[topic] = signals.topic_scores.get(topic, 0.0) + 2.0
+
+        # "Local News" stands for the user's own city, "State Politics" for their state
+        for scope, words in SCOPE_CATEGORY_WORDS.items():
+            home = gazetteer.home_places[scope]
+            if category_words & words and home:
+                signals.places.add(home)
+        signals.places |= gazetteer.select_longest(
+            (label[len("place:") :], start, end)
+            for label, _keyword, start, end in hits
+            if label.startswith("place:")
+        )
+
+    def search_expression(self, topics: list[str]) -> str:
+        """
+        FTS5 expression matching any keyword of the given topics
+
+        A candidate generator for the full-text index: one weak keyword is
+        enough to match, so candidates are narrowed with filter_articles,
+        which applies the weighted threshold.
+        """
+        return match_any(
+            keyword
+            for topic in topics
+            for keywords in self.topic_keywords.get(topic, {}).values()
+            for keyword in keywords
+        )
+
+    def clear_cache(self):
+        """Drop cached per-article results (e.g. between runs)"""
+        self._signals_cache.clear()
 
     def matches_topic(self, article: Article, topic: str) -> tuple[bool, float]:
         """
@@ -358,67 +542,12 @@ class TopicMatcher:
         Returns:
             (matches: bool, score: float) - Whether article matches and confidence score
         """
-        score = 0.0
-
-        # Get keywords for this topic
-        keywords = self.topic_keywords.get(topic, {})
-        if not keywords:
+        if topic not in self.topic_keywords:
             logger.warning(f"Unknown topic: {topic}")
             return False, 0.0
 
-        # Combine searchable text (title is most important, then description)
-        text = ""
-        if article.title:
-            text += article.title.lower() + " "
-        if article.description:
-            text += article.description.lower() + " "
-
-        # Add first 500 chars of content if available
-        if article.normalized_content:
-            text += article.normalized_content[:500].lower()
-
-        # Category weights (how strongly each keyword category signals relevance)
-        category_weights = {
-            "core": 3.0,  # Core terms are strongest signal
-            "threats": 2.0,  # Specific threats/technologies
-            "policy": 2.0,  # Policy/governance terms
-            "geopolitical": 2.0,
-            "tech": 1.5,
-            "industry": 1.5,
-            "topics": 1.5,
-            "tools": 1.0,
-            "providers": 1.0,
-            "entities": 1.0,  # Mentioned companies/orgs
-        }
-
-        # Score based on keyword matches
-        for category, terms in keywords.items():
-            weight = category_weights.get(category, 1.0)
-            matches = sum(1 for term in terms if term in text)
-            score += matches * weight
-
-        # Entity matching (strong signal if relevant entities mentioned)
-        if article.entities and "entities" in keywords:
-            entity_keywords = keywords["entities"]
-            for entity in article.entities:
-                if any(kw in entity.lower() for kw in entity_keywords):
-                    score += 3.0  # High confidence for entity match
-
-        # Feed category matching
-        if article.feed and article.feed.category:
-            category_lower = article.feed.category.lower()
-
-            # Check if topic or core keywords in feed category
-            if topic in category_lower:
-                score += 2.0
-            elif "core" in keywords:
-                core_keywords = keywords["core"]
-                if any(kw in category_lower for kw in core_keywords):
-                    score += 2.0
-
-        # Decision threshold: require minimum score
-        threshold = 3.0
-        matches = score >= threshold
+        score = self.analyze(article).topic_scores.get(topic, 0.0)
+        matches = score >= TOPIC_THRESHOLD
 
         if matches:
             logger.debug(
@@ -439,114 +568,12 @@ class TopicMatcher:
         Returns:
             bool - Whether article matches scope
         """
-        # Combine searchable text
-        text = ""
-        if article.title:
-            text += article.title.lower() + " "
-        if article.description:
-            text += article.description.lower()
-
-        if scope == "local":
-            # Extract user location details
-            city = user_location.get("city", "").lower()
-            region = user_location.get("region", "").lower()
-
-            # Check for direct mentions
-            if city and city in text:
-                return True
-            if region and region in text:
-                return True
-
-            # Check entities for location matches
-            if article.entities:
-                for entity in article.entities:
-                    entity_lower = entity.lower()
-                    if (city and city in entity_lower) or (region and region in entity_lower):
-                        return True
-
-            # Check feed category for 'local'
-            return bool(
-                article.feed and article.feed.category and "local" in article.feed.category.lower()
-            )
+        if scope not in SCOPES:
+            # Unknown scope = no filtering
+            logger.warning(f"Unknown scope: {scope}")
+            return True
 
-        elif scope == "state":
-            state = user_location.get("state", "").lower()
-
-            # State name in text
-            if state and state in text:
-                return True
-
-            # State in feed category
-            if article.feed and article.feed.category:
-                cat = article.feed.category.lower()
-                if state in cat or "state" in cat or "regional" in cat:
-                    return True
-
-            return False
-
-        elif scope == "national":
-            national_keywords = [
-                "federal",
-                "congress",
-                "senate",
-                "house of representatives",
-                "washington",
-                "white house",
-                "national",
-                "u.s.",
-                "usa",
-                "president",
-                "supreme court",
-                "fbi",
-                "cia",
-                "dhs",
-                "nationwide",
-            ]
-
-            # Check for national keywords
-            if any(kw in text for kw in national_keywords):
-                return True
-
-            # Check feed category
-            if article.feed and article.feed.category:
-                cat = article.feed.category.lower()
-                if any(kw in cat for kw in ["national", "federal", "us", "usa"]):
-                    return True
-
-            return False
-
-        elif scope == "global":
-            # Global is more permissive - includes international news
-            global_keywords = [
-                "international",
-                "global",
-                "worldwide",
-                "world",
-                "europe",
-                "asia",
-                "africa",
-                "united nations",
-                "nato",
-                "g7",
-                "g20",
-                "china",
-                "russia",
-                "india",
-            ]
-
-            if any(kw in text for kw in global_keywords):
-                return True
-
-            if article.feed and article.feed.category:
-                cat = article.feed.category.lower()
-                if any(kw in cat for kw in ["global", "international", "world"]):
-                    return True
-
-            return False
-
-        # Unknown scope = no filtering
-        logger.warning(f"Unknown scope: {scope}")
-        return True
+        return scope in self.analyze(article, user_location).scopes
 
     def filter_articles(
         self, articles: list[Article], topic_filters: dict, user_profile: UserProfile
@@ -569,14 +596,23 @@ class TopicMatcher:
             "scopes": topic_filters.get("scopes", []),
         }
 
-        # Apply topic filters (OR logic within topics)
         topics = topic_filters.get("topics", [])
+        scopes = topic_filters.get("scopes", [])
+        # Same location for both passes so each article is scanned once
+        user_location = user_profile.get_primary_location() if scopes else None
+
+        # Apply topic filters (OR logic within topics)
         if topics:
+            for topic in topics:
+                if topic not in self.topic_keywords:
+                    logger.warning(f"Unknown topic: {topic}")
+
             topic_matches = []
             for article in filtered:
+                topic_scores = self.analyze(article, user_location).topic_scores
                 for topic in topics:
-                    matches, score = self.matches_topic(article, topic)
-                    if matches:
+                    score = topic_scores.get(topic, 0.0)
+                    if score >= TOPIC_THRESHOLD:
                         topic_matches.append((article, score))
                         break  # Article matches at least one topic
 
@@ -587,18 +623,12 @@ class TopicMatcher:
             filter_stats["after_topic_filter"] = len(filtered)
 
         # Apply scope filters (OR logic within scopes)
-        scopes = topic_filters.get("scopes", [])
         if scopes:
-            user_location = user_profile.get_primary_location()
-            scope_matches = []
-
-            for article in filtered:
-                for scope in scopes:
-                    if self.matches_scope(article, scope, user_location):
-                        scope_matches.append(article)
-                        break  # Article matches at least one scope
-
-            filtered = scope_matches
+            filtered = [
+                article
+                for article in filtered
+                if any(self.matches_scope(article, scope, user_location) for scope in scopes)
+            ]
             filter_stats["after_scope_filter"] = len(filtered)
 
         filter_stats["output_count"] = len(filtered)
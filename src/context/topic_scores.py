@@ -0,0 +1,246 @@
+"""
+Topic Score Index
+Persists ingest-time topic and scope scores so curation can filter in SQL
+"""
+
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import and_, func, insert
+from sqlalchemy.orm import Query, Session, joinedload, selectinload
+
+from src.database.models import Article, ArticlePlace, ArticleTopicScore
+
+from .batch_scorer import BatchTopicScorer
+from .gazetteer import SCOPES
+from .topic_matcher import TOPIC_KEYWORDS, TOPIC_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+# Keeps DELETE ... IN (...) lists well under SQLite's bound-parameter limit
+DELETE_BATCH_SIZE = 500
+
+# Articles loaded and scored per batch when rescoring a window
+RESCORE_BATCH_SIZE = 5000
+
+SCORED_MARKER = ("meta", "scored")
+
+
+def location_key(user_location: dict | None) -> str:
+    """Stable key for the (city, region, state) that local/state scopes depend on"""
+    location = user_location or {}
+    return "|".join(location.get(key, "").lower() for key in ("city", "region", "state"))
+
+
+class TopicScoreIndex:
+    """
+    Scores articles for every topic and resolves their places once, then queries them by index
+
+    Topic and place rows are keyed by the user's location because the
+    gazetteer (and so what "Local News" means) depends on it; changing the
+    profile location simply causes articles to be rescored under the new key
+    on the next curation. Places are stored as gazetteer ids and scope
+    filters become lookups of the place ids in that scope.
+    """
+
+    def __init__(self, user_location: dict | None = None):
+        self.location_key = location_key(user_location)
+        self.scorer = BatchTopicScorer(user_location)
+        self.gazetteer = self.scorer.gazetteer
+
+    def score_articles(self, session: Session, articles: Iterable[Article]) -> int:
+        """
+        Compute and store topic scores and places, replacing any existing rows
+
+        Returns:
+            Number of articles scored
+        """
+        articles = [article for article in articles if article.id is not None]
+        if not articles:
+            return 0
+
+        article_ids = [article.id for article in articles]
+        for start in range(0, len(article_ids), DELETE_BATCH_SIZE):
+            batch_ids = article_ids[start : start + DELETE_BATCH_SIZE]
+            session.query(ArticleTopicScore).filter(
+                ArticleTopicScore.location_key == self.location_key,
+                ArticleTopicScore.article_id.in_(batch_ids),
+            ).delete(synchronize_session=False)
+            session.query(ArticlePlace).filter(
+                ArticlePlace.location_key == self.location_key,
+                ArticlePlace.article_id.in_(batch_ids),
+            ).delete(synchronize_session=False)
+
+        rows = []
+        place_rows = []
+        for article, signals in zip(articles, self.scorer.score(articles), strict=True):
+            rows.extend(
+                self._row(article.id, "topic", topic, score)
+                for topic, score in signals.topic_scores.items()
+                if score > 0
+            )
+            rows.append(self._row(article.id, *SCORED_MARKER, 1.0))
+            place_rows.extend(
+                {"article_id": article.id, "location_key": self.location_key, "place_id": place_id}
+                for place_id in signals.places
+            )
+
+        session.execute(insert(ArticleTopicScore), rows)
+        if place_rows:
+            session.execute(insert(ArticlePlace), place_rows)
+        session.commit()
+
+        logger.info(f"Stored topic scores for {len(articles)} articles ({len(rows)} rows)")
+        return len(articles)
+
+    def score_unscored(self, session: Session, since: datetime) -> int:
+        """
+        Score unfiltered articles fetched since a cutoff that have no rows for this location
+
+        Catches articles ingested before the table existed or by paths that
+        skip the filter stage.
+        """
+        marker = ArticleTopicScore.__table__.alias("marker")
+        unscored = (
+            session.query(Article)
+            .options(joinedload(Article.feed), selectinload(Article.body))
+            .outerjoin(
+                marker,
+                and_(
+                    marker.c.article_id == Article.id,
+                    marker.c.location_key == self.location_key,
+                    marker.c.dimension == SCORED_MARKER[0],
+                    marker.c.name == SCORED_MARKER[1],
+                ),
+            )
+            .filter(
+                Article.fetched_at >= since,
+                Article.filtered.is_(False),
+                marker.c.article_id.is_(None),
+            )
+            .all()
+        )
+        return self.score_articles(session, unscored)
+
+    def rescore(self, session: Session, since: datetime) -> int:
+        """
+        Rescore every unfiltered article fetched since a cutoff, e.g. after keyword changes
+
+        Articles are loaded and scored in id-ordered batches to bound memory.
+        """
+        rescored = 0
+        last_id = 0
+        while True:
+            batch = (
+                session.query(Article)
+                .options(joinedload(Article.feed), selectinload(Article.body))
+                .filter(
+                    Article.fetched_at >= since,
+                    Article.filtered.is_(False),
+                    Article.id > last_id,
+                )
+                .order_by(Article.id)
+                .limit(RESCORE_BATCH_SIZE)
+                .all()
+            )
+            if not batch:
+                break
+            rescored += self.score_articles(session, batch)
+            last_id = batch[-1].id
+            session.expunge_all()
+        return rescored
+
+    def topic_scores(self, session: Session, article_ids: list[int]) -> dict[int, dict[str, float]]:
+        """Stored topic scores at this location for articles, by article id"""
+        scores: dict[int, dict[str, float]] = {}
+        for start in range(0, len(article_ids), DELETE_BATCH_SIZE):
+            rows = session.query(
+                ArticleTopicScore.article_id, ArticleTopicScore.name, ArticleTopicScore.score
+            ).filter(
+                ArticleTopicScore.article_id.in_(article_ids[start : start + DELETE_BATCH_SIZE]),
+                ArticleTopicScore.location_key == self.location_key,
+                ArticleTopicScore.dimension == "topic",
+            )
+            for article_id, name, score in rows:
+                scores.setdefault(article_id, {})[name] = score
+        return scores
+
+    def article_scopes(self, session: Session, article_ids: list[int]) -> dict[int, set[str]]:
+        """Scopes of each article's stored places under this location's gazetteer"""
+        places: dict[int, set[str]] = {}
+        for start in range(0, len(article_ids), DELETE_BATCH_SIZE):
+            rows = session.query(ArticlePlace.article_id, ArticlePlace.place_id).filter(
+                ArticlePlace.article_id.in_(article_ids[start : start + DELETE_BATCH_SIZE]),
+                ArticlePlace.location_key == self.location_key,
+            )
+            for article_id, place_id in rows:
+                places.setdefault(article_id, set()).add(place_id)
+        return {
+            article_id: set(self.gazetteer.scopes(place_ids))
+            for article_id, place_ids in places.items()
+        }
+
+    def apply_filters(self, query: Query, topic_filters: dict) -> Query:
+        """
+        Restrict an Article query to matching topics/scopes, best topic score first,
+        then by precomputed relevance
+
+        Topics and scopes are each OR'd, matching TopicMatcher.filter_articles.
+        An unknown scope disables scope filtering, as it does there.
+        """
+        topics = topic_filters.get("topics", [])
+        scopes = topic_filters.get("scopes", [])
+
+        for topic in topics:
+            if topic not in TOPIC_KEYWORDS:
+                logger.warning(f"Unknown topic: {topic}")
+
+        order_by = [Article.relevance_score.desc(), Article.fetched_at.desc()]
+        if topics:
+            topic_score = (
+                query.session.query(
+                    ArticleTopicScore.article_id,
+                    func.max(ArticleTopicScore.score).label("score"),
+                )
+                .filter(
+                    ArticleTopicScore.location_key == self.location_key,
+                    ArticleTopicScore.dimension == "topic",
+                    ArticleTopicScore.name.in_(topics),
+                    ArticleTopicScore.score >= TOPIC_THRESHOLD,
+                )
+                .group_by(ArticleTopicScore.article_id)
+                .subquery()
+            )
+            query = query.join(topic_score, topic_score.c.article_id == Article.id)
+            order_by.insert(0, topic_score.c.score.desc())
+
+        unknown_scopes = [scope for scope in scopes if scope not in SCOPES]
+        if unknown_scopes:
+            logger.warning(f"Unknown scope: {unknown_scopes[0]}")
+        elif scopes:
+            in_scope = query.session.query(ArticlePlace.article_id).filter(
+                ArticlePlace.location_key == self.location_key,
+                ArticlePlace.place_id.in_(sorted(self.gazetteer.scope_place_ids(scopes))),
+            )
+            query = query.filter(Article.id.in_(in_scope))
+
+        return query.order_by(*order_by)
+
+    def _row(self, article_id: int, dimension: str, name: str, score: float) -> dict:
+        return {
+            "article_id": article_id,
+            "location_key": self.location_key,
+            "dimension": dimension,
+            "name": name,
+            "score": score,
+        }
+
+
+if __name__ == "__main__":
+    from src.database.connection import get_db
+    from src.utils.profile_loader import get_user_profile
+
+    logging.basicConfig(level=logging.INFO)
+    with get_db() as db:
+        TopicScoreIndex(get_user_profile().get_primary_location()).rescore(db, datetime.min)
@@ -0,0 +1,213 @@
+"""
+Vector Index
+Sparse hashed term-frequency article embeddings stored per article, with brute-force top-k search
+"""
+
+import heapq
+import logging
+import math
+import zlib
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session, selectinload
+
+from src.database.models import Article, ArticleVector
+from src.processors.summarizer import STOPWORDS, WORD_PATTERN
+
+from .topic_matcher import TOPIC_KEYWORDS
+
+logger = logging.getLogger(__name__)
+
+# Embedding width; the hashing trick folds every word into one of these slots.
+# Vectors are stored sparse, so width only costs collisions, not space.
+DIMENSIONS = 4096
+
+# Bump when tokenization, hashing or DIMENSIONS change so vectors are rebuilt
+EMBEDDING_VERSION = "hashed-tf-1"
+
+# Words of article text embedded (title and description always count)
+MAX_EMBEDDED_WORDS = 400
+
+# Slot -> weight; absent slots are zero
+SparseVector = dict[int, float]
+
+# Vectors replaced per DELETE/INSERT pair; keeps IN (...) lists under SQLite's
+# bound-parameter limit and bounds the articles loaded per backfill batch
+INDEX_BATCH_SIZE = 500
+
+
+def _terms(text: str) -> list[str]:
+    """Lowercased content words with a crude plural fold ("hackers" -> "hacker")"""
+    terms = []
+    for word in WORD_PATTERN.findall(text.lower()):
+        if word in STOPWORDS or len(word) < 2:
+            continue
+        if word.endswith("'s"):
+            word = word[:-2]
+        elif len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def embed_text(text: str | None) -> SparseVector:
+    """
+    Unit-length signed feature-hashing vector with sublinear term frequency
+
+    crc32 keeps slots stable across processes (str hash() is randomized);
+    its top bit picks the sign so colliding words tend to cancel rather than
+    add up.
+    """
+    vector: SparseVector = {}
+    for term, count in Counter(_terms(text or "")).items():
+        digest = zlib.crc32(term.encode("utf-8"))
+        sign = -1.0 if digest & 0x80000000 else 1.0
+        slot = digest % DIMENSIONS
+        vector[slot] = vector.get(slot, 0.0) + sign * (1.0 + math.log(count))
+
+    norm = math.sqrt(sum(value * value for value in vector.values()))
+    return {slot: value / norm for slot, value in vector.items() if value} if norm else {}
+
+
+def article_text(article: Any) -> str:
+    """The text an article is embedded from: title, description and the start of its body"""
+    body = article.embedding_summary or article.normalized_content or ""
+    lead = " ".join(body.split()[:MAX_EMBEDDED_WORDS])
+    return " ".join(part for part in (article.title, article.description, lead) if part)
+
+
+def similarity(a: SparseVector, b: SparseVector) -> float:
+    """Cosine similarity of two unit vectors"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(value * b.get(slot, 0.0) for slot, value in a.items())
+
+
+def pack(vector: SparseVector) -> bytes:
+    """Slots as uint16 followed by weights as float32"""
+    slots = sorted(vector)
+    return array("H", slots).tobytes() + array("f", (vector[slot] for slot in slots)).tobytes()
+
+
+def unpack(blob: bytes) -> SparseVector:
+    size = len(blob) // 6
+    slots, weights = array("H"), array("f")
+    slots.frombytes(blob[: 2 * size])
+    weights.frombytes(blob[2 * size :])
+    return dict(zip(slots, weights, strict=True))
+
+
+def interest_text(topic: str) -> str:
+    """A known topic's name and every keyword in its groups"""
+    groups = TOPIC_KEYWORDS.get(topic, {})
+    return " ".join([topic, *(keyword for group in groups.values() for keyword in group)])
+
+
+def interest_vectors(topics: Iterable[str]) -> dict[str, SparseVector]:
+    """One vector per known topic, embedded from its name and keywords"""
+    return {topic: embed_text(interest_text(topic)) for topic in topics if topic in TOPIC_KEYWORDS}
+
+
+class VectorIndex:
+    """
+    Article embeddings persisted in article_vectors, searched by brute force
+
+    Vectors are computed once per article at ingest (or backfilled on first
+    use) and stored as packed sparse blobs. Search scans the vectors of a
+    time window; sparse vectors of a hundred or so slots make that a few
+    dict lookups per article, cheaper at this corpus size (thousands of
+    recent articles) than maintaining a partitioned index.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def index_articles(self, articles: Iterable[Any]) -> int:
+        """Embed and store vectors for articles, replacing existing ones; commits"""
+        by_id = {article.id: article for article in articles if article.id is not None}
+        article_ids = list(by_id)
+        for start in range(0, len(article_ids), INDEX_BATCH_SIZE):
+            batch_ids = article_ids[start : start + INDEX_BATCH_SIZE]
+            self.session.execute(
+                delete(ArticleVector)
+                .where(ArticleVector.article_id.in_(batch_ids))
+                .execution_options(synchronize_session=False)
+            )
+            self.session.execute(
+                insert(ArticleVector),
+                [
+                    {
+                        "article_id": article_id,
+                        "vector": pack(embed_text(article_text(by_id[article_id]))),
+                        "version": EMBEDDING_VERSION,
+                    }
+                    for article_id in batch_ids
+                ],
+            )
+        self.session.commit()
+        return len(article_ids)
+
+    def index_missing(self, since: datetime) -> int:
+        """Embed unfiltered articles fetched since a cutoff that lack a current vector"""
+        current = self.session.query(ArticleVector.article_id).filter(
+            ArticleVector.version == EMBEDDING_VERSION
+        )
+        missing = self.session.query(Article.id).filter(
+            Article.fetched_at >= since,
+            Article.filtered.is_(False),
+            Article.id.not_in(current),
+        )
+        article_ids = [article_id for (article_id,) in missing]
+
+        indexed = 0
+        for start in range(0, len(article_ids), INDEX_BATCH_SIZE):
+            batch = (
+                self.session.query(Article)
+                .options(selectinload(Article.body))
+                .filter(Article.id.in_(article_ids[start : start + INDEX_BATCH_SIZE]))
+                .all()
+            )
+            # Committed batches are only weakly held by the session once dropped here
+            indexed += self.index_articles(batch)
+
+        if indexed:
+            logger.info(f"Embedded {indexed} articles missing from the vector index")
+        return indexed
+
+    def vectors(self, article_ids: Iterable[int]) -> dict[int, SparseVector]:
+        """Stored vectors for articles, skipping any not yet embedded"""
+        article_ids = list(article_ids)
+        if not article_ids:
+            return {}
+        rows = self.session.query(ArticleVector.article_id, ArticleVector.vector).filter(
+            ArticleVector.article_id.in_(article_ids),
+            ArticleVector.version == EMBEDDING_VERSION,
+        )
+        return {article_id: unpack(blob) for article_id, blob in rows}
+
+    def search(
+        self, query: SparseVector, k: int = 10, since: datetime | None = None
+    ) -> list[tuple[int, float]]:
+        """
+        Top-k unfiltered articles by cosine similarity to a query vector
+
+        Returns:
+            (article_id, similarity) pairs, most similar first
+        """
+        rows = (
+            self.session.query(ArticleVector.article_id, ArticleVector.vector)
+            .join(Article, Article.id == ArticleVector.article_id)
+            .filter(ArticleVector.version == EMBEDDING_VERSION, Article.filtered.is_(False))
+        )
+        if since is not None:
+            rows = rows.filter(Article.fetched_at >= since)
+        return heapq.nlargest(
+            k,
+            ((article_id, similarity(query, unpack(blob))) for article_id, blob in rows),
+            key=lambda pair: pair[1],
+        )
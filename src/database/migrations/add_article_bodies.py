@@ -0,0 +1,105 @@
+"""
+Migration: Add Article Bodies
+Adds the content-addressed article_bodies table and articles.body_id,
+then moves existing inline normalized text into the shared store.
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from src.database.connection import engine
+from src.database.models import Article, ArticleBody
+from src.processors.body_store import BodyStore
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade():
+    """Create article_bodies, add body_id and backfill existing articles."""
+    print("Adding content-addressed article bodies...")
+
+    ArticleBody.__table__.create(bind=engine, checkfirst=True)
+    print("  article_bodies table ready")
+
+    columns = {col["name"] for col in inspect(engine).get_columns("articles")}
+    body_columns = {col["name"] for col in inspect(engine).get_columns("article_bodies")}
+    with engine.begin() as conn:
+        if "ref_count" not in body_columns:
+            conn.execute(text("ALTER TABLE article_bodies ADD COLUMN ref_count INTEGER DEFAULT 0"))
+            print("  ref_count column added")
+
+        if "body_id" not in columns:
+            conn.execute(
+                text(
+                    "ALTER TABLE articles ADD COLUMN body_id INTEGER REFERENCES article_bodies(id)"
+                )
+            )
+            print("  body_id column added")
+
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_body_id ON articles(body_id)"))
+        print("  idx_body_id index created")
+
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        moved = 0
+        while True:
+            batch = (
+                session.query(Article)
+                .filter(Article.body_id.is_(None), Article._normalized_content.isnot(None))
+                .limit(BACKFILL_BATCH_SIZE)
+                .all()
+            )
+            if not batch:
+                break
+
+            bodies = BodyStore(session)
+            for article in batch:
+                body, _created = bodies.intern(article._normalized_content)
+                article.body = body
+                article.normalized_content = None
+            session.commit()
+            moved += len(batch)
+
+        print(f"  {moved} articles moved to shared bodies")
+
+        # Counts from before ref_count existed, or drifted by deletes, are rebuilt here
+        result = BodyStore(session).recount()
+        print(
+            f"  {result['counts_corrected']} reference counts corrected, "
+            f"{result['orphans_removed']} orphaned bodies removed"
+        )
+    finally:
+        session.close()
+
+    print("\nArticle body migration completed.")
+
+
+def downgrade():
+    """Copy shared bodies back inline and drop the body_id index (SQLite keeps the column)."""
+    print("Restoring inline article text...")
+
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        for article in session.query(Article).filter(Article.body_id.isnot(None)).all():
+            body_text = article.body.text
+            article.body = None
+            article.normalized_content = body_text
+        session.commit()
+    finally:
+        session.close()
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS idx_body_id"))
+        conn.execute(text("DELETE FROM article_bodies"))
+    print("  article bodies cleared and idx_body_id index dropped")
+
+    print("\nArticle body downgrade completed.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        downgrade()
+    else:
+        upgrade()
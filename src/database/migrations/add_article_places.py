@@ -0,0 +1,56 @@
+"""
+Migration: Add Article Places
+Adds the article_places table of gazetteer place ids, keyed by user location,
+used for scope filters and clears keyword-based scope rows so articles are rescored.
+"""
+
+from sqlalchemy import inspect, text
+
+from src.database.connection import engine
+from src.database.models import ArticlePlace
+
+
+def upgrade():
+    """Create article_places and mark scored articles for rescoring."""
+    print("Adding article places...")
+
+    inspector = inspect(engine)
+    if inspector.has_table("article_places"):
+        columns = {col["name"] for col in inspector.get_columns("article_places")}
+        if "location_key" not in columns:
+            # SQLite cannot change a primary key in place; places are derived, so rebuild
+            ArticlePlace.__table__.drop(bind=engine)
+            print("  article_places without location_key dropped")
+
+    ArticlePlace.__table__.create(bind=engine, checkfirst=True)
+    print("  article_places table ready")
+
+    if inspector.has_table("article_topic_scores"):
+        with engine.begin() as conn:
+            # Scope rows came from keyword lists; dropping the markers makes the
+            # topic score backfill resolve each article's places through the gazetteer
+            result = conn.execute(
+                text("DELETE FROM article_topic_scores WHERE dimension IN ('scope', 'meta')")
+            )
+        print(f"  {result.rowcount} keyword scope and marker rows cleared")
+
+    print("\nArticle places migration completed.")
+
+
+def downgrade():
+    """Drop the article_places table."""
+    print("Dropping article places...")
+
+    ArticlePlace.__table__.drop(bind=engine, checkfirst=True)
+    print("  article_places table dropped")
+
+    print("\nArticle places downgrade completed.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        downgrade()
+    else:
+        upgrade()
@@ -0,0 +1,49 @@
+"""
+Migration: Add Article Search
+Creates the articles_fts FTS5 full-text index and fills it from existing articles.
+"""
+
+from sqlalchemy import text
+
+from src.database.connection import engine, get_db
+from src.database.models import ARTICLES_FTS_DDL, ARTICLES_FTS_TABLE
+from src.database.search_index import ArticleSearchIndex
+
+
+def upgrade():
+    """Create the articles_fts table and index every article."""
+    print("Creating article full-text index...")
+
+    if engine.dialect.name != "sqlite":
+        print("  Skipped: the full-text index requires SQLite (FTS5)")
+        return
+
+    with engine.begin() as conn:
+        conn.execute(text(ARTICLES_FTS_DDL))
+    print(f"  {ARTICLES_FTS_TABLE} table created")
+
+    with get_db() as db:
+        indexed = ArticleSearchIndex(db).rebuild()
+    print(f"  {indexed} articles indexed")
+
+    print("\nArticle search migration completed.")
+
+
+def downgrade():
+    """Drop the articles_fts table."""
+    print("Dropping article full-text index...")
+
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS {ARTICLES_FTS_TABLE}"))
+    print(f"  {ARTICLES_FTS_TABLE} table dropped")
+
+    print("\nArticle search downgrade completed.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        downgrade()
+    else:
+        upgrade()
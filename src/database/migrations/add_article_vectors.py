@@ -0,0 +1,49 @@
+"""
+Migration: Add Article Vectors
+Adds the article_vectors table of per-article embeddings and embeds
+existing unfiltered articles.
+"""
+
+from datetime import datetime
+
+from sqlalchemy.orm import sessionmaker
+
+from src.context.vector_index import VectorIndex
+from src.database.connection import engine
+from src.database.models import ArticleVector
+
+
+def upgrade():
+    """Create article_vectors and backfill vectors."""
+    print("Adding article vectors...")
+
+    ArticleVector.__table__.create(bind=engine, checkfirst=True)
+    print("  article_vectors table ready")
+
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        indexed = VectorIndex(session).index_missing(datetime.min)
+        print(f"  {indexed} articles embedded")
+    finally:
+        session.close()
+
+    print("\nArticle vector migration completed.")
+
+
+def downgrade():
+    """Drop article_vectors."""
+    print("Dropping article vectors...")
+
+    ArticleVector.__table__.drop(bind=engine, checkfirst=True)
+    print("  article_vectors table dropped")
+
+    print("\nArticle vector downgrade completed.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        downgrade()
+    else:
+        upgrade()
@@ -0,0 +1,47 @@
+"""
+Migration: Add Filter Version
+Adds the articles.filter_version column and index so content filtering
+only evaluates articles that are new or were evaluated under older rules.
+"""
+
+from sqlalchemy import inspect, text
+
+from src.database.connection import engine
+
+
+def upgrade():
+    """Add filter_version column and index to articles."""
+    print("Adding filter versioning to articles...")
+
+    columns = {col["name"] for col in inspect(engine).get_columns("articles")}
+    with engine.begin() as conn:
+        if "filter_version" not in columns:
+            conn.execute(text("ALTER TABLE articles ADD COLUMN filter_version VARCHAR(16)"))
+            print("  filter_version column added")
+
+        conn.execute(
+            text("CREATE INDEX IF NOT EXISTS idx_filter_version ON articles(filter_version)")
+        )
+        print("  idx_filter_version index created")
+
+    print("\nFilter version migration completed.")
+
+
+def downgrade():
+    """Drop the filter_version index (SQLite keeps the column)."""
+    print("Dropping filter version index...")
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS idx_filter_version"))
+    print("  idx_filter_version index dropped")
+
+    print("\nFilter version downgrade completed.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        downgrade()
+    else:
+        upgrade()
@@ -0,0 +1,62 @@
+"""
+Migration: Add Memory Digests
+Adds the narrative_syntheses.memory_digest column and backfills it from
+stored synthesis data, so curation memory never re-parses full syntheses.
+"""
+
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from src.context.memory_digest import build_memory_digest
+from src.database.connection import engine
+from src.database.models import NarrativeSynthesis
+
+
+def upgrade():
+    """Add memory_digest column to narrative_syntheses and backfill it."""
+    print("Adding memory digests to narrative syntheses...")
+
+    columns = {col["name"] for col in inspect(engine).get_columns("narrative_syntheses")}
+    if "memory_digest" not in columns:
+        with engine.begin() as conn:
+            conn.execute(text("ALTER TABLE narrative_syntheses ADD COLUMN memory_digest JSON"))
+        print("  memory_digest column added")
+
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        rows = (
+            session.query(NarrativeSynthesis.id, NarrativeSynthesis.synthesis_data)
+            .filter(NarrativeSynthesis.memory_digest.is_(None))
+            .all()
+        )
+        for synthesis_id, synthesis_data in rows:
+            session.query(NarrativeSynthesis).filter_by(id=synthesis_id).update(
+                {"memory_digest": build_memory_digest(synthesis_data)},
+                synchronize_session=False,
+            )
+        session.commit()
+        print(f"  {len(rows)} syntheses digested")
+    finally:
+        session.close()
+
+    print("\nMemory digest migration completed.")
+
+
+def downgrade():
+    """Clear stored digests (SQLite keeps the column)."""
+    print("Clearing memory digests...")
+
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE narrative_syntheses SET memory_digest = NULL"))
+    print("  memory_digest values cleared")
+
+    print("\nMemory digest downgrade completed.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        downgrade()
+    else:
+        upgrade()
@@ -0,0 +1,65 @@
+"""
+Migration: Add Relevance Scores
+Adds the articles.relevance_version column and index, then computes
+relevance_score for existing unfiltered articles under the user profile.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from src.context.relevance import RelevanceScorer
+from src.database.connection import engine
+from src.utils.profile_loader import get_user_profile
+
+
+def upgrade():
+    """Add relevance_version column and index, and backfill relevance scores."""
+    print("Adding relevance scoring to articles...")
+
+    columns = {col["name"] for col in inspect(engine).get_columns("articles")}
+    with engine.begin() as conn:
+        if "relevance_version" not in columns:
+            conn.execute(text("ALTER TABLE articles ADD COLUMN relevance_version VARCHAR(16)"))
+            print("  relevance_version column added")
+
+        conn.execute(
+            text("CREATE INDEX IF NOT EXISTS idx_relevance_version ON articles(relevance_version)")
+        )
+        print("  idx_relevance_version index created")
+
+    try:
+        scorer = RelevanceScorer(get_user_profile())
+    except FileNotFoundError:
+        print("  no user profile; articles will be scored on first curation")
+        return
+
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        scored = scorer.refresh(session, datetime.min)
+        print(f"  {scored} articles scored")
+    finally:
+        session.close()
+
+    print("\nRelevance score migration completed.")
+
+
+def downgrade():
+    """Drop the relevance_version index (SQLite keeps the column)."""
+    print("Dropping relevance version index...")
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS idx_relevance_version"))
+    print("  idx_relevance_version index dropped")
+
+    print("\nRelevance score downgrade completed.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        downgrade()
+    else:
+        upgrade()
@@ -0,0 +1,42 @@
+"""
+Migration: Add Snapshot Diversity
+Adds the context_snapshots.diversity_params column recording the MMR
+selection parameters and outcome for each synthesis context.
+"""
+
+from sqlalchemy import inspect, text
+
+from src.database.connection import engine
+
+
+def upgrade():
+    """Add diversity_params column to context_snapshots."""
+    print("Adding diversity parameters to context snapshots...")
+
+    columns = {col["name"] for col in inspect(engine).get_columns("context_snapshots")}
+    with engine.begin() as conn:
+        if "diversity_params" not in columns:
+            conn.execute(text("ALTER TABLE context_snapshots ADD COLUMN diversity_params JSON"))
+            print("  diversity_params column added")
+
+    print("\nSnapshot diversity migration completed.")
+
+
+def downgrade():
+    """Clear recorded parameters (SQLite keeps the column)."""
+    print("Clearing snapshot diversity parameters...")
+
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE context_snapshots SET diversity_params = NULL"))
+    print("  diversity_params values cleared")
+
+    print("\nSnapshot diversity downgrade completed.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        downgrade()
+    else:
+        upgrade()
@@ -0,0 +1,45 @@
+"""
+Migration: Add Story IDs
+Adds the articles.story_id column and index used for persistent
+cross-day story clusters built by the deduplicator.
+"""
+
+from sqlalchemy import inspect, text
+
+from src.database.connection import engine
+
+
+def upgrade():
+    """Add story_id column and index to articles."""
+    print("Adding story tracking to articles...")
+
+    columns = {col["name"] for col in inspect(engine).get_columns("articles")}
+    with engine.begin() as conn:
+        if "story_id" not in columns:
+            conn.execute(text("ALTER TABLE articles ADD COLUMN story_id INTEGER"))
+            print("  story_id column added")
+
+        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_story_id ON articles(story_id)"))
+        print("  idx_story_id index created")
+
+    print("\nStory tracking migration completed.")
+
+
+def downgrade():
+    """Drop the story_id index (SQLite keeps the column)."""
+    print("Dropping story tracking index...")
+
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS idx_story_id"))
+    print("  idx_story_id index dropped")
+
+    print("\nStory tracking downgrade completed.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        downgrade()
+    else:
+        upgrade()
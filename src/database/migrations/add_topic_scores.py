@@ -0,0 +1,56 @@
+"""
+Migration: Add Topic Scores
+Adds the article_topic_scores table used for SQL-side topic/scope curation,
+then scores existing unfiltered articles for the profile's location.
+"""
+
+from datetime import datetime
+
+from sqlalchemy.orm import sessionmaker
+
+from src.context.topic_scores import TopicScoreIndex
+from src.database.connection import engine
+from src.database.models import ArticleTopicScore
+from src.utils.profile_loader import get_user_profile
+
+
+def upgrade():
+    """Create article_topic_scores and backfill scores."""
+    print("Adding article topic scores...")
+
+    ArticleTopicScore.__table__.create(bind=engine, checkfirst=True)
+    print("  article_topic_scores table ready")
+
+    try:
+        user_location = get_user_profile().get_primary_location()
+    except FileNotFoundError:
+        print("  no user profile; articles will be scored on first curation")
+        return
+
+    session = sessionmaker(bind=engine, autoflush=False)()
+    try:
+        scored = TopicScoreIndex(user_location).score_unscored(session, datetime.min)
+        print(f"  {scored} articles scored")
+    finally:
+        session.close()
+
+    print("\nTopic score migration completed.")
+
+
+def downgrade():
+    """Drop the article_topic_scores table."""
+    print("Dropping article topic scores...")
+
+    ArticleTopicScore.__table__.drop(bind=engine, checkfirst=True)
+    print("  article_topic_scores table dropped")
+
+    print("\nTopic score downgrade completed.")
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == "down":
+        downgrade()
+    else:
+        upgrade()
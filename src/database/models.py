@@ -3,9 +3,11 @@ Optimized Database Models for Context Engineering
 Simplified schema focusing on context curation and synthesis outputs
 """
 
+import zlib
 from datetime import datetime
 
 from sqlalchemy import (
+    DDL,
     JSON,
     Boolean,
     Column,
@@ -14,11 +16,15 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
+    event,
+    func,
 )
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
 Base = declarative_base()
@@ -43,6 +49,36 @@ class RSSFeed(Base):
     articles = relationship("Article", back_populates="feed")
 
 
+def decompress_body(compressed_text: bytes) -> str:
+    """Normalized text from an article_bodies.compressed_text value"""
+    return zlib.decompress(compressed_text).decode("utf-8")
+
+
+class ArticleBody(Base):
+    """
+    Content-addressed article bodies
+    Normalized text stored once, compressed, and shared by every article carrying it
+    """
+
+    __tablename__ = "article_bodies"
+
+    id = Column(Integer, primary_key=True)
+    content_hash = Column(String(64), nullable=False, unique=True)  # SHA-256 of normalized text
+    compressed_text = Column(LargeBinary, nullable=False)  # zlib-compressed UTF-8
+    word_count = Column(Integer)
+    ref_count = Column(Integer, default=0)  # Articles referencing this body
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    articles = relationship("Article", back_populates="body")
+
+    @property
+    def text(self) -> str:
+        """Decompressed normalized text (cached per instance)"""
+        if getattr(self, "_text", None) is None:
+            self._text = decompress_body(self.compressed_text)
+        return self._text
+
+
 class Article(Base):
     """
     Articles from RSS feeds
@@ -63,30 +99,53 @@ class Article(Base):
     categories = Column(JSON)  # List of categories/tags from feed
 
     # Normalized content for context
-    normalized_content = Column(Text)  # Clean text without HTML
+    # Legacy inline text; new articles reference a shared ArticleBody instead
+    _normalized_content = Column("normalized_content", Text)  # Clean text without HTML
+    body_id = Column(Integer, ForeignKey("article_bodies.id"))
     word_count = Column(Integer)
     language = Column(String(10))
 
     # Context engineering fields
     entities = Column(JSON)  # Extracted entities (people, orgs, locations)
-    embedding_summary = Column(Text)  # AI-generated 2-3 sentence summary
-    relevance_score = Column(Float)  # Simple score: recency + user profile match
+    embedding_summary = Column(Text)  # Extractive summary of long articles (processors.summarizer)
+    relevance_score = Column(Float)  # Recency-decayed rank key (see context.relevance)
+    relevance_version = Column(String(16))  # RelevanceScorer.version the score was computed under
     last_included_in_synthesis = Column(DateTime)  # Track usage in context
 
     # Priority and deduplication fields
     priority_score = Column(Float)  # Used for article filtering/sorting
     priority_metadata = Column(JSON)  # Stores duplicate tracking info
     trend_metadata = Column(JSON)  # Trend-related metadata
+    story_id = Column(Integer)  # Root article id of the persistent duplicate story
 
     # Content filtering (user preference based)
     filtered = Column(Boolean, default=False)
     filter_reason = Column(String(200))
+    filter_version = Column(String(16))  # ContentFilter.version the article was evaluated under
 
     # Timestamps
     fetched_at = Column(DateTime, default=datetime.utcnow)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     feed = relationship("RSSFeed", back_populates="articles")
+    body = relationship("ArticleBody", back_populates="articles", lazy="select")
+
+    @hybrid_property
+    def normalized_content(self) -> str | None:
+        """Clean text without HTML, from the shared body when present"""
+        if self.body is not None:
+            return self.body.text
+        return self._normalized_content
+
+    @normalized_content.inplace.setter
+    def _normalized_content_setter(self, value: str | None):
+        self._normalized_content = value
+
+    @normalized_content.inplace.expression
+    @classmethod
+    def _normalized_content_expression(cls):
+        # Non-NULL whenever text is available inline or in the body store
+        return func.coalesce(cls._normalized_content, cls.body_id)
 
     __table_args__ = (
         UniqueConstraint("feed_id", "guid", name="_feed_guid_uc"),
@@ -94,6 +153,10 @@ class Article(Base):
         Index("idx_fetched_at", "fetched_at"),
         Index("idx_relevance_score", "relevance_score"),  # For context selection
         Index("idx_filtered", "filtered"),  # Quick filtering queries
+        Index("idx_filter_version", "filter_version"),  # Unevaluated/stale filter lookups
+        Index("idx_relevance_version", "relevance_version"),  # Unscored/stale relevance lookups
+        Index("idx_story_id", "story_id"),  # Story grouping and representative selection
+        Index("idx_body_id", "body_id"),  # Body reference counting
         # Composite indexes for critical query paths
         Index(
             "idx_articles_filtered_fetched", "filtered", "fetched_at"
@@ -104,6 +167,66 @@ class Article(Base):
     )
 
 
+class ArticleTopicScore(Base):
+    """
+    Ingest-time topic score for an article.
+    Topic rows hold the weighted keyword score, and one "meta"/"scored" row
+    per article marks it as scored (topics and places) for a user location.
+    """
+
+    __tablename__ = "article_topic_scores"
+
+    article_id = Column(Integer, ForeignKey("articles.id"), primary_key=True)
+    location_key = Column(String(200), primary_key=True, default="")  # "city|region|state"
+    dimension = Column(String(10), primary_key=True)  # topic, meta
+    name = Column(String(50), primary_key=True)
+    score = Column(Float, nullable=False)
+
+    __table_args__ = (
+        # Curation lookups: best articles for a topic at one location
+        Index("idx_topic_score_lookup", "location_key", "dimension", "name", "score"),
+    )
+
+
+class ArticlePlace(Base):
+    """
+    Gazetteer place mentioned by or implied for an article.
+    Scope filters resolve to sets of place ids and look articles up here.
+    """
+
+    __tablename__ = "article_places"
+
+    article_id = Column(Integer, ForeignKey("articles.id"), primary_key=True)
+    # Places depend on the user's location (home city, "Local News" categories)
+    location_key = Column(String(200), primary_key=True)
+    place_id = Column(String(100), primary_key=True)  # e.g. "us-va/fairfax-county"
+
+    __table_args__ = (Index("idx_article_place_lookup", "location_key", "place_id", "article_id"),)
+
+
+class ArticleVector(Base):
+    """
+    Hashed term-frequency embedding of an article (see context.vector_index).
+    The sparse unit vector is packed as uint16 slots followed by float32 weights.
+    """
+
+    __tablename__ = "article_vectors"
+
+    article_id = Column(Integer, ForeignKey("articles.id"), primary_key=True)
+    vector = Column(LargeBinary, nullable=False)
+    version = Column(String(20), nullable=False)  # EMBEDDING_VERSION the vector was built with
+
+
+# Full-text index over article text. FTS5 virtual tables have no ORM model;
+# rowid is the article id and rows are written at ingest by ArticleSearchIndex.
+ARTICLES_FTS_TABLE = "articles_fts"
+ARTICLES_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {ARTICLES_FTS_TABLE} "
+    "USING fts5(title, description, body, tokenize='porter unicode61 remove_diacritics 2')"
+)
+event.listen(Base.metadata, "after_create", DDL(ARTICLES_FTS_DDL).execute_if(dialect="sqlite"))
+
+
 class AnalysisRun(Base):
     """
     Execution tracking for synthesis runs
@@ -143,6 +266,7 @@ class NarrativeSynthesis(Base):
     # Synthesis output
     synthesis_data = Column(JSON)  # Full structured output from Claude
     executive_summary = Column(Text)  # Extracted for quick access
+    memory_digest = Column(JSON)  # Situation titles, actors, open questions for curation memory
 
     # Metadata
     articles_analyzed = Column(Integer)
@@ -174,6 +298,7 @@ class ContextSnapshot(Base):
     # Context metadata
     historical_summaries = Column(Text)  # Memory context included
     instructions = Column(Text)  # Instructions sent to Claude
+    diversity_params = Column(JSON)  # MMR selection parameters and outcome (context.diversity)
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
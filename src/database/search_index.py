@@ -0,0 +1,215 @@
+"""
+Article Search Index
+SQLite FTS5 full-text index over article title, description and normalized content
+"""
+
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, bindparam, inspect, text
+from sqlalchemy.orm import Query, Session, joinedload, selectinload
+from sqlalchemy.sql.elements import TextClause
+
+from src.database.models import ARTICLES_FTS_TABLE, Article
+from src.processors.keyword_automaton import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Keeps DELETE ... IN (...) lists well under SQLite's bound-parameter limit
+DELETE_BATCH_SIZE = 500
+
+# Articles loaded and indexed per batch when rebuilding
+INDEX_BATCH_SIZE = 5000
+
+
+def match_all(query_text: str) -> str:
+    """
+    FTS5 expression requiring every word of free text, with FTS syntax neutralized
+
+    Each word is quoted, so operators and punctuation in user input
+    ("C++", "AND", unbalanced quotes) are searched for rather than parsed.
+    """
+    return " ".join(f'"{token}"' for token in tokenize(query_text))
+
+
+def match_any(phrases: Iterable[str]) -> str:
+    """FTS5 expression matching any of the given phrases"""
+    quoted = sorted({" ".join(tokenize(phrase)) for phrase in phrases} - {""})
+    return " OR ".join(f'"{phrase}"' for phrase in quoted)
+
+
+class ArticleSearchIndex:
+    """
+    Keeps the articles_fts table in sync with articles and queries it
+
+    Rows are written at ingest rather than by triggers because normalized
+    content may live compressed in article_bodies, which SQLite cannot read.
+    The FTS rowid is the article id, so matches join straight back to
+    articles. Only SQLite databases have the index; on other backends
+    available() is False and callers fall back to their non-indexed path.
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+        self._available: bool | None = None
+
+    def available(self) -> bool:
+        """Whether the database has the FTS table (SQLite with the migration applied)"""
+        if self._available is None:
+            bind = self.session.get_bind()
+            self._available = bind.dialect.name == "sqlite" and inspect(bind).has_table(
+                ARTICLES_FTS_TABLE
+            )
+        return self._available
+
+    def index_articles(self, articles: Iterable[Article]) -> int:
+        """
+        Index (or re-index) articles, replacing any existing rows
+
+        Flushes but does not commit; callers commit with their own unit of work.
+
+        Returns:
+            Number of articles indexed
+        """
+        articles = [article for article in articles if article.id is not None]
+        if not articles or not self.available():
+            return 0
+
+        article_ids = [article.id for article in articles]
+        for start in range(0, len(article_ids), DELETE_BATCH_SIZE):
+            batch_ids = article_ids[start : start + DELETE_BATCH_SIZE]
+            placeholders = ", ".join(f":id{i}" for i in range(len(batch_ids)))
+            self.session.execute(
+                text(f"DELETE FROM {ARTICLES_FTS_TABLE} WHERE rowid IN ({placeholders})"),
+                {f"id{i}": article_id for i, article_id in enumerate(batch_ids)},
+            )
+
+        self.session.execute(
+            text(
+                f"INSERT INTO {ARTICLES_FTS_TABLE} (rowid, title, description, body) "
+                "VALUES (:id, :title, :description, :body)"
+            ),
+            [
+                {
+                    "id": article.id,
+                    "title": article.title or "",
+                    "description": article.description or "",
+                    "body": article.normalized_content or "",
+                }
+                for article in articles
+            ],
+        )
+        self.session.flush()
+        return len(articles)
+
+    def index_missing(self, since: datetime) -> int:
+        """
+        Index articles fetched since a cutoff that have no FTS row
+
+        Catches articles ingested before the table existed or by paths that
+        skip ingest-time indexing.
+        """
+        if not self.available():
+            return 0
+
+        indexed = text(f"SELECT rowid FROM {ARTICLES_FTS_TABLE}").columns(rowid=Integer)
+        missing = (
+            self.session.query(Article)
+            .options(selectinload(Article.body))
+            .filter(Article.fetched_at >= since, Article.id.not_in(indexed))
+            .all()
+        )
+        count = self.index_articles(missing)
+        self.session.commit()
+        if count:
+            logger.info(f"Indexed {count} articles for full-text search")
+        return count
+
+    def rebuild(self) -> int:
+        """Drop every FTS row and re-index all articles"""
+        if not self.available():
+            return 0
+
+        self.session.execute(text(f"DELETE FROM {ARTICLES_FTS_TABLE}"))
+        indexed = 0
+        last_id: int = 0
+        while True:
+            # Id-ordered batches bound memory; expunging detaches the caller's objects too
+            batch_ids = [
+                article_id
+                for (article_id,) in self.session.query(Article.id)
+                .filter(Article.id > last_id)
+                .order_by(Article.id)
+                .limit(INDEX_BATCH_SIZE)
+            ]
+            if not batch_ids:
+                break
+            batch = (
+                self.session.query(Article)
+                .options(selectinload(Article.body))
+                .filter(Article.id.in_(batch_ids))
+                .all()
+            )
+            indexed += self.index_articles(batch)
+            self.session.commit()
+            last_id = batch_ids[-1]
+            self.session.expunge_all()
+
+        logger.info(f"Rebuilt full-text index over {indexed} articles")
+        return indexed
+
+    def match(self, expression: str) -> TextClause:
+        """Ids of articles matching an FTS5 expression, for use in Article.id.in_()"""
+        return text(
+            f"SELECT rowid FROM {ARTICLES_FTS_TABLE} WHERE {ARTICLES_FTS_TABLE} MATCH :expression"
+        ).bindparams(expression=expression)
+
+    def restrict(self, query: Query, expression: str) -> Query:
+        """Restrict an Article query to articles matching an FTS5 expression"""
+        return query.filter(Article.id.in_(self.match(expression).columns(rowid=Integer)))
+
+    def search(
+        self, expression: str, since: datetime | None = None, limit: int = 20
+    ) -> list[Article]:
+        """
+        Articles matching an FTS5 expression, best bm25 rank first
+
+        Title matches weigh more than description matches, which weigh
+        more than body matches.
+        """
+        if not expression or not self.available():
+            return []
+
+        sql = (
+            f"SELECT {ARTICLES_FTS_TABLE}.rowid FROM {ARTICLES_FTS_TABLE} "
+            f"JOIN articles ON articles.id = {ARTICLES_FTS_TABLE}.rowid "
+            f"WHERE {ARTICLES_FTS_TABLE} MATCH :expression"
+        )
+        params: dict = {"expression": expression, "limit": limit}
+        if since is not None:
+            sql += " AND articles.fetched_at >= :since"
+            params["since"] = since
+        sql += f" ORDER BY bm25({ARTICLES_FTS_TABLE}, 10.0, 3.0, 1.0) LIMIT :limit"
+
+        statement = text(sql).bindparams(bindparam("since", type_=DateTime)) if since else text(sql)
+        article_ids = [row[0] for row in self.session.execute(statement, params)]
+        if not article_ids:
+            return []
+
+        articles = {
+            article.id: article
+            for article in self.session.query(Article)
+            .options(joinedload(Article.feed))
+            .filter(Article.id.in_(article_ids))
+        }
+        return [articles[article_id] for article_id in article_ids if article_id in articles]
+
+
+if __name__ == "__main__":
+    from src.database.connection import get_db
+
+    logging.basicConfig(level=logging.INFO)
+    db: Session
+    with get_db() as db:
+        ArticleSearchIndex(db).rebuild()
@@ -8,14 +8,27 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any
 
+from sqlalchemy import Integer, cast, func
 from sqlalchemy.orm import Session
 
+from ..context.article_records import ArticleRecord, load_article_records
 from ..context.curator import ContextCurator
+from ..context.relevance import RelevanceScorer, log_base_relevance
+from ..context.token_counter import truncate_to_tokens
+from ..context.topic_scores import TopicScoreIndex
+from ..context.vector_index import VectorIndex
 from ..database.connection import get_db
 from ..database.models import Article
+from ..utils.profiler import profile
 
 logger = logging.getLogger(__name__)
 
+# Length of one sampling stratum
+MONTH_DAYS = 30
+
+# log2 of the neutral relevance given to articles that have not been scored
+UNSCORED_LOG_RELEVANCE = -1.0
+
 
 class ForecastContextCurator(ContextCurator):
     """
@@ -58,15 +71,12 @@ class ForecastContextCurator(ContextCurator):
             # 1. Stratified article sampling (evenly distributed across time)
             lookback_months = min(horizon_months, 12)  # Cap at 12 months of history
             articles = self._get_stratified_articles(
-                session, months=lookback_months, articles_per_month=8
+                session,
+                months=lookback_months,
+                articles_per_month=8,
+                topic_filters=topic_filters,
             )
 
-            # Apply topic filters if provided
-            if topic_filters and self.topic_matcher and self.user_profile:
-                articles = self.topic_matcher.filter_articles(
-                    articles=articles, topic_filters=topic_filters, user_profile=self.user_profile
-                )
-
             logger.info(
                 f"Curated {len(articles)} stratified articles for {horizon_months}mo forecast"
             )
@@ -88,56 +98,111 @@ class ForecastContextCurator(ContextCurator):
             }
 
             # 5. Enforce forecast token budget
-            context = self._enforce_forecast_token_budget(context)
+            context = self._enforce_forecast_token_budget(context, articles)
 
             return context
 
     def _get_stratified_articles(
-        self, session: Session, months: int, articles_per_month: int
-    ) -> list[Article]:
+        self,
+        session: Session,
+        months: int,
+        articles_per_month: int,
+        topic_filters: dict | None = None,
+    ) -> list[ArticleRecord]:
         """
-        Get articles evenly distributed across time period (stratified sampling)
+        Get a representative sample of articles from each month (stratified sampling)
 
         This maintains temporal distribution within token budget.
         For 12 months lookback: 8 articles/month = 96 articles total
 
+        One windowed query ranks the unfiltered articles of each 30-day month:
+        sources take turns (the best article of every feed before the second
+        of any) and, within a turn, higher base relevance wins. Only the
+        sampled articles are loaded, as column-only records, so the cost
+        depends on the sample size rather than on rows loaded per month.
+
         Args:
             session: Database session
             months: Number of months to look back
             articles_per_month: Articles to sample per month
+            topic_filters: Optional topic/scope filters, applied in SQL before sampling
 
         Returns:
-            List of stratified articles
+            Stratified article records, newest month first and best first within a month
         """
-        all_articles = []
+        now = datetime.utcnow()
+        start_date = now - timedelta(days=MONTH_DAYS * months)
 
-        for month_offset in range(months):
-            # Define month window
-            end_date = datetime.utcnow() - timedelta(days=30 * month_offset)
-            start_date = end_date - timedelta(days=30)
-
-            # Query articles in this month
-            month_articles = (
-                session.query(Article)
-                .filter(
-                    Article.fetched_at >= start_date,
-                    Article.fetched_at < end_date,
-                    Article.filtered.is_(False),
-                )
-                .order_by(Article.fetched_at.desc())
-                .limit(articles_per_month)
-                .all()
+        query = session.query(Article).filter(
+            Article.fetched_at >= start_date,
+            Article.fetched_at < now,
+            Article.filtered.is_(False),
+        )
+
+        if self.user_profile:
+            score_index = TopicScoreIndex(self.user_profile.get_primary_location())
+            with profile("TOPIC_SCORE_BACKFILL"):
+                score_index.score_unscored(session, start_date)
+            with profile("VECTOR_BACKFILL"):
+                VectorIndex(session).index_missing(start_date)
+            with profile("RELEVANCE_REFRESH"):
+                RelevanceScorer(self.user_profile).refresh(session, start_date)
+            if topic_filters:
+                query = score_index.apply_filters(query, topic_filters).order_by(None)
+
+        month = cast(
+            (func.julianday(now) - func.julianday(Article.fetched_at)) / MONTH_DAYS, Integer
+        )
+        relevance = func.coalesce(log_base_relevance(), UNSCORED_LOG_RELEVANCE)
+        ranked = query.with_entities(
+            Article.id,
+            Article.fetched_at,
+            month.label("month"),
+            relevance.label("relevance"),
+            func.row_number()
+            .over(
+                partition_by=(month, Article.feed_id),
+                order_by=(relevance.desc(), Article.fetched_at.desc()),
+            )
+            .label("feed_turn"),
+        ).subquery()
+        sampled = session.query(
+            ranked.c.id,
+            ranked.c.month,
+            func.row_number()
+            .over(
+                partition_by=ranked.c.month,
+                order_by=(
+                    ranked.c.feed_turn,
+                    ranked.c.relevance.desc(),
+                    ranked.c.fetched_at.desc(),
+                ),
             )
+            .label("month_rank"),
+        ).subquery()
+        sample = (
+            session.query(sampled.c.id, sampled.c.month, sampled.c.month_rank)
+            .filter(sampled.c.month_rank <= articles_per_month)
+            .subquery()
+        )
 
-            all_articles.extend(month_articles)
+        articles = load_article_records(
+            session.query(Article)
+            .join(sample, sample.c.id == Article.id)
+            .order_by(sample.c.month, sample.c.month_rank)
+        )
 
+        for month_offset in range(months):
+            end_date = now - timedelta(days=MONTH_DAYS * month_offset)
+            month_start = end_date - timedelta(days=MONTH_DAYS)
+            count = sum(1 for a in articles if month_start <= a.fetched_at < end_date)
             logger.debug(
                 f"Month {month_offset + 1}/{months}: "
-                f"sampled {len(month_articles)} articles from {start_date.date()} to {end_date.date()}"
+                f"sampled {count} articles from {month_start.date()} to {end_date.date()}"
             )
 
-        logger.info(f"Stratified sampling: {len(all_articles)} articles across {months} months")
-        return all_articles
+        logger.info(f"Stratified sampling: {len(articles)} articles across {months} months")
+        return articles
 
     def _get_authoritative_data(self, _session: Session, _horizon_months: int) -> list:
         """Get authoritative data from external sources for forecasting.
@@ -147,7 +212,7 @@ class ForecastContextCurator(ContextCurator):
         """
         return []
 
-    def _get_forecast_memory(self, session: Session, _articles: list[Article]) -> str:
+    def _get_forecast_memory(self, session: Session, _articles: list[ArticleRecord]) -> str:
         """
         Get historical memory relevant to forecasting
 
@@ -239,23 +304,21 @@ Return structured JSON with all 5 analysis types as specified in the forecast en
 
         return instructions
 
-    def _enforce_forecast_token_budget(self, context: dict[str, Any]) -> dict[str, Any]:
+    def _enforce_forecast_token_budget(
+        self, context: dict[str, Any], records: list[ArticleRecord]
+    ) -> dict[str, Any]:
         """
         Enforce forecast-specific token budget
 
         Args:
             context: Raw context dictionary
+            records: The records context["articles"] was formatted from, in the same order
 
         Returns:
             Budget-compliant context
         """
-        # Estimate token counts (rough: 1 token ≈ 4 characters)
-        estimated_tokens = {}
-        for key, value in context.items():
-            if isinstance(value, str):
-                estimated_tokens[key] = len(value) // 4
-            else:
-                estimated_tokens[key] = len(str(value)) // 4
+        counter = self.token_counter
+        estimated_tokens = {key: counter.count_value(value) for key, value in context.items()}
 
         total_estimated = sum(estimated_tokens.values())
         budget_limit = (
@@ -272,9 +335,9 @@ Return structured JSON with all 5 analysis types as specified in the forecast en
 
             # Compression priority: articles first, then authoritative, then memory
             if estimated_tokens.get("articles", 0) > self.FORECAST_TOKEN_BUDGET["articles"]:
-                # Truncate article content
-                context["articles"] = self._compress_text(
-                    context["articles"], self.FORECAST_TOKEN_BUDGET["articles"]
+                months = [(datetime.utcnow() - r.fetched_at).days // MONTH_DAYS for r in records]
+                context["articles"] = self._fit_articles(
+                    context["articles"], months, self.FORECAST_TOKEN_BUDGET["articles"]
                 )
 
             if (
@@ -295,6 +358,42 @@ Return structured JSON with all 5 analysis types as specified in the forecast en
 
         return context
 
+    def _fit_articles(
+        self, articles: list[dict[str, Any]], months: list[int], target_tokens: int
+    ) -> list[dict[str, Any]]:
+        """
+        Trim articles to the budget round-robin across months
+
+        The lowest-ranked article of the month with the most articles left is
+        dropped first, so every month keeps its best articles as long as it can.
+
+        Args:
+            articles: Formatted articles, best first within each month
+            months: Month index of each article
+            target_tokens: Target token count
+
+        Returns:
+            Articles that fit, in their original order
+        """
+        costs = [self.token_counter.count_article(article) + 1 for article in articles]
+        used = 1 + sum(costs)  # List brackets
+
+        by_month: dict[int, list[int]] = {}
+        for index, month in enumerate(months):
+            by_month.setdefault(month, []).append(index)
+
+        dropped = set()
+        while used > target_tokens and len(dropped) < len(articles):
+            # Largest month first; ties go to the older month
+            month = max(by_month, key=lambda m: (len(by_month[m]), m))
+            index = by_month[month].pop()
+            dropped.add(index)
+            used -= costs[index]
+
+        kept = [article for index, article in enumerate(articles) if index not in dropped]
+        logger.info(f"Reduced forecast articles from {len(articles)} to {len(kept)}")
+        return kept
+
     def _compress_text(self, text: str, target_tokens: int) -> str:
         """
         Compress text to fit token budget
@@ -306,9 +405,8 @@ Return structured JSON with all 5 analysis types as specified in the forecast en
         Returns:
             Compressed text
         """
-        target_chars = target_tokens * 4  # Rough conversion
-        if len(text) <= target_chars:
+        if self.token_counter.count_text(text) <= target_tokens:
             return text
 
         # Simple truncation (could be enhanced with smarter compression)
-        return text[:target_chars] + "\n\n[...truncated for token budget...]"
+        return truncate_to_tokens(text, target_tokens) + "\n\n[...truncated for token budget...]"
@@ -22,14 +22,16 @@ class ForecastEngine:
     - Unknown Unknowns: Conjecture based on some evidence (weak signals)
     """
 
-    def __init__(self, claude_client: ClaudeClient | None = None):
+    def __init__(self, claude_client: ClaudeClient | None = None, batch_mode: bool = False):
         """
         Initialize forecast engine
 
         Args:
             claude_client: Optional ClaudeClient instance (creates new if not provided)
+            batch_mode: Send the forecast request as a Message Batch
         """
         self.client = claude_client or ClaudeClient()
+        self.batch_mode = batch_mode
 
     async def generate_forecast(self, context: dict[str, Any]) -> dict[str, Any]:
         """
@@ -49,7 +51,7 @@ class ForecastEngine:
         # Send to Claude
         try:
             response = await self.client.analyze_with_context(
-                context=context, task=task, temperature=1.0
+                context=context, task=task, temperature=1.0, batch=self.batch_mode
             )
 
             # Parse JSON response
@@ -7,6 +7,8 @@ import logging
 from datetime import datetime
 from typing import Any
 
+from ..config.settings import settings
+from ..context.token_counter import get_token_counter
 from ..database.connection import get_db
 from ..database.models import ForecastRun, LongTermForecast
 from .context_curator import ForecastContextCurator
@@ -37,7 +39,7 @@ class ForecastOrchestrator:
         """
         self.user_profile = user_profile
         self.topic_filters = topic_filters
-        self.engine = ForecastEngine()
+        self.engine = ForecastEngine(batch_mode=settings.claude_batch_mode)
         self.curator = ForecastContextCurator(
             user_profile=user_profile, topic_filters=topic_filters
         )
@@ -133,7 +135,7 @@ class ForecastOrchestrator:
                 target_date=base_date,  # Individual forecasts have their own timelines
                 forecast_data=forecast_data,
                 articles_analyzed=context.get("article_count", 0),
-                context_tokens=len(str(context)) // 4,
+                context_tokens=get_token_counter().count_context(context),
             )
             session.add(forecast)
             session.commit()
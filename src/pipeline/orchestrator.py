@@ -9,9 +9,13 @@ from datetime import UTC, datetime
 from typing import Any
 
 from src.config.settings import settings
+from src.context.relevance import RelevanceScorer
 from src.context.synthesizer import NarrativeSynthesizer
+from src.context.topic_scores import TopicScoreIndex
+from src.context.vector_index import VectorIndex
 from src.processors.content_filter import ContentFilter
 from src.processors.deduplicator import run_deduplication
+from src.processors.summarizer import summarize_missing
 from src.rss.parallel_fetcher import fetch_all_active_feeds
 from src.utils.profile_loader import get_user_profile
 from src.utils.profiler import get_profiler, profile
@@ -226,6 +230,9 @@ class PipelineOrchestrator:
         """Run content filtering stage"""
         from datetime import timedelta
 
+        from sqlalchemy import or_
+        from sqlalchemy.orm import selectinload
+
         from src.database.connection import get_db_session
         from src.database.models import Article
 
@@ -238,16 +245,26 @@ class PipelineOrchestrator:
                 logger.error(f"User profile not found: {e}")
                 return {"skipped": True, "reason": "User profile not found", "error": str(e)}
 
-        # Get recent unfiltered articles
+        # Get recent articles
         session = get_db_session()
         try:
             cutoff_time = datetime.now(UTC) - timedelta(hours=self.dedup_hours)
 
+            # Backfill summaries for recent articles stored before fetch-time summarizing
+            with profile("SUMMARY_BACKFILL"):
+                summarized_count = summarize_missing(session, since=cutoff_time)
+
+            # Articles not yet evaluated under the current filter configuration,
+            # including ones earlier rules filtered out that the new rules may keep
             articles = (
                 session.query(Article)
+                .options(selectinload(Article.body))
                 .filter(
                     Article.created_at >= cutoff_time,
-                    Article.filtered.is_(False),  # Only unfiltered articles
+                    or_(
+                        Article.filter_version.is_(None),
+                        Article.filter_version != self.content_filter.version,
+                    ),
                 )
                 .all()
             )
@@ -269,6 +286,24 @@ class PipelineOrchestrator:
 
             # Get statistics
             stats = self.content_filter.get_filter_stats(articles)
+            stats["summarized_count"] = summarized_count
+
+            # Score kept articles for every topic/scope so curation can filter in SQL
+            user_profile = self.content_filter.user_profile
+            score_index = TopicScoreIndex(
+                user_profile.get_primary_location() if user_profile else None
+            )
+            with profile("TOPIC_SCORING"):
+                stats["topic_scored_count"] = score_index.score_articles(session, kept)
+
+            with profile("VECTOR_INDEXING"):
+                stats["vector_indexed_count"] = VectorIndex(session).index_articles(kept)
+
+            # Relevance reads the stored topic scores, places and vectors, so it runs last
+            with profile("RELEVANCE_SCORING"):
+                stats["relevance_scored_count"] = RelevanceScorer(user_profile).score_articles(
+                    session, [article.id for article in kept]
+                )
 
             logger.info(
                 f"Content filtering: {stats['filtered_count']}/{stats['total_articles']} filtered ({stats['filter_rate']:.1%})"
@@ -289,7 +324,9 @@ class PipelineOrchestrator:
         Pass 2: Examined narratives for clusters with 3+ articles,
                 thin coverage summaries for the rest.
         """
-        synthesizer = NarrativeSynthesizer(topic_filters=self.topic_filters)
+        synthesizer = NarrativeSynthesizer(
+            topic_filters=self.topic_filters, batch_mode=settings.claude_batch_mode
+        )
         return await synthesizer.synthesize(hours=self.prioritize_hours, max_articles=50)
 
     def _generate_summary(self, results: dict[str, Any]) -> dict[str, Any]:
@@ -0,0 +1,114 @@
+"""
+Article Body Store
+Content-addressed, compressed storage for normalized article text
+"""
+
+import hashlib
+import logging
+import zlib
+
+from sqlalchemy import bindparam, func, update
+from sqlalchemy.orm import Session
+
+from src.database.models import Article, ArticleBody
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_LEVEL = 6
+
+
+def hash_text(text: str) -> str:
+    """Content address for a normalized body"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class BodyStore:
+    """
+    Interns normalized article text within a database session
+
+    Identical bodies (syndicated wire copy, press releases carried by several
+    feeds) resolve to one ArticleBody row whose ref_count tracks how many
+    articles reference it.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        # Bodies seen in this session, including new ones not yet flushed (autoflush is off)
+        self._bodies: dict[str, ArticleBody] = {}
+
+    def intern(self, text: str) -> tuple[ArticleBody | None, bool]:
+        """
+        Get or create the shared body for a normalized text and take a reference
+
+        Returns:
+            (body, created) - body is None for empty text
+        """
+        if not text:
+            return None, False
+
+        content_hash = hash_text(text)
+        body = self._bodies.get(content_hash)
+        if body is None:
+            body = (
+                self.db.query(ArticleBody).filter(ArticleBody.content_hash == content_hash).first()
+            )
+
+        if body is None:
+            body = ArticleBody(
+                content_hash=content_hash,
+                compressed_text=zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL),
+                word_count=len(text.split()),
+                ref_count=1,
+            )
+            self.db.add(body)
+            self._bodies[content_hash] = body
+            return body, True
+
+        self._bodies[content_hash] = body
+        if body.id is None:
+            body.ref_count += 1
+        else:
+            # SQL-side increment so concurrent sessions do not lose references
+            self.db.query(ArticleBody).filter(ArticleBody.id == body.id).update(
+                {ArticleBody.ref_count: ArticleBody.ref_count + 1}, synchronize_session=False
+            )
+        return body, False
+
+    def recount(self) -> dict[str, int]:
+        """
+        Recompute reference counts from the articles table and drop orphaned bodies
+
+        Run after bulk deletes (e.g. retention) that bypass intern().
+        """
+        counts = dict(
+            self.db.query(Article.body_id, func.count(Article.id))
+            .filter(Article.body_id.isnot(None))
+            .group_by(Article.body_id)
+            .all()
+        )
+
+        # Compare on columns only so compressed text is never loaded
+        corrections = [
+            {"body_id": body_id, "ref_count": counts.get(body_id, 0)}
+            for body_id, ref_count in self.db.query(ArticleBody.id, ArticleBody.ref_count)
+            if ref_count != counts.get(body_id, 0)
+        ]
+        if corrections:
+            bodies = ArticleBody.__table__
+            self.db.execute(
+                update(bodies)
+                .where(bodies.c.id == bindparam("body_id"))
+                .values(ref_count=bindparam("ref_count")),
+                corrections,
+            )
+        updated = len(corrections)
+
+        removed = (
+            self.db.query(ArticleBody)
+            .filter(ArticleBody.ref_count <= 0)
+            .delete(synchronize_session=False)
+        )
+        self.db.commit()
+
+        logger.info(f"Body store recount: {updated} counts corrected, {removed} orphans removed")
+        return {"counts_corrected": updated, "orphans_removed": removed}
@@ -5,12 +5,20 @@ Filters articles based on user preferences (sports, clickbait, etc.)
 Uses hybrid approach: keyword matching + NLP heuristics
 """
 
+import hashlib
+import json
 import re
+from functools import lru_cache
+
+from src.processors.keyword_automaton import KeywordAutomaton, tokenize
 
 
 class ContentFilter:
     """Filter articles based on user profile content preferences"""
 
+    # Bump when should_filter logic changes in ways the keyword sets don't capture
+    RULES_REVISION = 1
+
     # Sports keywords - only highly specific terms with no dual-use
     SPORTS_KEYWORDS = {
         # League names (highly specific)
@@ -88,6 +96,11 @@ class ContentFilter:
         "box office",
     }
 
+    # Clickbait number patterns, matched against the lowercased title
+    CLICKBAIT_NUMBER_PATTERN = re.compile(
+        r"\d+ (reasons|ways|things|tips|tricks)|number \d+|#\d+ will"
+    )
+
     def __init__(self, user_profile=None):
         """
         Initialize content filter
@@ -101,6 +114,12 @@ class ContentFilter:
         if user_profile:
             self.excluded_topics = [topic.lower() for topic in user_profile.get_excluded_topics()]
 
+        # All keyword sets compiled once per profile into one automaton
+        self.automaton = _compile_automaton(tuple(self.excluded_topics))
+
+        # Articles evaluated under this version are not evaluated again
+        self.version = _config_version(tuple(self.excluded_topics))
+
     def should_filter(
         self, title: str, description: str = "", _content: str = ""
     ) -> tuple[bool, str | None]:
@@ -115,98 +134,96 @@ class ContentFilter:
         Returns:
             Tuple of (should_filter: bool, reason: str)
         """
-        # Combine text for analysis
-        text = f"{title} {description}".lower()
+        hits = self._keyword_hits(title, description)
 
         # Check user-specified excluded topics first
         for topic in self.excluded_topics:
-            if topic in text:
+            if topic in hits.get("excluded_topic", ()):
                 return True, f"excluded_topic:{topic}"
 
-        # Check for sports content
-        if self._is_sports_content(text):
+        # Threshold: 2+ sports keywords = likely sports content
+        if len(hits.get("sports", ())) >= 2:
             return True, "sports"
 
-        # Check for clickbait
-        if self._is_clickbait(title):
+        if hits.get("clickbait") or self._clickbait_heuristics(title):
             return True, "clickbait"
 
-        # Check for entertainment/celebrity content
-        if self._is_entertainment_content(text):
+        # Threshold: 1+ entertainment keywords = likely entertainment content
+        if hits.get("entertainment"):
             return True, "entertainment"
 
         return False, None
 
-    def _is_sports_content(self, text: str) -> bool:
+    def match_categories(self, title: str, description: str = "") -> dict[str, set[str]]:
         """
-        Detect sports content using keyword matching
+        Collect every category hit for an article
 
         Args:
-            text: Lowercased text to analyze
+            title: Article title
+            description: Article description/summary
 
         Returns:
-            True if sports content detected
+            Dict mapping category ("excluded_topic", "sports", "clickbait",
+            "entertainment") to the keywords or heuristics that matched
         """
-        # Count sports keyword matches
-        matches = sum(1 for keyword in self.SPORTS_KEYWORDS if keyword in text)
-
-        # Threshold: 2+ sports keywords = likely sports content
-        return matches >= 2
-
-    def _is_clickbait(self, title: str) -> bool:
+        hits = self._keyword_hits(title, description)
+
+        heuristics = self._clickbait_heuristics(title)
+        if heuristics:
+            hits.setdefault("clickbait", set()).update(heuristics)
+
+        return hits
+
+    def _keyword_hits(self, title: str, description: str) -> dict[str, set[str]]:
+        """Run the automaton once over title and description"""
+        hits: dict[str, set[str]] = {}
+        title_length = None
+        for category, keyword, _start, end in self.automaton.find(
+            tokenize(f"{title} {description}")
+        ):
+            # Clickbait phrases only count in the title
+            if category == "clickbait":
+                if title_length is None:
+                    title_length = len(tokenize(title))
+                if end > title_length:
+                    continue
+            hits.setdefault(category, set()).add(keyword)
+        return hits
+
+    def _clickbait_heuristics(self, title: str) -> list[str]:
         """
-        Detect clickbait using keywords + heuristics
+        Detect clickbait title heuristics
 
         Args:
             title: Article title
 
         Returns:
-            True if clickbait detected
+            Names of the heuristics that fired
         """
-        title_lower = title.lower()
-
-        # Check for clickbait keywords
-        for keyword in self.CLICKBAIT_KEYWORDS:
-            if keyword in title_lower:
-                return True
+        fired = []
 
         # Heuristic: Excessive punctuation
         if title.count("!") >= 2 or title.count("?") >= 2:
-            return True
+            fired.append("heuristic:punctuation")
 
         # Heuristic: ALL CAPS words (excluding acronyms)
-        words = title.split()
-        all_caps_words = [w for w in words if w.isupper() and len(w) > 3]
+        all_caps_words = [w for w in title.split() if w.isupper() and len(w) > 3]
         if len(all_caps_words) >= 2:
-            return True
+            fired.append("heuristic:all_caps")
 
         # Heuristic: Numbers in clickbait patterns
-        clickbait_number_patterns = [
-            r"\d+ (reasons|ways|things|tips|tricks)",
-            r"number \d+",
-            r"#\d+ will",
-        ]
-        return any(re.search(pattern, title_lower) for pattern in clickbait_number_patterns)
-
-    def _is_entertainment_content(self, text: str) -> bool:
-        """
-        Detect entertainment/celebrity content
-
-        Args:
-            text: Lowercased text to analyze
-
-        Returns:
-            True if entertainment content detected
-        """
-        matches = sum(1 for keyword in self.ENTERTAINMENT_KEYWORDS if keyword in text)
+        if self.CLICKBAIT_NUMBER_PATTERN.search(title.lower()):
+            fired.append("heuristic:number_pattern")
 
-        # Threshold: 1+ entertainment keywords = likely entertainment content
-        return matches >= 1
+        return fired
 
     def filter_articles(self, articles: list) -> tuple[list, list]:
         """
         Filter a list of articles, marking filtered ones
 
+        Every article is stamped with the filter version it was evaluated under;
+        articles the current rules keep are cleared of any earlier filter mark.
+
         Args:
             articles: List of Article objects (SQLAlchemy models)
 
@@ -222,12 +239,15 @@ class ContentFilter:
             content = article.normalized_content or ""
 
             should_filter, reason = self.should_filter(title, description, content)
+            article.filter_version = self.version
 
             if should_filter:
                 article.filtered = True
                 article.filter_reason = reason
                 filtered.append(article)
             else:
+                article.filtered = False
+                article.filter_reason = None
                 kept.append(article)
 
         return kept, filtered
@@ -259,3 +279,30 @@ class ContentFilter:
             "filter_rate": filtered_count / total if total > 0 else 0,
             "reasons": reasons,
         }
+
+
+@lru_cache(maxsize=16)
+def _compile_automaton(excluded_topics: tuple[str, ...]) -> KeywordAutomaton:
+    """Build the keyword automaton for a set of excluded topics (shared across instances)"""
+    return KeywordAutomaton(
+        {
+            "excluded_topic": set(excluded_topics),
+            "sports": ContentFilter.SPORTS_KEYWORDS,
+            "clickbait": ContentFilter.CLICKBAIT_KEYWORDS,
+            "entertainment": ContentFilter.ENTERTAINMENT_KEYWORDS,
+        }
+    )
+
+
+@lru_cache(maxsize=16)
+def _config_version(excluded_topics: tuple[str, ...]) -> str:
+    """Short hash of everything that decides should_filter for a profile"""
+    config = {
+        "revision": ContentFilter.RULES_REVISION,
+        "excluded_topics": sorted(excluded_topics),
+        "sports": sorted(ContentFilter.SPORTS_KEYWORDS),
+        "clickbait": sorted(ContentFilter.CLICKBAIT_KEYWORDS),
+        "entertainment": sorted(ContentFilter.ENTERTAINMENT_KEYWORDS),
+        "number_pattern": ContentFilter.CLICKBAIT_NUMBER_PATTERN.pattern,
+    }
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()[:16]
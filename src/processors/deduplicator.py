@@ -5,16 +5,31 @@ Identifies and handles duplicate articles across different RSS feeds
 
 import hashlib
 import logging
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 
-from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, and_
+from sqlalchemy.orm import Query, Session, selectinload
 
 from src.database.connection import get_db
-from src.database.models import Article
+from src.database.models import Article, ArticleBody, decompress_body
+from src.processors.story_tracker import StoryTracker
 
 logger = logging.getLogger(__name__)
 
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+DEDUP_BATCH_SIZE = 500
+
+
+def _fetched_order(row: Row) -> tuple[datetime, int]:
+    """Sort key putting the earliest fetched article first"""
+    return row.fetched_at or datetime.min, row.id
+
+
+def _is_marked(priority_metadata: dict | None) -> bool:
+    """Whether an article was already marked as a duplicate"""
+    return bool(priority_metadata and priority_metadata.get("is_duplicate"))
+
 
 class ArticleDeduplicator:
     """Handles detection and management of duplicate articles"""
@@ -22,6 +37,7 @@ class ArticleDeduplicator:
     def __init__(self, similarity_threshold: float = 0.85, time_window_hours: int = 72):
         self.similarity_threshold = similarity_threshold
         self.time_window_hours = time_window_hours
+        self.story_tracker = StoryTracker()
 
     def generate_content_hash(self, title: str, content: str) -> str:
         """Generate a hash for article content for exact duplicate detection"""
@@ -73,12 +89,14 @@ class ArticleDeduplicator:
         if not hasattr(article, "_content_hash"):
             article._content_hash = content_hash
 
-        # Look for articles with same content hash within time window
+        # Look for articles with same content within time window
         time_cutoff = datetime.utcnow() - timedelta(hours=self.time_window_hours)
 
-        # Much more efficient: limit the query and only get necessary fields
+        # Titles are part of the hash, so only same-title candidates need their text loaded
+        normalized_title = self._normalize_text(article.title)
+
         candidates = (
-            db.query(Article.id, Article.title, Article.normalized_content, Article.fetched_at)
+            db.query(Article.id, Article.title)
             .filter(
                 and_(
                     Article.id != article.id,
@@ -91,19 +109,27 @@ class ArticleDeduplicator:
             .all()
         )  # Reasonable limit to prevent runaway queries
 
-        # Check content hash for each candidate
-        exact_duplicates = []
-        for candidate_data in candidates:
-            candidate_hash = self.generate_content_hash(
-                candidate_data.title, candidate_data.normalized_content
-            )
-            if candidate_hash == content_hash:
-                # Get full article object only for matches
-                full_candidate = db.query(Article).filter(Article.id == candidate_data.id).first()
-                if full_candidate:
-                    exact_duplicates.append(full_candidate)
+        matched_ids = [
+            candidate.id
+            for candidate in candidates
+            if self._normalize_text(candidate.title) == normalized_title
+        ]
+        if not matched_ids:
+            return []
 
-        return exact_duplicates
+        # Full articles only for title matches, compared on the same hash as stage 2
+        matches = (
+            db.query(Article)
+            .options(selectinload(Article.body))
+            .filter(Article.id.in_(matched_ids))
+            .all()
+        )
+        return [
+            candidate
+            for candidate in matches
+            if self.generate_content_hash(candidate.title, candidate.normalized_content)
+            == content_hash
+        ]
 
     def find_near_duplicates(self, article: Article, db: Session) -> list[Article]:
         """Find near-duplicates based on title similarity and URL"""
@@ -186,6 +212,9 @@ class ArticleDeduplicator:
         # Lower priority score for duplicates
         duplicate_article.priority_score = 0.1
 
+        # Record the edge so both articles end up in the same persistent story
+        self.story_tracker.add_edge(original_article.id, duplicate_article.id)
+
         logger.debug(f"Marked article {duplicate_article.id} as duplicate of {original_article.id}")
 
     def _is_exact_duplicate(self, article1: Article, article2: Article) -> bool:
@@ -205,6 +234,28 @@ class ArticleDeduplicator:
 
         return hash1 == hash2 and hash1 != ""
 
+    @staticmethod
+    def _rows_in_batches(query: Query, article_ids: list[int]) -> Iterator[Row]:
+        """Run a column query over article ids in IN-list sized chunks"""
+        for start in range(0, len(article_ids), DEDUP_BATCH_SIZE):
+            yield from query.filter(Article.id.in_(article_ids[start : start + DEDUP_BATCH_SIZE]))
+
+    def _mark_pairs(self, db: Session, pairs: list[tuple[int, int]]):
+        """Mark (original id, duplicate id) pairs, loading only the articles involved"""
+        pairs_per_batch = DEDUP_BATCH_SIZE // 2
+        for start in range(0, len(pairs), pairs_per_batch):
+            batch = pairs[start : start + pairs_per_batch]
+            batch_ids = {article_id for pair in batch for article_id in pair}
+            articles = {
+                article.id: article
+                for article in db.query(Article)
+                .options(selectinload(Article.body))
+                .filter(Article.id.in_(batch_ids))
+            }
+            for original_id, duplicate_id in batch:
+                self.mark_as_duplicate(articles[original_id], articles[duplicate_id], db)
+            db.flush()
+
     def _stage1_url_duplicates(
         self, db: Session, unprocessed_ids: list[int], _time_cutoff: datetime
     ) -> dict[str, int]:
@@ -212,39 +263,36 @@ class ArticleDeduplicator:
         Stage 1: Quick URL duplicate detection - instant wins
         Groups articles by URL and marks later ones as duplicates
         """
-        # Get all articles with URLs in a single query
-        articles_with_urls = (
-            db.query(Article)
-            .filter(
-                and_(Article.id.in_(unprocessed_ids), Article.url.isnot(None), Article.url != "")
-            )
-            .order_by(Article.fetched_at.asc())
-            .all()
+        # Group on columns only; full articles are loaded just for the duplicates
+        rows = self._rows_in_batches(
+            db.query(Article.id, Article.url, Article.fetched_at, Article.priority_metadata).filter(
+                Article.url.isnot(None), Article.url != ""
+            ),
+            unprocessed_ids,
         )
 
-        # Group by URL and mark duplicates
-        url_groups = {}
-        for article in articles_with_urls:
-            if article.url not in url_groups:
-                url_groups[article.url] = []
-            url_groups[article.url].append(article)
+        # Group by URL, earliest first
+        url_groups: dict[str, list[Row]] = {}
+        for row in sorted(rows, key=_fetched_order):
+            url_groups.setdefault(row.url, []).append(row)
 
-        url_duplicates = 0
-        for _url, articles in url_groups.items():
-            if len(articles) > 1:
+        pairs = []
+        for group in url_groups.values():
+            if len(group) > 1:
                 # Keep the earliest, mark others as duplicates
-                original = articles[0]
-                for duplicate in articles[1:]:
+                original = group[0]
+                for duplicate in group[1:]:
                     # Skip if already marked as duplicate
-                    if duplicate.priority_metadata and duplicate.priority_metadata.get(
-                        "is_duplicate"
-                    ):
+                    if _is_marked(duplicate.priority_metadata):
                         continue
-                    self.mark_as_duplicate(original, duplicate, db)
-                    unprocessed_ids.remove(duplicate.id)  # Remove from further processing
-                    url_duplicates += 1
+                    pairs.append((original.id, duplicate.id))
+        self._mark_pairs(db, pairs)
+
+        # Remove from further processing in one pass
+        duplicate_ids = {duplicate_id for _original_id, duplicate_id in pairs}
+        unprocessed_ids[:] = [i for i in unprocessed_ids if i not in duplicate_ids]
 
-        return {"url_duplicates": url_duplicates}
+        return {"url_duplicates": len(pairs)}
 
     def _stage2_exact_duplicates(
         self, db: Session, unprocessed_ids: list[int], _time_cutoff: datetime
@@ -253,45 +301,47 @@ class ArticleDeduplicator:
         Stage 2: Exact content hash matches - fast hash-based detection
         Only processes articles that survived Stage 1
         """
-        # Get articles that need content hash comparison
-        remaining_articles = (
-            db.query(Article)
-            .filter(
-                and_(
-                    Article.id.in_(unprocessed_ids),
-                    Article.title.isnot(None),
-                    Article.normalized_content.isnot(None),
-                )
+        # Hash each chunk as it arrives so only digests are held, not text
+        rows = self._rows_in_batches(
+            db.query(
+                Article.id,
+                Article.title,
+                Article.fetched_at,
+                Article.priority_metadata,
+                Article._normalized_content,
+                ArticleBody.compressed_text,
             )
-            .order_by(Article.fetched_at.asc())
-            .all()
+            .outerjoin(ArticleBody, ArticleBody.id == Article.body_id)
+            .filter(Article.title.isnot(None), Article.normalized_content.isnot(None)),
+            unprocessed_ids,
         )
 
-        # Group by content hash
-        hash_groups = {}
-        for article in remaining_articles:
+        hashed = []
+        for article_id, title, fetched_at, metadata, inline_text, compressed_text in rows:
             # Skip if already marked as duplicate
-            if article.priority_metadata and article.priority_metadata.get("is_duplicate"):
+            if _is_marked(metadata):
                 continue
-
-            content_hash = self.generate_content_hash(article.title, article.normalized_content)
+            content = decompress_body(compressed_text) if compressed_text else inline_text
+            content_hash = self.generate_content_hash(title, content)
             if content_hash:
-                if content_hash not in hash_groups:
-                    hash_groups[content_hash] = []
-                hash_groups[content_hash].append(article)
+                hashed.append((fetched_at or datetime.min, article_id, content_hash))
 
-        exact_duplicates = 0
-        for _content_hash, articles in hash_groups.items():
-            if len(articles) > 1:
+        # Group by content hash, earliest first
+        hash_groups: dict[str, list[int]] = {}
+        for _fetched_at, article_id, content_hash in sorted(hashed):
+            hash_groups.setdefault(content_hash, []).append(article_id)
+
+        pairs = []
+        for group in hash_groups.values():
+            if len(group) > 1:
                 # Keep the earliest, mark others as duplicates
-                original = articles[0]
-                for duplicate in articles[1:]:
-                    self.mark_as_duplicate(original, duplicate, db)
-                    if duplicate.id in unprocessed_ids:
-                        unprocessed_ids.remove(duplicate.id)  # Remove from further processing
-                    exact_duplicates += 1
+                pairs.extend((group[0], duplicate_id) for duplicate_id in group[1:])
+        self._mark_pairs(db, pairs)
+
+        duplicate_ids = {duplicate_id for _original_id, duplicate_id in pairs}
+        unprocessed_ids[:] = [i for i in unprocessed_ids if i not in duplicate_ids]
 
-        return {"exact_duplicates": exact_duplicates}
+        return {"exact_duplicates": len(pairs)}
 
     def _stage3_title_similarity(
         self, db: Session, unprocessed_ids: list[int], _time_cutoff: datetime
@@ -300,37 +350,32 @@ class ArticleDeduplicator:
         Stage 3: Title similarity analysis - slowest but most thorough
         Only processes articles that survived Stages 1 & 2
         """
-        # Get remaining articles that need title similarity comparison
-        remaining_articles = (
-            db.query(Article)
-            .filter(and_(Article.id.in_(unprocessed_ids), Article.title.isnot(None)))
-            .order_by(Article.fetched_at.asc())
-            .all()
+        rows = self._rows_in_batches(
+            db.query(
+                Article.id, Article.title, Article.fetched_at, Article.priority_metadata
+            ).filter(Article.title.isnot(None)),
+            unprocessed_ids,
         )
 
-        # Group by title hash for similarity detection
-        title_hash_groups = {}
-        for article in remaining_articles:
+        # Group by title hash for similarity detection, earliest first
+        title_hash_groups: dict[str, list[int]] = {}
+        for row in sorted(rows, key=_fetched_order):
             # Skip if already marked as duplicate
-            if article.priority_metadata and article.priority_metadata.get("is_duplicate"):
+            if _is_marked(row.priority_metadata):
                 continue
 
-            title_hash = self.generate_title_hash(article.title)
+            title_hash = self.generate_title_hash(row.title)
             if title_hash:
-                if title_hash not in title_hash_groups:
-                    title_hash_groups[title_hash] = []
-                title_hash_groups[title_hash].append(article)
+                title_hash_groups.setdefault(title_hash, []).append(row.id)
 
-        title_duplicates = 0
-        for _title_hash, articles in title_hash_groups.items():
-            if len(articles) > 1:
+        pairs = []
+        for group in title_hash_groups.values():
+            if len(group) > 1:
                 # Keep the earliest or most reliable source
-                original = articles[0]
-                for duplicate in articles[1:]:
-                    self.mark_as_duplicate(original, duplicate, db)
-                    title_duplicates += 1
+                pairs.extend((group[0], duplicate_id) for duplicate_id in group[1:])
+        self._mark_pairs(db, pairs)
 
-        return {"title_duplicates": title_duplicates}
+        return {"title_duplicates": len(pairs)}
 
     def deduplicate_recent_articles(self, hours: int = 24) -> dict[str, int]:
         """
@@ -376,6 +421,11 @@ class ArticleDeduplicator:
                 f"Stage 3 complete: {stage3_stats['title_duplicates']} title duplicates found"
             )
 
+            # Fold this run's duplicate edges into persistent cross-day stories
+            story_stats = self.story_tracker.apply(
+                db, [article_data.id for article_data in recent_articles_data]
+            )
+
             # Final commit
             db.commit()
 
@@ -396,6 +446,7 @@ class ArticleDeduplicator:
                 "exact_duplicates": stage2_stats["exact_duplicates"],
                 "title_duplicates": stage3_stats["title_duplicates"],
                 "total_duplicates": total_duplicates,
+                "stories_merged": story_stats["stories_merged"],
             }
 
     def get_duplicate_statistics(self) -> dict[str, int]:
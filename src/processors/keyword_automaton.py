@@ -0,0 +1,103 @@
+"""
+Keyword Automaton
+Aho-Corasick matcher over word tokens for multi-category keyword detection
+"""
+
+import string
+from collections import deque
+
+# Punctuation separates words ("nfl's" -> "nfl s"); str.translate + split is far
+# cheaper than a regex tokenizer on the per-article hot path
+PUNCTUATION_TO_SPACE = str.maketrans(dict.fromkeys(string.punctuation + "‘’“”–—…", " "))
+
+
+def tokenize(text: str) -> list[str]:
+    """Split lowercased text into word tokens, treating punctuation as whitespace"""
+    return text.lower().translate(PUNCTUATION_TO_SPACE).split()
+
+
+class KeywordAutomaton:
+    """
+    Multi-pattern matcher that finds every keyword hit in a single pass
+
+    Keywords and text are tokenized the same way and the automaton runs over
+    tokens, so matches always fall on word boundaries ("nfl" never matches
+    inside "inflation"). A plural "s" on the final word is also accepted.
+    """
+
+    def __init__(self, keywords: dict[str, set[str]]):
+        """
+        Build the automaton
+
+        Args:
+            keywords: Mapping of category name to its keywords
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # (category, keyword, token length) emitted at each state
+        self._output: list[list[tuple[str, str, int]]] = [[]]
+
+        for category, words in keywords.items():
+            for keyword in words:
+                tokens = tokenize(keyword)
+                if not tokens:
+                    continue
+                self._insert(tokens, (category, keyword, len(tokens)))
+                if not tokens[-1].endswith("s") and tokens[-1].isalpha():
+                    self._insert([*tokens[:-1], tokens[-1] + "s"], (category, keyword, len(tokens)))
+
+        self._build_failure_links()
+
+    def _insert(self, tokens: list[str], output: tuple[str, str, int]):
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(output)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def find(self, tokens: list[str]) -> list[tuple[str, str, int, int]]:
+        """
+        Find all keyword hits in a token stream
+
+        Returns:
+            List of (category, keyword, start, end) token spans for every hit
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        hits = []
+        state = 0
+        for index, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for category, keyword, length in output[state]:
+                hits.append((category, keyword, index - length + 1, index + 1))
+        return hits
+
+    def match(self, text: str) -> dict[str, set[str]]:
+        """Return the distinct keywords hit in text, grouped by category"""
+        result: dict[str, set[str]] = {}
+        for category, keyword, _start, _end in self.find(tokenize(text)):
+            result.setdefault(category, set()).add(keyword)
+        return result
@@ -3,7 +3,7 @@ import re
 from datetime import datetime, timedelta
 
 from bs4 import BeautifulSoup
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from src.database.models import Article
 
@@ -123,6 +123,7 @@ class ArticleStorage:
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
         return (
             self.db.query(Article)
+            .options(selectinload(Article.body))
             .filter(Article.fetched_at >= cutoff_time)
             .order_by(Article.published_date.desc())
             .all()
@@ -134,6 +135,7 @@ class ArticleStorage:
         """
         return (
             self.db.query(Article)
+            .options(selectinload(Article.body))
             .filter(Article.feed_id == feed_id)
             .order_by(Article.published_date.desc())
             .limit(limit)
@@ -144,5 +146,11 @@ class ArticleStorage:
         """
         Get articles that have all required fields
         """
-        articles = self.db.query(Article).order_by(Article.published_date.desc()).limit(limit).all()
+        articles = (
+            self.db.query(Article)
+            .options(selectinload(Article.body))
+            .order_by(Article.published_date.desc())
+            .limit(limit)
+            .all()
+        )
         return [article for article in articles if self.normalizer.is_complete(article)]
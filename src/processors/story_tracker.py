@@ -0,0 +1,185 @@
+"""
+Story Tracker
+Maintains persistent cross-day story ids by union-find over duplicate edges
+"""
+
+import logging
+from datetime import datetime
+
+from sqlalchemy import bindparam, func, update
+from sqlalchemy.orm import Session
+
+from src.database.models import Article
+
+logger = logging.getLogger(__name__)
+
+# Keeps IN (...) lists under SQLite's bound-parameter limit
+STORY_BATCH_SIZE = 500
+
+
+class UnionFind:
+    """Disjoint-set forest with path compression, keyed by article id"""
+
+    def __init__(self):
+        self.parent: dict[int, int] = {}
+
+    def find(self, item: int) -> int:
+        """Return the representative of the set containing item"""
+        root = self.parent.setdefault(item, item)
+        while self.parent[root] != root:
+            root = self.parent[root]
+
+        # Path compression
+        while item != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, a: int, b: int) -> int:
+        """Merge the sets containing a and b; the smaller id becomes the root"""
+        root_a = self.find(a)
+        root_b = self.find(b)
+        if root_a == root_b:
+            return root_a
+
+        root, child = (root_a, root_b) if root_a < root_b else (root_b, root_a)
+        self.parent[child] = root
+        return root
+
+    def groups(self) -> dict[int, set[int]]:
+        """Return all sets keyed by their representative"""
+        result: dict[int, set[int]] = {}
+        for item in self.parent:
+            result.setdefault(self.find(item), set()).add(item)
+        return result
+
+
+class StoryTracker:
+    """
+    Collects duplicate edges during a dedup run and folds them into persistent stories
+
+    A story id is the smallest article id in the story, so stories found on
+    earlier runs keep their id and simply absorb newly detected duplicates.
+    """
+
+    def __init__(self):
+        self.edges: list[tuple[int, int]] = []
+
+    def add_edge(self, original_id: int, duplicate_id: int):
+        """Record that two articles describe the same story"""
+        if original_id is not None and duplicate_id is not None:
+            self.edges.append((original_id, duplicate_id))
+
+    def apply(self, db: Session, article_ids: list[int]) -> dict[str, int]:
+        """
+        Persist story ids for the given articles and all recorded edges
+
+        Args:
+            db: Database session
+            article_ids: Articles seen by this dedup run (singletons get their own story)
+
+        Returns:
+            Dict with story statistics for this run
+        """
+        if not self.edges and not article_ids:
+            return {"stories_assigned": 0, "stories_merged": 0}
+
+        # Articles that were never assigned a story start their own
+        assigned = 0
+        for start in range(0, len(article_ids), STORY_BATCH_SIZE):
+            assigned += (
+                db.query(Article)
+                .filter(
+                    Article.id.in_(article_ids[start : start + STORY_BATCH_SIZE]),
+                    Article.story_id.is_(None),
+                )
+                .update({Article.story_id: Article.id}, synchronize_session=False)
+            )
+
+        if not self.edges:
+            return {"stories_assigned": assigned, "stories_merged": 0}
+
+        edge_ids = list({article_id for edge in self.edges for article_id in edge})
+        current = {}
+        for start in range(0, len(edge_ids), STORY_BATCH_SIZE):
+            current.update(
+                db.query(Article.id, Article.story_id)
+                .filter(Article.id.in_(edge_ids[start : start + STORY_BATCH_SIZE]))
+                .all()
+            )
+
+        # Seed the forest with the existing stories, then fold in the new edges
+        forest = UnionFind()
+        for article_id in edge_ids:
+            forest.union(article_id, current.get(article_id) or article_id)
+        for original_id, duplicate_id in self.edges:
+            forest.union(original_id, duplicate_id)
+
+        relabels = []
+        members_by_root = []
+        for root, members in forest.groups().items():
+            # Whole stories absorbed into an older one, including members outside this run
+            for old_story in {current[m] for m in members if current.get(m)} - {root}:
+                relabels.append({"old_story": old_story, "new_story": root})
+            members_by_root.extend({"article_id": m, "new_story": root} for m in members)
+
+        # Two executemany statements instead of one UPDATE per story
+        articles = Article.__table__
+        if relabels:
+            db.execute(
+                update(articles)
+                .where(articles.c.story_id == bindparam("old_story"))
+                .values(story_id=bindparam("new_story")),
+                relabels,
+            )
+        db.execute(
+            update(articles)
+            .where(articles.c.id == bindparam("article_id"))
+            .values(story_id=bindparam("new_story")),
+            members_by_root,
+        )
+
+        merged = len(relabels)
+        logger.info(
+            f"Story tracking: {assigned} new stories, {len(self.edges)} duplicate edges, "
+            f"{merged} stories merged"
+        )
+        self.edges = []
+
+        return {"stories_assigned": assigned, "stories_merged": merged}
+
+
+def get_story_stats(db: Session, story_ids: list[int]) -> dict[int, dict]:
+    """
+    Get coverage statistics for a set of stories in a single grouped query
+
+    Args:
+        db: Database session
+        story_ids: Story ids to look up
+
+    Returns:
+        Dict mapping story id to {"article_count", "feed_count", "first_seen"}
+    """
+    story_ids = [sid for sid in set(story_ids) if sid is not None]
+    if not story_ids:
+        return {}
+
+    rows = (
+        db.query(
+            Article.story_id,
+            func.count(Article.id),
+            func.count(func.distinct(Article.feed_id)),
+            func.min(Article.fetched_at),
+        )
+        .filter(Article.story_id.in_(story_ids))
+        .group_by(Article.story_id)
+        .all()
+    )
+
+    return {
+        story_id: {
+            "article_count": article_count,
+            "feed_count": feed_count,
+            "first_seen": first_seen.isoformat() if isinstance(first_seen, datetime) else None,
+        }
+        for story_id, article_count, feed_count, first_seen in rows
+    }
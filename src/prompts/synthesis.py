@@ -2,7 +2,8 @@
 Clustering and situation synthesis prompts.
 
 Pass 1: CLUSTERING_PROMPT groups articles into topic clusters.
-Pass 2: SITUATION_SYNTHESIS_PROMPT produces examined narratives for each cluster.
+Pass 2: SITUATION_SYNTHESIS_PROMPT produces examined narratives for each cluster,
+         with SITUATION_REQUEST_PROMPT carrying the per-cluster article list.
 THIN_COVERAGE_PROMPT produces one-line summaries for clusters with insufficient coverage.
 """
 
@@ -57,10 +58,7 @@ SITUATION_SYNTHESIS_PROMPT = """You are analyzing a set of articles about a sing
 
 ## Citation Discipline
 
-For every factual claim, include inline citations using this format: "claim^[1,3]" referencing article numbers from the list below. Only cite articles that directly support the claim. Do not cite your own analytical conclusions.
-
-## Article Reference List
-{article_ref_list}
+For every factual claim, include inline citations using this format: "claim^[1,3]" referencing article numbers from the Article Reference List in the request. Only cite articles that directly support the claim. Do not cite your own analytical conclusions.
 
 ## Output Format
 
@@ -118,6 +116,14 @@ Return valid JSON with this exact structure:
 Return ONLY valid JSON, no markdown formatting or additional text."""
 
 
+# Pass 2 request for one situation: only the cluster's article reference list.
+# SITUATION_SYNTHESIS_PROMPT is sent once per run as the cached system prefix.
+SITUATION_REQUEST_PROMPT = """Analyze the situation covered by the articles in your context.
+
+## Article Reference List
+{article_ref_list}"""
+
+
 # Thin coverage summary for clusters with 1-2 articles.
 # Minimal output: title, source, one-line description.
 THIN_COVERAGE_PROMPT = """Summarize each of these article clusters in one sentence. These clusters have insufficient coverage for full analysis (1-2 articles each).
@@ -1,28 +1,43 @@
 import asyncio
+import hashlib
 import logging
 from datetime import datetime
 
 import feedparser
 import httpx
 from bs4 import BeautifulSoup
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from src.database.connection import get_db
 from src.database.models import Article, RSSFeed
+from src.database.search_index import ArticleSearchIndex
+from src.processors.body_store import BodyStore
+from src.processors.summarizer import summarize
+from src.rss.known_articles import KnownArticleFilter, get_known_article_filter
 
 logger = logging.getLogger(__name__)
 
 
 class RSSFetcher:
-    def __init__(self, timeout: int = 30, max_retries: int = 3):
+    def __init__(
+        self,
+        timeout: int = 30,
+        max_retries: int = 3,
+        known_articles: KnownArticleFilter | None = None,
+    ):
         self.timeout = timeout
         self.max_retries = max_retries
         self.session = httpx.AsyncClient(timeout=timeout, follow_redirects=True)
+        self.known_articles = known_articles or get_known_article_filter()
+        # Normalized text keyed by raw HTML hash, so identical bodies are cleaned once per run
+        self._normalized_cache: dict[str, str] = {}
 
     async def close(self):
-        """Close HTTP client session"""
+        """Close HTTP client session and persist newly seen article keys"""
         await self.session.aclose()
+        if self.known_articles is not None:
+            self.known_articles.save()
 
     async def fetch_feed(self, feed_url: str) -> tuple[bool, dict | None, str | None]:
         """
@@ -76,7 +91,7 @@ class RSSFetcher:
             content = entry.summary
 
         # Clean HTML from content
-        normalized_content = self.clean_html(content) if content else ""
+        normalized_content = self._normalize_cached(content) if content else ""
 
         # Extract categories
         categories = []
@@ -97,6 +112,43 @@ class RSSFetcher:
             "language": "en",  # Default to English for now
         }
 
+    def _normalize_cached(self, html_content: str) -> str:
+        """clean_html memoized by raw-HTML hash for the lifetime of this fetcher"""
+        key = hashlib.sha1(html_content.encode("utf-8")).hexdigest()
+        normalized = self._normalized_cache.get(key)
+        if normalized is None:
+            normalized = self.clean_html(html_content)
+            self._normalized_cache[key] = normalized
+        return normalized
+
+    def _build_article(self, feed_id: int, article_data: dict, bodies: BodyStore) -> Article:
+        """Create an Article whose normalized text lives in the shared body store"""
+        # Summarized here rather than in normalize_article, so only new articles pay for it
+        article_data = {
+            **article_data,
+            "embedding_summary": summarize(article_data["normalized_content"]),
+        }
+        body, created = bodies.intern(article_data["normalized_content"])
+        if body is None:
+            return Article(feed_id=feed_id, **article_data)
+
+        fields = {**article_data, "normalized_content": None}
+        if not created:
+            # Syndicated copy: the shared body already carries this text
+            fields["content"] = None
+        return Article(feed_id=feed_id, body=body, **fields)
+
+    def _index_for_search(self, db: Session, articles: list[Article], feed_name: str):
+        """Add committed articles to the full-text index; curation backfills any misses"""
+        if not articles:
+            return
+        try:
+            ArticleSearchIndex(db).index_articles(articles)
+            db.commit()
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.warning(f"Full-text indexing failed for {feed_name}: {e}")
+
     def clean_html(self, html_content: str) -> str:
         """Remove HTML tags and return clean text"""
         if not html_content:
@@ -159,6 +211,14 @@ class RSSFetcher:
             articles_count = 0
             articles_with_errors = 0
             duplicates_skipped = 0
+            lookups_skipped = 0
+            stored_guids = []
+            new_articles = []
+
+            known_articles = self.known_articles
+            if known_articles is not None:
+                known_articles.ensure_ready(db)
+            bodies = BodyStore(db)
 
             for entry in feed_data.entries:
                 try:
@@ -168,17 +228,27 @@ class RSSFetcher:
                     if not article_data.get("title") or not article_data.get("guid"):
                         continue
 
-                    # Check if article already exists (improved deduplication check)
-                    existing = (
-                        db.query(Article)
-                        .filter(Article.feed_id == feed.id, Article.guid == article_data["guid"])
-                        .first()
-                    )
+                    # Only "maybe present" entries need a database round-trip
+                    existing = None
+                    if known_articles is None or known_articles.might_contain(
+                        feed.id, article_data["guid"]
+                    ):
+                        existing = (
+                            db.query(Article)
+                            .filter(
+                                Article.feed_id == feed.id, Article.guid == article_data["guid"]
+                            )
+                            .first()
+                        )
+                    else:
+                        lookups_skipped += 1
 
                     if not existing:
-                        article = Article(feed_id=feed.id, **article_data)
+                        article = self._build_article(feed.id, article_data, bodies)
                         db.add(article)
                         articles_count += 1
+                        stored_guids.append(article_data["guid"])
+                        new_articles.append(article)
                     else:
                         duplicates_skipped += 1
 
@@ -197,6 +267,9 @@ class RSSFetcher:
                 db.commit()
             except IntegrityError:
                 db.rollback()
+                stored_guids = []
+                new_articles = []
+                bodies = BodyStore(db)
                 logger.warning(
                     f"Duplicate articles detected in {feed.name} during commit, skipping duplicates"
                 )
@@ -217,22 +290,33 @@ class RSSFetcher:
                         )
 
                         if not existing:
-                            article = Article(feed_id=feed.id, **article_data)
+                            article = self._build_article(feed.id, article_data, bodies)
                             db.add(article)
                             try:
                                 db.commit()
                                 articles_count += 1
+                                stored_guids.append(article_data["guid"])
+                                new_articles.append(article)
                             except IntegrityError:
                                 db.rollback()
+                                bodies = BodyStore(db)
                                 duplicates_skipped += 1
                     except Exception:
                         continue
 
+            self._index_for_search(db, new_articles, feed.name)
+
+            if known_articles is not None:
+                for guid in stored_guids:
+                    known_articles.add(feed.id, guid)
+
             log_msg = f"Processed {articles_count} new articles from {feed.name}"
             if duplicates_skipped > 0:
                 log_msg += f" ({duplicates_skipped} duplicates skipped)"
             if articles_with_errors > 0:
                 log_msg += f" ({articles_with_errors} errors)"
+            if lookups_skipped > 0:
+                logger.debug(f"Known-article filter skipped {lookups_skipped} lookups")
 
             logger.info(log_msg)
             return True, articles_count, None
@@ -0,0 +1,191 @@
+"""
+Known Article Filter
+Persisted Bloom filter of stored (feed_id, guid) keys
+"""
+
+import hashlib
+import logging
+import math
+import struct
+import time
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from src.config.settings import settings
+from src.database.models import Article
+
+logger = logging.getLogger(__name__)
+
+FILTER_FILENAME = "known_articles.bloom"
+FILE_MAGIC = b"IWBLOOM1"
+HEADER_FORMAT = "<8sQIQQd"  # magic, bits, hashes, count, capacity, built_at
+MIN_CAPACITY = 100_000
+FALSE_POSITIVE_RATE = 0.01
+REBUILD_BATCH_SIZE = 10_000
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys using double hashing"""
+
+    def __init__(self, capacity: int, false_positive_rate: float = FALSE_POSITIVE_RATE):
+        self.capacity = max(capacity, 1)
+        self.num_bits = max(
+            8, int(-self.capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        )
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        """Insert a key"""
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class KnownArticleFilter:
+    """
+    Ingest-time prefilter for article existence checks
+
+    A miss means the entry is definitely not stored, so the fetcher can insert
+    without a database round-trip; a hit only means "maybe" and must be
+    confirmed against the database. Only (feed_id, guid) is keyed, since that
+    is what decides whether an entry is already stored. Keys for rows removed
+    by retention linger as harmless false positives until the next rebuild.
+    """
+
+    def __init__(self, path: Path | None = None, rebuild_hours: int | None = None):
+        self.path = path or settings.data_dir / FILTER_FILENAME
+        self.rebuild_hours = (
+            rebuild_hours
+            if rebuild_hours is not None
+            else settings.known_article_filter_rebuild_hours
+        )
+        self.bloom: BloomFilter | None = None
+        self.built_at = 0.0
+        self.dirty = False
+
+    @staticmethod
+    def guid_key(feed_id: int, guid: str) -> str:
+        return f"g|{feed_id}|{guid}"
+
+    def is_stale(self) -> bool:
+        """Whether the filter is missing, too old, or filled past its capacity"""
+        if self.bloom is None:
+            return True
+        if self.bloom.count > self.bloom.capacity:
+            return True
+        return time.time() - self.built_at > self.rebuild_hours * 3600
+
+    def ensure_ready(self, db: Session):
+        """Load the persisted filter, rebuilding from the database when stale"""
+        if self.bloom is None:
+            self.load()
+        if self.is_stale():
+            self.rebuild(db)
+
+    def might_contain(self, feed_id: int, guid: str) -> bool:
+        """Return False only when the entry is definitely not stored"""
+        if self.bloom is None:
+            return True
+        return self.guid_key(feed_id, guid) in self.bloom
+
+    def add(self, feed_id: int, guid: str):
+        """Record a stored article"""
+        if self.bloom is None:
+            return
+        self.bloom.add(self.guid_key(feed_id, guid))
+        self.dirty = True
+
+    def rebuild(self, db: Session):
+        """Rebuild the filter from every stored article and persist it"""
+        article_count = db.query(Article.id).count()
+        # Headroom for growth until the next rebuild
+        self.bloom = BloomFilter(max(MIN_CAPACITY, article_count * 2))
+        self.built_at = time.time()
+
+        rows = db.query(Article.feed_id, Article.guid).yield_per(REBUILD_BATCH_SIZE)
+        for feed_id, guid in rows:
+            self.bloom.add(self.guid_key(feed_id, guid))
+
+        logger.info(f"Rebuilt known-article filter from {article_count} articles")
+        self.dirty = True
+        self.save()
+
+    def load(self) -> bool:
+        """Load the filter from disk; returns False if missing or unreadable"""
+        try:
+            data = self.path.read_bytes()
+            magic, num_bits, num_hashes, count, capacity, built_at = struct.unpack_from(
+                HEADER_FORMAT, data
+            )
+        except (OSError, struct.error):
+            return False
+
+        bits = data[struct.calcsize(HEADER_FORMAT) :]
+        if magic != FILE_MAGIC or len(bits) != (num_bits + 7) // 8:
+            logger.warning(f"Ignoring corrupt known-article filter at {self.path}")
+            return False
+
+        bloom = BloomFilter.__new__(BloomFilter)
+        bloom.capacity = capacity
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.count = count
+        bloom.bits = bytearray(bits)
+
+        self.bloom = bloom
+        self.built_at = built_at
+        self.dirty = False
+        return True
+
+    def save(self):
+        """Persist the filter if it changed since the last save"""
+        if self.bloom is None or not self.dirty:
+            return
+
+        header = struct.pack(
+            HEADER_FORMAT,
+            FILE_MAGIC,
+            self.bloom.num_bits,
+            self.bloom.num_hashes,
+            self.bloom.count,
+            self.bloom.capacity,
+            self.built_at,
+        )
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_bytes(header + bytes(self.bloom.bits))
+        tmp_path.replace(self.path)
+        self.dirty = False
+
+
+_known_articles: KnownArticleFilter | None = None
+
+
+def get_known_article_filter() -> KnownArticleFilter | None:
+    """Return the process-wide filter, or None when disabled in settings"""
+    global _known_articles
+    if not settings.enable_known_article_filter:
+        return None
+    if _known_articles is None:
+        _known_articles = KnownArticleFilter()
+    return _known_articles
+
+
+if __name__ == "__main__":
+    from src.database.connection import get_db
+
+    logging.basicConfig(level=logging.INFO)
+    with get_db() as db:
+        KnownArticleFilter().rebuild(db)
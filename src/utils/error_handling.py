@@ -72,6 +72,12 @@ class AuthenticationError(APIError):
     pass
 
 
+class ResponseCacheMiss(APIError):
+    """A Claude request had no cached response while in replay mode"""
+
+    pass
+
+
 class DataError(InsightWeaverError):
     """Base class for data-related errors"""
 
@@ -0,0 +1,85 @@
+"""
+Tests for CLI Search Command
+"""
+
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from src.cli.search import search_command
+from src.database.models import Article, RSSFeed
+from src.database.search_index import ArticleSearchIndex
+
+
+def _patch_db(session):
+    @contextmanager
+    def fake_get_db():
+        yield session
+
+    return patch("src.cli.search.get_db", fake_get_db)
+
+
+def _add_articles(session, titles):
+    feed = RSSFeed(url="https://example.com/rss", name="Example Feed")
+    session.add(feed)
+    session.flush()
+    articles = [
+        Article(feed_id=feed.id, guid=f"g{i}", title=title, url=f"https://example.com/{i}")
+        for i, title in enumerate(titles)
+    ]
+    session.add_all(articles)
+    session.commit()
+    ArticleSearchIndex(session).index_articles(articles)
+    session.commit()
+    return articles
+
+
+class TestSearchCommand:
+    """Tests for the search command"""
+
+    def test_lists_matching_articles(self, cli_runner, test_session):
+        """Should print matching titles with their feed"""
+        _add_articles(test_session, ["Ransomware hits hospital", "School board vote"])
+
+        with _patch_db(test_session):
+            result = cli_runner.invoke(search_command, ["ransomware"])
+
+        assert result.exit_code == 0
+        assert "Ransomware hits hospital" in result.output
+        assert "Example Feed" in result.output
+        assert "School board vote" not in result.output
+
+    def test_topic_option_matches_topic_keywords(self, cli_runner, test_session):
+        """--topic alone should find articles with any keyword of the topic"""
+        _add_articles(test_session, ["Phishing campaign targets banks", "Bake sale"])
+
+        with _patch_db(test_session):
+            result = cli_runner.invoke(search_command, ["--topic", "cybersecurity"])
+
+        assert "Phishing campaign targets banks" in result.output
+        assert "Bake sale" not in result.output
+
+    def test_requires_words_or_topic(self, cli_runner):
+        """Should explain usage when given nothing to search for"""
+        result = cli_runner.invoke(search_command, [])
+
+        assert "Give search words" in result.output
+
+    def test_no_matches(self, cli_runner, test_session):
+        """Should say when nothing matches"""
+        _add_articles(test_session, ["School board vote"])
+
+        with _patch_db(test_session):
+            result = cli_runner.invoke(search_command, ["ransomware"])
+
+        assert "No matching articles" in result.output
+
+    def test_similar_ranks_by_vector_similarity(self, cli_runner, test_session):
+        """--similar should find related articles without requiring every word"""
+        _add_articles(test_session, ["Hackers breach hospital network", "Bake sale"])
+
+        with _patch_db(test_session):
+            result = cli_runner.invoke(search_command, ["--similar", "hospital", "cyberattack"])
+
+        assert result.exit_code == 0
+        assert "Hackers breach hospital network" in result.output
+        assert "Bake sale" not in result.output
@@ -7,9 +7,16 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
+from src.config.settings import settings
 from src.database.models import Base
 
 
+@pytest.fixture(autouse=True)
+def no_curation_cache(monkeypatch):
+    """Keep curation from reading or writing candidate pools in the data directory"""
+    monkeypatch.setattr(settings, "enable_curation_cache", False)
+
+
 @pytest.fixture
 def test_engine(tmp_path):
     """Create temporary SQLite database with all tables."""
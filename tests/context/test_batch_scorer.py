@@ -0,0 +1,73 @@
+"""
+Tests for Batch Topic Scorer
+"""
+
+from unittest.mock import MagicMock
+
+from src.context.batch_scorer import BatchTopicScorer
+from src.context.topic_matcher import TopicMatcher
+
+FAIRFAX = {"city": "Fairfax", "state": "Virginia", "region": "Northern Virginia"}
+
+
+class TestBatchTopicScorer:
+    """Tests for scoring batches against the scalar path"""
+
+    def test_matches_scalar_path(self, sample_article_for_context):
+        """Batch scores and scopes should equal TopicMatcher.analyze for every article"""
+        local_feed = MagicMock(category="Local News")
+        tech_feed = MagicMock(category="Cybersecurity")
+        articles = [
+            sample_article_for_context(
+                id=None,
+                title="Ransomware attack hits Fairfax county schools",
+                description="Zero-day exploit and zero day patch, CISA says",
+                feed=local_feed,
+            ),
+            sample_article_for_context(
+                id=None,
+                title="Congress debates AI regulation",
+                description="Lawmakers in Washington weigh data privacy rules",
+                normalized_content="OpenAI and Anthropic testified about machine learning",
+                entities=["OpenAI", "Fairfax County", "OpenAI"],
+                feed=tech_feed,
+            ),
+            sample_article_for_context(
+                id=None,
+                title="Weekend weather",
+                description="Sunny",
+                normalized_content="Virginia residents should expect clear skies",
+            ),
+        ]
+
+        matcher = TopicMatcher()
+        expected = [matcher.analyze(article, FAIRFAX) for article in articles]
+
+        assert BatchTopicScorer(FAIRFAX).score(articles) == expected
+
+    def test_term_matrix_rows_hold_distinct_terms(self, sample_article_for_context):
+        """Repeated and plural keywords should set one term column"""
+        scorer = BatchTopicScorer(FAIRFAX)
+        article = sample_article_for_context(
+            title="Hacks and more hack reports",
+            description="",
+            normalized_content="",
+        )
+
+        (row,), (scopes,) = scorer.term_matrix([article])
+
+        assert row == {scorer.term_ids["hack"]}
+        assert scopes == set()
+
+    def test_feed_category_signals_are_not_shared_between_articles(
+        self, sample_article_for_context
+    ):
+        """Merging cached feed scopes must not leak one article's scopes into another"""
+        feed = MagicMock(category="Local News")
+        first = sample_article_for_context(title="Global summit", description="", feed=feed)
+        second = sample_article_for_context(title="Bake sale", description="", feed=feed)
+
+        first_signals, second_signals = BatchTopicScorer(FAIRFAX).score([first, second])
+
+        assert first_signals.scopes == {"global", "local"}
+        assert second_signals.scopes == {"local"}
@@ -0,0 +1,223 @@
+"""
+Tests for the Candidate Pool Cache
+"""
+
+import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy import event
+
+from src.context import candidate_pool
+from src.context.article_records import ArticleRecord, FeedRecord
+from src.context.candidate_pool import CandidatePool, CandidatePoolCache, PoolArticle
+from src.context.curator import ContextCurator
+from src.database.models import Article, ArticleTopicScore, RSSFeed
+
+
+def _pool_article(article_id, topics=None, scopes=None, fetched_at=None):
+    record = ArticleRecord(
+        id=article_id,
+        title=f"Article {article_id}",
+        description=None,
+        url=f"https://example.com/{article_id}",
+        published_date=None,
+        fetched_at=fetched_at or datetime.utcnow(),
+        entities=None,
+        embedding_summary=None,
+        relevance_score=1.0,
+        story_id=None,
+        normalized_content="Body",
+        feed=FeedRecord(name="Feed", category=None),
+    )
+    entry = {"id": article_id, "title": record.title, "content": "Body"}
+    return PoolArticle(record, entry, 10, topics or {}, scopes or [])
+
+
+def _pool(articles, complete=True, key="k", built_at=None):
+    now = datetime.utcnow()
+    return CandidatePool(key, built_at or now, now - timedelta(hours=24), complete, articles)
+
+
+class TestCandidatePoolSelect:
+    """Tests for answering filter variants from a pool"""
+
+    def test_unfiltered_keeps_relevance_order(self):
+        pool = _pool([_pool_article(i) for i in (3, 1, 2)])
+
+        selected = pool.select({}, datetime.utcnow() - timedelta(hours=24), 2)
+
+        assert [a.record.id for a in selected] == [3, 1]
+
+    def test_topic_filter_orders_by_topic_score(self):
+        pool = _pool(
+            [
+                _pool_article(1, {"cybersecurity": 4.0}),
+                _pool_article(2, {"cybersecurity": 1.0}),
+                _pool_article(3, {"cybersecurity": 9.0}),
+            ]
+        )
+
+        selected = pool.select({"topics": ["cybersecurity"]}, datetime.min, 10)
+
+        assert [a.record.id for a in selected] == [3, 1]
+
+    def test_scope_filter(self):
+        pool = _pool([_pool_article(1, scopes=["local"]), _pool_article(2, scopes=["global"])])
+
+        selected = pool.select({"scopes": ["local"]}, datetime.min, 10)
+
+        assert [a.record.id for a in selected] == [1]
+
+    def test_drops_articles_before_cutoff(self):
+        old = _pool_article(1, fetched_at=datetime.utcnow() - timedelta(hours=30))
+        pool = _pool([old, _pool_article(2)])
+
+        selected = pool.select({}, datetime.utcnow() - timedelta(hours=24), 10)
+
+        assert [a.record.id for a in selected] == [2]
+
+    def test_cannot_answer_search_or_filtered_incomplete_pool(self):
+        pool = _pool([_pool_article(1)], complete=False)
+
+        assert pool.select({"search": "ransomware"}, datetime.min, 10) is None
+        assert pool.select({"topics": ["cybersecurity"]}, datetime.min, 10) is None
+        assert len(pool.select({}, datetime.min, 10)) == 1
+
+
+class TestCandidatePoolCache:
+    """Tests for storing pools on disk"""
+
+    def test_round_trip(self, tmp_path):
+        cache = CandidatePoolCache(tmp_path)
+        pool = _pool([_pool_article(1, {"cybersecurity": 0.5}, ["local"])])
+
+        cache.save(pool)
+        loaded = cache.load("k")
+
+        assert loaded.articles[0].record == pool.articles[0].record
+        assert loaded.articles[0].entry == pool.articles[0].entry
+        assert loaded.articles[0].topics == {"cybersecurity": 0.5}
+        assert cache.load("other") is None
+
+    def test_expired_pool_is_ignored(self, tmp_path):
+        cache = CandidatePoolCache(tmp_path)
+        built_at = datetime.utcnow() - timedelta(minutes=candidate_pool.POOL_TTL_MINUTES + 1)
+        cache.save(_pool([_pool_article(1)], built_at=built_at))
+
+        assert cache.load("k") is None
+
+    def test_keeps_newest_pools(self, tmp_path):
+        cache = CandidatePoolCache(tmp_path)
+        for i in range(candidate_pool.MAX_CACHED_POOLS + 2):
+            cache.save(_pool([], key=f"k{i}"))
+            os.utime(tmp_path / f"pool-k{i}.json", (i, i))
+
+        assert len(list(tmp_path.glob("pool-*.json"))) == candidate_pool.MAX_CACHED_POOLS
+        assert cache.load("k0") is None
+
+    def test_watermark_changes_when_articles_arrive(self, test_session):
+        before = CandidatePoolCache.watermark(test_session)
+        test_session.add(Article(guid="g1", title="New"))
+        test_session.commit()
+
+        assert CandidatePoolCache.watermark(test_session) != before
+
+    def test_watermark_changes_when_articles_are_rescored(self, test_session):
+        article = Article(guid="g1", title="New", relevance_score=1.0)
+        test_session.add(article)
+        test_session.commit()
+        before = CandidatePoolCache.watermark(test_session)
+
+        article.relevance_score = 2.0
+        test_session.commit()
+
+        assert CandidatePoolCache.watermark(test_session) != before
+
+    def test_watermark_changes_when_stories_are_relabelled(self, test_session):
+        first = Article(guid="g1", title="First")
+        second = Article(guid="g2", title="Second")
+        test_session.add_all([first, second])
+        test_session.flush()
+        first.story_id, second.story_id = first.id, second.id
+        test_session.commit()
+        before = CandidatePoolCache.watermark(test_session)
+
+        second.story_id = first.id
+        test_session.commit()
+
+        assert CandidatePoolCache.watermark(test_session) != before
+
+    def test_watermark_changes_when_topics_are_rescored(self, test_session):
+        article = Article(guid="g1", title="New")
+        test_session.add(article)
+        test_session.flush()
+        row = ArticleTopicScore(
+            article_id=article.id, location_key="||", dimension="topic", name="energy", score=1.0
+        )
+        test_session.add(row)
+        test_session.commit()
+        before = CandidatePoolCache.watermark(test_session)
+
+        row.score = 3.0
+        test_session.commit()
+
+        assert CandidatePoolCache.watermark(test_session) != before
+
+
+class TestPooledCuration:
+    """Tests for curation served from the pool"""
+
+    async def test_variants_reuse_one_pool(
+        self, test_session, test_engine, sample_user_profile, tmp_path
+    ):
+        feed = RSSFeed(url="https://example.com/feed", name="Feed")
+        test_session.add(feed)
+        test_session.flush()
+        for i in range(20):
+            topic = "Ransomware attack on county network" if i % 2 else "School board budget vote"
+            test_session.add(
+                Article(
+                    feed_id=feed.id,
+                    guid=f"g{i}",
+                    title=f"{topic} {i}",
+                    normalized_content=f"{topic} in Fairfax County. Story {i}.",
+                )
+            )
+        test_session.commit()
+
+        @contextmanager
+        def fake_get_db():
+            yield test_session
+
+        cache = CandidatePoolCache(tmp_path)
+        statements = []
+
+        def count_statement(_conn, _cursor, statement, *_args):
+            statements.append(statement)
+
+        with patch("src.context.curator.get_db", fake_get_db):
+            unfiltered = await ContextCurator(
+                user_profile=sample_user_profile, pool_cache=cache
+            ).curate_for_narrative_synthesis(hours=24, max_articles=10)
+            uncached = await ContextCurator(
+                user_profile=sample_user_profile
+            ).curate_for_narrative_synthesis(hours=24, max_articles=10)
+
+            event.listen(test_engine, "before_cursor_execute", count_statement)
+            try:
+                filtered = await ContextCurator(
+                    user_profile=sample_user_profile,
+                    topic_filters={"topics": ["cybersecurity"]},
+                    pool_cache=cache,
+                ).curate_for_narrative_synthesis(hours=24, max_articles=10)
+            finally:
+                event.remove(test_engine, "before_cursor_execute", count_statement)
+
+        assert [a["id"] for a in unfiltered["articles"]] == [a["id"] for a in uncached["articles"]]
+        assert filtered["articles"]
+        assert all("Ransomware" in a["title"] for a in filtered["articles"])
+        assert len(list(tmp_path.glob("pool-*.json"))) == 1
+        # Watermark and historical memory only
+        assert len(statements) <= 2, statements
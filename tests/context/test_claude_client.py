@@ -0,0 +1,172 @@
+"""
+Tests for Claude Client
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.context.claude_client import CallUsage, ClaudeClient, system_blocks
+from src.context.response_cache import ResponseCache
+from src.utils.error_handling import ResponseCacheMiss
+
+
+def _response(text="ok", **usage):
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(
+            input_tokens=usage.get("input_tokens", 100),
+            output_tokens=usage.get("output_tokens", 20),
+            cache_creation_input_tokens=usage.get("cache_creation_input_tokens"),
+            cache_read_input_tokens=usage.get("cache_read_input_tokens"),
+        ),
+    )
+
+
+def _client(*responses):
+    client = ClaudeClient(api_key="test-key", requests_per_minute=60000)
+    client.client = SimpleNamespace(messages=SimpleNamespace(create=AsyncMock()))
+    client.client.messages.create.side_effect = list(responses)
+    return client
+
+
+class TestSystemBlocks:
+    """Tests for building cacheable system blocks"""
+
+    def test_breakpoint_after_last_cached_block(self):
+        blocks = system_blocks(["rules", "profile"], ["articles"])
+
+        assert [b["text"] for b in blocks] == ["rules", "profile", "articles"]
+        assert "cache_control" not in blocks[0]
+        assert blocks[1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in blocks[2]
+
+    def test_skips_empty_text(self):
+        blocks = system_blocks(["rules", ""], ["", "articles"])
+
+        assert [b["text"] for b in blocks] == ["rules", "articles"]
+        assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+
+
+class TestAnalyzeWithContext:
+    """Tests for context requests with a cached prefix"""
+
+    async def test_sends_stable_prefix_before_articles(self):
+        client = _client(_response())
+        context = {
+            "user_profile": {"location": "Fairfax, VA"},
+            "articles": [{"title": "Budget vote"}],
+            "instructions": "Be precise.",
+        }
+
+        await client.analyze_with_context(context, "Analyze", cached_prefix=["RULES"])
+
+        system = client.client.messages.create.call_args.kwargs["system"]
+        cached = [b for b in system if "cache_control" in b]
+        assert len(cached) == 1
+        assert system[0]["text"] == "RULES"
+        breakpoint_index = system.index(cached[0])
+        assert "Be precise." in cached[0]["text"]
+        assert all("Budget vote" in b["text"] for b in system[breakpoint_index + 1 :])
+        assert not any("Budget vote" in b["text"] for b in system[: breakpoint_index + 1])
+
+    async def test_prefix_is_identical_across_clusters(self):
+        client = _client(_response(), _response())
+        base = {"user_profile": {"location": "Fairfax, VA"}, "instructions": "Be precise."}
+
+        await client.analyze_with_context({**base, "articles": [{"title": "A"}]}, "x", 1.0, ["R"])
+        await client.analyze_with_context({**base, "articles": [{"title": "B"}]}, "y", 1.0, ["R"])
+
+        first, second = (c.kwargs["system"] for c in client.client.messages.create.call_args_list)
+        assert first[:-1] == second[:-1]
+        assert first[-1] != second[-1]
+
+
+class TestUsageRecording:
+    """Tests for per-call token usage"""
+
+    async def test_records_cache_writes_and_reads(self):
+        client = _client(
+            _response(cache_creation_input_tokens=1500),
+            _response(cache_read_input_tokens=1500),
+        )
+
+        await client.analyze("system", "first")
+        await client.analyze_conversation("system", [{"role": "user", "content": "second"}])
+
+        assert client.usage == [
+            CallUsage(100, 20, 1500, 0),
+            CallUsage(100, 20, 0, 1500),
+        ]
+        totals = client.usage_totals()
+        assert totals["calls"] == 2
+        assert totals["cache_creation_input_tokens"] == 1500
+        assert totals["cache_read_input_tokens"] == 1500
+        assert totals["input_tokens"] == 200
+
+    def test_missing_usage_counts_zero(self):
+        assert CallUsage.from_response(SimpleNamespace()) == CallUsage()
+
+
+class TestRequestScheduling:
+    """Tests for the shared concurrency and rate limits"""
+
+    async def test_bounds_in_flight_requests(self):
+        in_flight = []
+        peak = []
+
+        async def create(**_kwargs):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+            return _response()
+
+        client = ClaudeClient(api_key="test-key", max_concurrent=2, requests_per_minute=60000)
+        client.client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+        await asyncio.gather(*(client.analyze("system", str(i)) for i in range(6)))
+
+        assert max(peak) == 2
+        assert client.usage_totals()["calls"] == 6
+
+    async def test_spaces_request_starts(self):
+        starts = []
+
+        async def create(**_kwargs):
+            starts.append(time.monotonic())
+            return _response()
+
+        client = ClaudeClient(api_key="test-key", max_concurrent=4, requests_per_minute=1200)
+        client.client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+        await asyncio.gather(*(client.analyze("system", str(i)) for i in range(3)))
+
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:], strict=False)]
+        assert all(gap >= 0.045 for gap in gaps)
+
+
+class TestResponseCaching:
+    """Tests for serving repeated requests from the response cache"""
+
+    async def test_repeated_request_is_served_from_cache(self, tmp_path):
+        client = _client(_response("fresh"))
+        client.response_cache = ResponseCache(tmp_path)
+
+        first = await client.analyze("system", "same question", temperature=0.0)
+        second = await client.analyze("system", "same question", temperature=0.0)
+
+        assert first == second == "fresh"
+        assert client.client.messages.create.call_count == 1
+        assert client.usage_totals()["cached_responses"] == 1
+
+    async def test_replay_miss_raises_without_calling_api(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.context.claude_client.settings.anthropic_api_key", "")
+        client = ClaudeClient(response_cache=ResponseCache(tmp_path, replay=True))
+
+        assert client.client is None
+        with pytest.raises(ResponseCacheMiss):
+            await client.analyze("system", "never recorded")
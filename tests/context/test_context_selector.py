@@ -0,0 +1,84 @@
+"""
+Tests for Context Selector
+"""
+
+from datetime import datetime, timedelta
+
+from src.context.context_selector import (
+    TRUNCATION_MARKER,
+    ContextSelector,
+    SelectionSignals,
+    recency_signal,
+)
+from src.context.token_counter import TokenCounter
+
+
+def _entry(article_id, words=20, source=None):
+    return {
+        "id": article_id,
+        "title": f"Article {article_id}",
+        "source": source or f"Source {article_id}",
+        "content": " ".join(["word"] * words),
+    }
+
+
+class TestRecencySignal:
+    """Tests for the recency decay"""
+
+    def test_halves_every_half_life(self):
+        """A day-old article should score half a fresh one"""
+        now = datetime(2026, 1, 2)
+
+        assert recency_signal(now, now) == 1.0
+        assert recency_signal(now - timedelta(hours=24), now) == 0.5
+        assert recency_signal(None, now) == 0.5
+
+
+class TestContextSelector:
+    """Tests for budgeted article selection"""
+
+    def test_keeps_everything_that_fits(self):
+        """A generous budget should keep every article untouched and in order"""
+        entries = [_entry(i) for i in range(5)]
+
+        selected, log = ContextSelector(TokenCounter()).select(entries, {}, budget=10000)
+
+        assert selected == entries
+        assert {record["decision"] for record in log} == {"full"}
+
+    def test_prefers_relevant_older_articles_over_recent_filler(self):
+        """A relevant article should beat a recent low-value one when only one fits"""
+        counter = TokenCounter()
+        relevant, filler = _entry(1), _entry(2)
+        signals = {
+            1: SelectionSignals(relevance=1.0, recency=0.1, topic=1.0),
+            2: SelectionSignals(relevance=0.1, recency=1.0, topic=0.0),
+        }
+        budget = counter.count_article(relevant) + 3
+
+        selected, _log = ContextSelector(counter).select([filler, relevant], signals, budget)
+
+        assert [entry["id"] for entry in selected] == [1]
+
+    def test_truncates_long_articles_instead_of_dropping(self):
+        """Long articles should be cut to their lead when full text does not fit"""
+        counter = TokenCounter()
+        entries = [_entry(i, words=1000) for i in range(3)]
+
+        selected, log = ContextSelector(counter).select(entries, {}, budget=1000)
+
+        assert len(selected) == 3
+        assert any(entry["content"].endswith(TRUNCATION_MARKER) for entry in selected)
+        assert counter.count_articles(selected) <= 1000
+        assert "truncated" in {record["decision"] for record in log}
+
+    def test_source_diversity(self):
+        """With equal signals, a second source should beat a repeat of the first"""
+        counter = TokenCounter()
+        entries = [_entry(1, source="Wire"), _entry(2, source="Wire"), _entry(3, source="Local")]
+        budget = 2 * (counter.count_article(entries[0]) + 1) + 1
+
+        selected, log = ContextSelector(counter).select(entries, {}, budget)
+
+        assert {entry["source"] for entry in selected} == {"Wire", "Local"}
+        assert [record["decision"] for record in log].count("dropped") == 1
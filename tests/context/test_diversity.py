@@ -0,0 +1,79 @@
+"""
+Tests for Diversity Selection
+"""
+
+from src.context.article_records import ArticleRecord, FeedRecord
+from src.context.diversity import DiversityParams, DiversitySelector, shingles
+
+
+def _record(article_id, title, feed="Feed", story_id=None):
+    return ArticleRecord(
+        id=article_id,
+        title=title,
+        description=None,
+        url=None,
+        published_date=None,
+        fetched_at=None,
+        entities=None,
+        embedding_summary=None,
+        relevance_score=None,
+        story_id=story_id,
+        normalized_content=None,
+        feed=FeedRecord(name=feed, category=None),
+    )
+
+
+class TestDiversitySelector:
+    """Tests for maximal marginal relevance selection"""
+
+    def test_shingles_detect_near_duplicates(self):
+        """Reworded copies should share most shingles; unrelated text none"""
+        a = shingles("County board approves new budget for schools on Tuesday night")
+        b = shingles("County board approves new budget for schools on Tuesday")
+
+        assert len(a & b) / len(a | b) > 0.8
+        assert not a & shingles("Storm knocks out power across the region")
+
+    def test_prefers_novel_articles_over_same_story(self):
+        """A second article from the same story should lose to a less relevant new one"""
+        articles = [
+            _record(1, "Budget vote", feed="A", story_id=7),
+            _record(2, "Budget vote follow-up", feed="B", story_id=7),
+            _record(3, "Road closure", feed="C"),
+        ]
+        relevance = {1: 0.9, 2: 0.85, 3: 0.6}
+
+        kept, stats = DiversitySelector().select(articles, relevance, k=2)
+
+        assert [a.id for a in kept] == [1, 3]
+        assert stats["candidates"] == 3 and stats["selected"] == 2
+
+    def test_lambda_one_ignores_redundancy(self):
+        """With all weight on relevance the duplicate should be kept"""
+        articles = [
+            _record(1, "Budget vote", feed="A", story_id=7),
+            _record(2, "Budget vote follow-up", feed="B", story_id=7),
+            _record(3, "Road closure", feed="C"),
+        ]
+        relevance = {1: 0.9, 2: 0.85, 3: 0.6}
+
+        kept, _stats = DiversitySelector(DiversityParams(lambda_=1.0)).select(
+            articles, relevance, k=2
+        )
+
+        assert [a.id for a in kept] == [1, 2]
+
+    def test_source_cap_prefers_other_feeds_then_backfills(self):
+        """Capped feeds should yield to others and only fill slots left over"""
+        articles = [_record(i, f"Wire story {i}", feed="Wire") for i in range(4)]
+        articles.append(_record(9, "Local story", feed="Local"))
+        relevance = dict.fromkeys(range(4), 0.9) | {9: 0.1}
+        params = DiversityParams(lambda_=1.0, source_cap=2)
+
+        kept, stats = DiversitySelector(params).select(articles, relevance, k=3)
+        assert {a.id for a in kept} == {0, 1, 9}
+        assert stats["source_capped"] == 2
+        assert stats["lambda"] == 1.0 and stats["source_cap"] == 2
+
+        kept, stats = DiversitySelector(params).select(articles, relevance, k=4)
+        assert len(kept) == 4 and stats["source_capped"] == 1
@@ -0,0 +1,90 @@
+"""
+Tests for Gazetteer
+"""
+
+import pytest
+
+from src.context.gazetteer import PLACES, Gazetteer, Place, build_alias_index
+
+FAIRFAX = {"city": "Fairfax", "state": "Virginia", "region": "Northern Virginia"}
+
+
+class TestGazetteerData:
+    """Tests for the static place table"""
+
+    def test_every_parent_exists(self):
+        """Containment chains should never dangle"""
+        assert all(place.parent in PLACES for place in PLACES.values() if place.parent)
+
+    def test_duplicate_alias_is_rejected(self):
+        """An alias naming two places should fail loudly"""
+        duplicate = Place("xx", "Virginia", "state", "us")
+
+        with pytest.raises(ValueError, match="Virginia"):
+            build_alias_index([PLACES["us-va"], duplicate])
+
+
+class TestResolve:
+    """Tests for resolving place mentions"""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("West Virginia coal plant closes", {"us-wv"}),
+            ("Washington State wildfires spread", {"us-wa"}),
+            ("Washington lawmakers return", {"us-dc"}),
+            ("Republic of Georgia protests", {"ge"}),
+            ("Georgia runoff results", {"us-ga"}),
+            ("House votes on farm bill", set()),
+            ("New York City subway delays", {"us-ny/new-york-city"}),
+        ],
+    )
+    def test_longest_mention_wins(self, text, expected):
+        """Overlapping names should resolve to the longest, most specific mention"""
+        assert Gazetteer(FAIRFAX).resolve(text) == expected
+
+    def test_user_city_missing_from_gazetteer_is_added(self):
+        """An unknown home city should become a local place under the user's state"""
+        gazetteer = Gazetteer({"city": "Blacksburg", "state": "Virginia"})
+
+        (place_id,) = gazetteer.resolve("Blacksburg council vote")
+
+        assert place_id == "us-va/blacksburg"
+        assert gazetteer.scope_of(place_id) == "local"
+
+    def test_home_city_in_another_state_is_not_confused(self):
+        """A Texas user in Arlington should not treat Arlington, Virginia as home"""
+        gazetteer = Gazetteer({"city": "Arlington", "state": "Texas"})
+
+        assert gazetteer.resolve("Arlington schools") == {"us-tx/arlington"}
+        assert gazetteer.scope_of("us-va/arlington-county") == "national"
+
+
+class TestScopes:
+    """Tests for classifying places relative to the user"""
+
+    def test_scope_follows_containment(self):
+        """Each place should take the most specific scope that contains it"""
+        gazetteer = Gazetteer(FAIRFAX)
+
+        assert gazetteer.scope_of("us-va/reston") == "local"
+        assert gazetteer.scope_of("us-va/richmond") == "state"
+        assert gazetteer.scope_of("us-dc") == "national"
+        assert gazetteer.scope_of("fr") == "global"
+
+    def test_state_inferred_from_city(self):
+        """Profiles without a state should still get state scope from the city"""
+        gazetteer = Gazetteer({"city": "Fairfax"})
+
+        assert gazetteer.state_id == "us-va"
+        assert gazetteer.scope_of("us-va/roanoke") == "state"
+
+    def test_scope_place_ids_partition_places(self):
+        """Every place should fall in exactly one scope"""
+        gazetteer = Gazetteer(FAIRFAX)
+        scopes = ("local", "state", "national", "global")
+
+        groups = [gazetteer.scope_place_ids([scope]) for scope in scopes]
+
+        assert sum(len(group) for group in groups) == len(gazetteer.places)
+        assert set().union(*groups) == set(gazetteer.places)
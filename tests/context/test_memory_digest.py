@@ -0,0 +1,87 @@
+"""
+Tests for Memory Digest
+"""
+
+from datetime import datetime
+
+from src.context.memory_digest import (
+    DIGEST_MAX_TOKENS,
+    MAX_DIGEST_ACTORS,
+    build_memory_digest,
+    format_memory_digest,
+)
+from src.context.token_counter import TokenCounter
+
+
+def _situation(title, actors=("County Board", "VDOT"), question="Will funding pass?"):
+    return {
+        "title": title,
+        "narrative": "Long narrative^[1,2] " * 200,
+        "actors": [{"name": name, "role": "Decides"} for name in actors],
+        "where_this_goes": {"unresolved_question": question, "what_to_watch": "Budget vote"},
+        "information_gaps": [{"what_is_missing": "Budget detail"}],
+    }
+
+
+class TestBuildMemoryDigest:
+    """Tests for digesting stored syntheses"""
+
+    def test_keeps_titles_actors_and_open_questions(self):
+        """Two-pass syntheses should reduce to their situations and thin topics"""
+        synthesis_data = {
+            "situations": [_situation("Route 7 widening stalls")],
+            "thin_coverage": [{"title": "Library hours change", "note": "Minor"}],
+            "metadata": {"citation_map": {"1": {"title": "Article", "url": "https://x"}}},
+        }
+
+        digest = build_memory_digest(synthesis_data)
+
+        assert digest == {
+            "situations": [
+                {
+                    "title": "Route 7 widening stalls",
+                    "actors": ["County Board", "VDOT"],
+                    "open_question": "Will funding pass?",
+                    "watch": "Budget vote",
+                }
+            ],
+            "thin": ["Library hours change"],
+        }
+
+    def test_reads_legacy_bottom_line(self):
+        """Older syntheses without situations should keep their bottom line"""
+        digest = build_memory_digest({"bottom_line": {"summary": "Storm recovery continues"}})
+
+        assert digest["situations"][0]["title"] == "Storm recovery continues"
+
+    def test_digest_is_token_bounded(self):
+        """Large syntheses should be clipped to the digest cap"""
+        synthesis_data = {
+            "situations": [
+                _situation(
+                    "Situation title " * 50,
+                    actors=[f"Actor {i} " * 20 for i in range(10)],
+                    question="Open question " * 50,
+                )
+                for _ in range(20)
+            ],
+            "thin_coverage": [{"title": "Thin topic " * 50} for _ in range(20)],
+        }
+
+        digest = build_memory_digest(synthesis_data)
+
+        assert TokenCounter().count_json(digest) <= DIGEST_MAX_TOKENS
+        assert digest["situations"]
+        assert len(digest["situations"][0]["actors"]) <= MAX_DIGEST_ACTORS
+
+    def test_format_lists_each_situation(self):
+        """Formatted blocks should be dated and carry one line per situation"""
+        digest = build_memory_digest({"situations": [_situation("Route 7 widening stalls")]})
+
+        block = format_memory_digest(digest, datetime(2026, 1, 1), now=datetime(2026, 1, 3))
+
+        assert block.splitlines() == [
+            "**2026-01-01 (2 days ago):**",
+            "- Route 7 widening stalls | Actors: County Board, VDOT"
+            " | Open: Will funding pass? | Watch: Budget vote",
+        ]
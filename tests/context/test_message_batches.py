@@ -0,0 +1,181 @@
+"""
+Tests for Message Batches mode, against a local stand-in for the batch endpoints
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from src.context.claude_client import ClaudeClient
+from src.context.message_batches import BATCH_COLLECT_SECONDS, MessageBatcher
+from src.utils.error_handling import ClaudeAPIError
+
+
+def _message(text):
+    return SimpleNamespace(
+        content=[SimpleNamespace(text=text)],
+        usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+    )
+
+
+class _Results:
+    def __init__(self, entries):
+        self.entries = entries
+
+    async def __aiter__(self):
+        for entry in self.entries:
+            yield entry
+
+
+class LocalBatches:
+    """
+    Stand-in for messages.batches: answers each request with its user message echoed
+
+    A batch ends after `polls_to_end` retrieve calls; `outcomes` overrides the
+    result type for given user messages ("errored", "expired", ...).
+    """
+
+    def __init__(self, polls_to_end=1, outcomes=None):
+        self.polls_to_end = polls_to_end
+        self.outcomes = outcomes or {}
+        self.batches = {}
+        self.cancelled = []
+
+    async def create(self, requests):
+        batch_id = f"batch-{len(self.batches) + 1}"
+        self.batches[batch_id] = {"requests": requests, "polls": 0}
+        return SimpleNamespace(id=batch_id, processing_status="in_progress")
+
+    async def retrieve(self, batch_id):
+        batch = self.batches[batch_id]
+        batch["polls"] += 1
+        ended = batch["polls"] >= self.polls_to_end
+        return SimpleNamespace(id=batch_id, processing_status="ended" if ended else "in_progress")
+
+    async def cancel(self, batch_id):
+        self.cancelled.append(batch_id)
+
+    async def results(self, batch_id):
+        entries = []
+        # Results come back in no particular order
+        for request in reversed(self.batches[batch_id]["requests"]):
+            content = request["params"]["messages"][0]["content"]
+            outcome = self.outcomes.get(content, "succeeded")
+            result = SimpleNamespace(type=outcome, error="overloaded")
+            if outcome == "succeeded":
+                result.message = _message(f"answer: {content}")
+            entries.append(SimpleNamespace(custom_id=request["custom_id"], result=result))
+        return _Results(entries)
+
+
+def _batch_client(batches, timeout_seconds=5.0):
+    client = ClaudeClient(api_key="test-key", requests_per_minute=60000)
+    client.client = SimpleNamespace(
+        messages=SimpleNamespace(create=AsyncMock(return_value=_message("direct")))
+    )
+    client.batcher = MessageBatcher(
+        batches,
+        fallback=client._create_message,
+        poll_seconds=0.001,
+        timeout_seconds=timeout_seconds,
+    )
+    return client
+
+
+class TestMessageBatching:
+    """Tests for collecting concurrent requests into one batch"""
+
+    async def test_concurrent_requests_share_one_batch(self):
+        batches = LocalBatches(polls_to_end=3)
+        client = _batch_client(batches)
+
+        answers = await asyncio.gather(
+            *(client.analyze("system", f"q{i}", batch=True) for i in range(5))
+        )
+
+        assert answers == [f"answer: q{i}" for i in range(5)]
+        assert len(batches.batches) == 1
+        assert len(batches.batches["batch-1"]["requests"]) == 5
+        assert client.usage_totals()["calls"] == 5
+        client.client.messages.create.assert_not_called()
+
+    async def test_later_requests_start_a_new_batch(self):
+        batches = LocalBatches()
+        client = _batch_client(batches)
+
+        await client.analyze("system", "first", batch=True)
+        await client.analyze("system", "second", batch=True)
+
+        assert client.batcher.batch_ids == ["batch-1", "batch-2"]
+
+    async def test_timeout_cancels_and_falls_back_to_direct_calls(self):
+        batches = LocalBatches(polls_to_end=10**6)
+        client = _batch_client(batches, timeout_seconds=0.01)
+
+        answers = await asyncio.gather(
+            client.analyze("system", "a", batch=True), client.analyze("system", "b", batch=True)
+        )
+
+        assert answers == ["direct", "direct"]
+        assert batches.cancelled == ["batch-1"]
+        assert client.client.messages.create.call_count == 2
+
+    async def test_expired_requests_retry_and_errors_stay_per_request(self):
+        batches = LocalBatches(outcomes={"late": "expired", "bad": "errored"})
+        client = _batch_client(batches)
+
+        answers = await asyncio.gather(
+            client.analyze("system", "ok", batch=True),
+            client.analyze("system", "late", batch=True),
+            client.analyze("system", "bad", batch=True),
+            return_exceptions=True,
+        )
+
+        assert answers[0] == "answer: ok"
+        assert answers[1] == "direct"
+        assert isinstance(answers[2], ClaudeAPIError)
+        assert client.client.messages.create.call_count == 1
+
+    async def test_cancelled_caller_does_not_break_the_batch(self):
+        batches = LocalBatches(polls_to_end=5)
+        client = _batch_client(batches)
+
+        cancelled = asyncio.create_task(client.analyze("system", "gone", batch=True))
+        kept = asyncio.create_task(client.analyze("system", "kept", batch=True))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await kept == "answer: kept"
+        assert cancelled.cancelled()
+        assert len(batches.batches["batch-1"]["requests"]) == 2
+
+    async def test_cancelled_flush_cancels_waiting_callers(self):
+        batches = LocalBatches(polls_to_end=10**6)
+        client = _batch_client(batches)
+
+        callers = [
+            asyncio.create_task(client.analyze("system", f"q{i}", batch=True)) for i in range(2)
+        ]
+        await asyncio.sleep(0)
+        flush_task = client.batcher.flush_task
+        # Cancel while the batch is being polled
+        await asyncio.sleep(BATCH_COLLECT_SECONDS * 2)
+        flush_task.cancel()
+
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        assert batches.batches["batch-1"]["polls"] > 0
+        assert all(isinstance(result, asyncio.CancelledError) for result in results)
+
+
+class TestBatchOptIn:
+    """Tests for opting individual requests into batches"""
+
+    async def test_unbatched_requests_are_sent_directly(self):
+        batches = LocalBatches()
+        client = _batch_client(batches)
+
+        answer = await client.analyze("system", "now")
+
+        assert answer == "direct"
+        assert batches.batches == {}
@@ -0,0 +1,90 @@
+"""
+Tests for Relevance Scoring
+"""
+
+from datetime import datetime, timedelta
+
+from src.context.relevance import RelevanceScorer, base_relevance, rank_key
+from src.context.topic_scores import TopicScoreIndex
+from src.context.vector_index import embed_text
+from src.database.models import Article, RSSFeed
+
+
+def _add_articles(session, titles, published=None):
+    feed = RSSFeed(url="https://example.com/rss", name="Feed")
+    session.add(feed)
+    session.flush()
+    articles = [
+        Article(feed_id=feed.id, guid=f"g{i}", title=title, published_date=published)
+        for i, title in enumerate(titles)
+    ]
+    session.add_all(articles)
+    session.commit()
+    return articles
+
+
+class TestRankKey:
+    """Tests for the store-once rank key"""
+
+    def test_orders_like_decayed_relevance(self):
+        """A relevant day-old article should rank with half its relevance fresh"""
+        now = datetime(2026, 1, 2)
+
+        assert rank_key(0.8, now - timedelta(hours=24)) == rank_key(0.4, now)
+        assert rank_key(0.8, now - timedelta(hours=12)) > rank_key(0.4, now)
+        assert rank_key(0.3, now) > rank_key(0.8, now - timedelta(hours=48))
+
+    def test_base_relevance_round_trips(self):
+        """The base relevance should be recoverable from the stored key"""
+        published = datetime(2026, 1, 2, 6)
+
+        assert abs(base_relevance(rank_key(0.65, published), published) - 0.65) < 1e-9
+
+
+class TestRelevanceScorer:
+    """Tests for computing and refreshing stored scores"""
+
+    def _scorer(self, profile, trust=None):
+        profile.get_source_calibration.return_value = {"trust_overrides": trust or {}}
+        return RelevanceScorer(profile)
+
+    def test_local_interest_articles_score_higher(self, test_session, sample_user_profile):
+        """A local cybersecurity story should outrank an unplaced off-topic one"""
+        published = datetime.utcnow()
+        local, other = _add_articles(
+            test_session,
+            ["Ransomware attack hits Fairfax County schools", "Celebrity wedding photos"],
+            published=published,
+        )
+        TopicScoreIndex(sample_user_profile.get_primary_location()).score_articles(
+            test_session, [local, other]
+        )
+
+        scored = self._scorer(sample_user_profile).score_articles(
+            test_session, [local.id, other.id]
+        )
+
+        test_session.refresh(local)
+        test_session.refresh(other)
+        assert scored == 2
+        assert local.relevance_score > other.relevance_score
+        assert base_relevance(local.relevance_score, published) > 0.7
+
+    def test_semantic_match_counts_as_topic(self, test_session, sample_user_profile):
+        """An article close to an interest's vector should score without keyword hits"""
+        scorer = self._scorer(sample_user_profile)
+        on_topic = embed_text("Phishing emails and malware target the network of a local bank")
+
+        assert scorer.semantic_match(on_topic) > scorer.semantic_match(embed_text("Bake sale"))
+        assert scorer.base(0.0, [], None, semantic=1.0) > scorer.base(0.0, [], None)
+
+    def test_refresh_rescores_only_stale_articles(self, test_session, sample_user_profile):
+        """Scored articles should be skipped until the profile changes"""
+        _add_articles(test_session, ["Ransomware attack", "School board vote"])
+        since = datetime.utcnow() - timedelta(hours=1)
+
+        assert self._scorer(sample_user_profile).refresh(test_session, since) == 2
+        assert self._scorer(sample_user_profile).refresh(test_session, since) == 0
+        assert (
+            self._scorer(sample_user_profile, trust={"Feed": 0.9}).refresh(test_session, since) == 2
+        )
@@ -0,0 +1,103 @@
+"""
+Tests for the Claude Response Cache
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+
+from src.context import response_cache
+from src.context.response_cache import ResponseCache, get_response_cache
+
+REQUEST = {
+    "model": "claude-sonnet-4-20250514",
+    "max_tokens": 1024,
+    "temperature": 0.0,
+    "system": [{"type": "text", "text": "rules", "cache_control": {"type": "ephemeral"}}],
+    "messages": [{"role": "user", "content": "Cluster these"}],
+}
+
+
+class TestResponseCacheKey:
+    """Tests for request keys"""
+
+    def test_same_request_same_key(self):
+        assert ResponseCache.key(REQUEST) == ResponseCache.key(dict(reversed(REQUEST.items())))
+
+    def test_any_field_changes_key(self):
+        base = ResponseCache.key(REQUEST)
+        for field, value in [
+            ("model", "other-model"),
+            ("temperature", 1.0),
+            ("system", "other rules"),
+            ("messages", [{"role": "user", "content": "Summarize these"}]),
+        ]:
+            assert ResponseCache.key({**REQUEST, field: value}) != base
+
+
+class TestResponseCacheStorage:
+    """Tests for storing, expiring and evicting responses"""
+
+    def test_round_trip(self, tmp_path):
+        cache = ResponseCache(tmp_path)
+        key = cache.key(REQUEST)
+
+        assert cache.get(key) is None
+        cache.put(key, '{"clusters": []}', REQUEST["model"])
+
+        assert cache.get(key) == '{"clusters": []}'
+
+    def test_expired_entry_misses_except_in_replay(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl_hours=1)
+        key = cache.key(REQUEST)
+        cache.put(key, "old", REQUEST["model"])
+        path = tmp_path / f"{key}.json"
+        entry = json.loads(path.read_text())
+        entry["created_at"] = (datetime.utcnow() - timedelta(hours=2)).isoformat()
+        path.write_text(json.dumps(entry))
+
+        assert cache.get(key) is None
+        assert ResponseCache(tmp_path, ttl_hours=1, replay=True).get(key) == "old"
+
+    def test_evicts_oldest_beyond_size_bound(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=2500)
+        for i in range(4):
+            cache.put(f"k{i}", "x" * 1000, "model")
+            os.utime(tmp_path / f"k{i}.json", (i, i))
+        cache.put("k4", "x" * 1000, "model")
+
+        assert sorted(p.stem for p in tmp_path.glob("*.json")) == ["k3", "k4"]
+
+    def test_scans_directory_only_when_over_bound(self, tmp_path, monkeypatch):
+        cache = ResponseCache(tmp_path, max_bytes=2500)
+        scans = []
+        original_evict = cache._evict
+        monkeypatch.setattr(cache, "_evict", lambda: scans.append(1) or original_evict())
+
+        for i in range(3):
+            cache.put(f"k{i}", "x" * 1000, "model")
+
+        # First write learns the directory size; the third passes the bound
+        assert len(scans) == 2
+
+    def test_explicit_zero_overrides_settings(self, tmp_path):
+        cache = ResponseCache(tmp_path, ttl_hours=0, max_bytes=0)
+        key = cache.key(REQUEST)
+        cache.put(key, "text", REQUEST["model"])
+
+        assert cache.ttl == timedelta(0)
+        assert list(tmp_path.glob("*.json")) == []
+
+
+class TestGetResponseCache:
+    """Tests for the configured cache mode"""
+
+    def test_modes(self, monkeypatch):
+        monkeypatch.setattr(response_cache.settings, "claude_response_cache", "off")
+        assert get_response_cache() is None
+
+        monkeypatch.setattr(response_cache.settings, "claude_response_cache", "replay")
+        assert get_response_cache().replay
+
+        monkeypatch.setattr(response_cache.settings, "claude_response_cache", "sometimes")
+        assert get_response_cache() is None
@@ -24,6 +24,27 @@ class TestSynthesizerConfiguration:
 
         mock_curator.assert_called_with(topic_filters=filters)
 
+    @patch("src.context.synthesizer.FrameManager")
+    @patch("src.context.synthesizer.ContextCurator")
+    @patch("src.context.synthesizer.ClaudeClient")
+    async def test_batch_mode_applies_to_pass_two_only(
+        self, mock_client, mock_curator, mock_frame_mgr
+    ):
+        """Batch mode should batch thin summaries but never clustering"""
+        client = mock_client.return_value
+        client.analyze = AsyncMock(return_value='{"clusters": [], "thin_coverage": []}')
+        synthesizer = NarrativeSynthesizer(batch_mode=True)
+
+        await synthesizer._cluster_articles([{"title": "A", "content": "Body"}])
+        await synthesizer._summarize_thin_clusters(
+            [{"title": "T", "article_ids": [1]}], [{"source": "S"}]
+        )
+
+        cluster_call, thin_call = client.analyze.call_args_list
+        assert not cluster_call.kwargs.get("batch")
+        assert thin_call.kwargs["batch"] is True
+        mock_client.assert_called_with()
+
 
 class TestJsonParsing:
     """Tests for Claude JSON response parsing"""
@@ -86,6 +107,35 @@ class TestCitationMap:
         assert result["2"]["source"] == "Source B"
 
 
+class TestStoryCoverage:
+    """Tests for cross-day story coverage on situations"""
+
+    @patch("src.context.synthesizer.FrameManager")
+    @patch("src.context.synthesizer.ContextCurator")
+    @patch("src.context.synthesizer.ClaudeClient")
+    def test_uses_widest_story_and_earliest_date(self, mock_client, mock_curator, mock_frame_mgr):
+        """Coverage should report the most-syndicated story and first sighting"""
+        synthesizer = NarrativeSynthesizer()
+        cluster_articles = [
+            {"id": 1, "story": {"feed_count": 2, "first_seen": "2026-01-03T08:00:00"}},
+            {"id": 2, "story": {"feed_count": 5, "first_seen": "2026-01-01T08:00:00"}},
+            {"id": 3},
+        ]
+
+        result = synthesizer._story_coverage(cluster_articles)
+
+        assert result == {"feed_count": 5, "first_seen": "2026-01-01T08:00:00"}
+
+    @patch("src.context.synthesizer.FrameManager")
+    @patch("src.context.synthesizer.ContextCurator")
+    @patch("src.context.synthesizer.ClaudeClient")
+    def test_returns_none_without_story_data(self, mock_client, mock_curator, mock_frame_mgr):
+        """Clusters without story data should get no coverage line"""
+        synthesizer = NarrativeSynthesizer()
+
+        assert synthesizer._story_coverage([{"id": 1}]) is None
+
+
 class TestEstimateTokens:
     """Tests for token estimation"""
 
@@ -287,3 +337,92 @@ class TestSynthesizeTwoPass:
         assert synthesis_data["metadata"]["clusters_analyzed"] == 1
         assert synthesis_data["metadata"]["clusters_thin"] == 2
         assert synthesis_data["metadata"]["analysis_threshold"] == "2+ articles"
+
+
+class TestConcurrentSituations:
+    """Tests for running Pass 2 situation analyses concurrently"""
+
+    @staticmethod
+    def _synthesizer(mock_client, mock_curator, mock_frame_mgr, analyze_with_context):
+        mock_curator.return_value._format_user_profile = MagicMock(return_value={})
+        mock_curator.return_value._get_synthesis_instructions = MagicMock(return_value="")
+        mock_client.return_value.analyze_with_context = analyze_with_context
+        frames = mock_frame_mgr.return_value
+        frames.find_matching_cluster.return_value = None
+        frames.discover_frames = AsyncMock(side_effect=lambda _a, c: {"cluster": c["title"]})
+        return NarrativeSynthesizer()
+
+    @patch("src.context.synthesizer.FrameManager")
+    @patch("src.context.synthesizer.ContextCurator")
+    @patch("src.context.synthesizer.ClaudeClient")
+    async def test_overlaps_requests_and_keeps_cluster_order(
+        self, mock_client, mock_curator, mock_frame_mgr
+    ):
+        """Situations should run together yet come back in cluster order"""
+        import asyncio
+
+        in_flight = []
+        peak = []
+
+        async def analyze_with_context(context, task, temperature, cached_prefix, batch):
+            in_flight.append(task)
+            peak.append(len(in_flight))
+            title = context["articles"][0]["title"]
+            # Earlier clusters finish last
+            await asyncio.sleep(0.01 * (5 - int(title[-1])))
+            in_flight.remove(task)
+            if title.endswith("2"):
+                raise RuntimeError("API error")
+            return json.dumps({"title": f"Situation {title}", "narrative": "N"})
+
+        synthesizer = self._synthesizer(
+            mock_client, mock_curator, mock_frame_mgr, AsyncMock(side_effect=analyze_with_context)
+        )
+        articles = [{"id": i, "title": f"Article {i}"} for i in range(1, 5)]
+        clusters = [{"title": f"Topic {i}", "article_ids": [i]} for i in range(1, 5)]
+
+        situations = await synthesizer._analyze_situations(clusters, articles, {})
+
+        assert max(peak) == 4
+        assert [s["title"] for s in situations] == [
+            "Situation Article 1",
+            "Situation Article 3",
+            "Situation Article 4",
+        ]
+        stored = mock_frame_mgr.return_value.store_discovered_frames.call_args_list
+        assert [call.args[0]["title"] for call in stored] == ["Topic 1", "Topic 3", "Topic 4"]
+
+    @patch("src.context.synthesizer.FrameManager")
+    @patch("src.context.synthesizer.ContextCurator")
+    @patch("src.context.synthesizer.ClaudeClient")
+    async def test_overlapping_new_clusters_discover_frames_once(
+        self, mock_client, mock_curator, mock_frame_mgr
+    ):
+        """A new cluster matching one stored earlier in the run should not rediscover it"""
+
+        async def analyze_with_context(context, task, temperature, cached_prefix, batch):
+            title = context["articles"][0]["title"]
+            return json.dumps(
+                {
+                    "title": f"Situation {title}",
+                    "narrative": "N",
+                    "coverage_frame": {"de_emphasized": "labour"},
+                }
+            )
+
+        synthesizer = self._synthesizer(
+            mock_client, mock_curator, mock_frame_mgr, AsyncMock(side_effect=analyze_with_context)
+        )
+        frames = mock_frame_mgr.return_value
+        stored = MagicMock(id=7)
+        # Both clusters miss up front; the second matches the first once it is stored
+        frames.find_matching_cluster.side_effect = [None, None, None, stored]
+        articles = [{"id": i, "title": f"Article {i}"} for i in range(1, 3)]
+        clusters = [{"title": f"Trade talks {i}", "article_ids": [i]} for i in range(1, 3)]
+
+        situations = await synthesizer._analyze_situations(clusters, articles, {})
+
+        assert len(situations) == 2
+        assert frames.discover_frames.await_count == 1
+        assert frames.store_discovered_frames.call_count == 1
+        frames.update_frame_gaps.assert_called_once_with(7, ["labour"])
@@ -0,0 +1,78 @@
+"""
+Tests for Token Counter
+"""
+
+import json
+
+from src.context.token_counter import TokenCounter, count_text_tokens, truncate_to_tokens
+
+
+class TestCountTextTokens:
+    """Tests for the tokenizer approximation"""
+
+    def test_english_prose_is_about_four_chars_per_token(self):
+        """Ordinary prose should land near the usual chars-per-token ratio"""
+        text = (
+            "The county board approved a new budget on Tuesday, adding funding for "
+            "schools, transit and emergency services after a lengthy public hearing."
+        )
+
+        ratio = len(text) / count_text_tokens(text)
+
+        assert 3.0 <= ratio <= 6.0
+
+    def test_non_ascii_text_costs_more(self):
+        """Non-Latin text should not be undercounted at four chars per token"""
+        assert count_text_tokens("東京都の予算") >= len("東京都の予算")
+
+    def test_empty_text(self):
+        """Empty text should cost nothing"""
+        assert count_text_tokens("") == 0
+
+    def test_truncate_to_tokens_fits_budget(self):
+        """Truncation should return a prefix within the budget, cut between words"""
+        text = "one two three four five six seven"
+
+        truncated = truncate_to_tokens(text, 3)
+
+        assert truncated == "one two three"
+        assert count_text_tokens(truncated) <= 3
+        assert truncate_to_tokens(text, 100) == text
+
+
+class TestTokenCounter:
+    """Tests for cached context counting"""
+
+    def test_article_counts_are_cached_per_content_version(self):
+        """Recounting an unchanged article should hit the cache; edits should miss"""
+        counter = TokenCounter()
+        article = {"id": 1, "title": "Budget vote", "content": "The board voted."}
+
+        first = counter.count_article(article)
+        assert counter.count_article(dict(article)) == first
+        assert (counter.hits, counter.misses) == (1, 1)
+
+        counter.count_article({**article, "content": "The board voted again, narrowly."})
+        assert counter.misses == 2
+
+    def test_count_articles_matches_serialized_list(self):
+        """Summed per-article counts should track counting the JSON list directly"""
+        counter = TokenCounter()
+        articles = [
+            {"id": i, "title": f"Story {i}", "content": "Officials met to discuss the plan."}
+            for i in range(10)
+        ]
+
+        summed = counter.count_articles(articles)
+        direct = count_text_tokens(json.dumps(articles))
+
+        assert abs(summed - direct) <= len(articles) + 1
+
+    def test_count_context_skips_private_keys(self):
+        """Metadata keys such as _token_metadata should not be counted"""
+        counter = TokenCounter()
+        context = {"memory": "Prior summaries", "articles": [{"id": 1, "title": "A"}]}
+
+        assert counter.count_context({**context, "_token_metadata": {"total": 99}}) == (
+            counter.count_context(context)
+        )
@@ -5,6 +5,7 @@ Tests for Topic Matcher
 from unittest.mock import MagicMock
 
 from src.context.topic_matcher import TOPIC_KEYWORDS, TopicMatcher
+from src.processors.keyword_automaton import tokenize
 
 
 class TestTopicKeywords:
@@ -255,6 +256,19 @@ class TestMatchesScope:
 
         assert result is True
 
+    def test_west_virginia_is_not_state_scope_for_virginia(self, sample_article_for_context):
+        """A longer place name should not also match the user's state inside it"""
+        matcher = TopicMatcher()
+        article = sample_article_for_context(
+            title="West Virginia legislature passes new bill",
+            description="Charleston lawmakers vote",
+        )
+
+        signals = matcher.analyze(article, {"state": "Virginia", "city": "Fairfax"})
+
+        assert signals.places == {"us-wv"}
+        assert signals.scopes == {"national"}
+
     def test_unknown_scope_returns_true(self, sample_article_for_context):
         """Should return True for unknown scope (no filtering)"""
         matcher = TopicMatcher()
@@ -379,3 +393,66 @@ class TestFilterArticles:
         # If both match, high_score should be first
         if len(result) >= 2:
             assert result[0].id == 2
+
+
+class TestCompiledMatching:
+    """Tests for single-pass, word-boundary matching and per-run caching"""
+
+    def test_short_keywords_do_not_match_inside_words(self, sample_article_for_context):
+        """'ai' should not match 'said' and 'ml' should not match 'html'"""
+        matcher = TopicMatcher()
+        article = sample_article_for_context(
+            title="Mayor said the HTML page was fixed",
+            description="Officials said repairs continue",
+            normalized_content="",
+        )
+
+        _matches, score = matcher.matches_topic(article, "ai/ml")
+
+        assert score == 0.0
+
+    def test_analyze_scores_all_topics_and_scopes(self, sample_article_for_context):
+        """One analysis should cover every topic and scope"""
+        matcher = TopicMatcher()
+        article = sample_article_for_context(
+            title="Fairfax schools adopt AI tutoring after ransomware attack",
+            description="Federal grants fund classroom machine learning",
+            normalized_content="",
+        )
+
+        signals = matcher.analyze(article, {"city": "Fairfax", "state": "Virginia"})
+
+        assert signals.topic_scores["ai/ml"] >= 3.0
+        assert signals.topic_scores["cybersecurity"] >= 3.0
+        assert signals.topic_scores["education"] >= 3.0
+        assert {"local", "national"} <= signals.scopes
+
+    def test_results_cached_per_article_id(self, sample_article_for_context, mocker):
+        """Repeated topic checks should scan the article text once"""
+        matcher = TopicMatcher()
+        article = sample_article_for_context(id=7, title="Ransomware attack on hospital")
+        tokenize_spy = mocker.patch("src.context.topic_matcher.tokenize", wraps=tokenize)
+
+        for topic in ("cybersecurity", "ai/ml", "education"):
+            matcher.matches_topic(article, topic)
+
+        assert tokenize_spy.call_count == 2  # title/description and content, once each
+
+    def test_filter_articles_shares_analysis_between_topic_and_scope(
+        self, sample_article_for_context, sample_user_profile
+    ):
+        """Topic and scope filters should reuse one cached analysis per article"""
+        matcher = TopicMatcher()
+        articles = [
+            sample_article_for_context(id=1, title="Fairfax ransomware attack hits schools"),
+            sample_article_for_context(id=2, title="Ransomware attack in Ohio"),
+        ]
+
+        result = matcher.filter_articles(
+            articles,
+            {"topics": ["cybersecurity", "education"], "scopes": ["local", "state"]},
+            sample_user_profile,
+        )
+
+        assert [a.id for a in result] == [1]
+        assert len(matcher._signals_cache) == 2
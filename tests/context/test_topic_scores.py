@@ -0,0 +1,151 @@
+"""
+Tests for Topic Score Index
+"""
+
+from datetime import datetime, timedelta
+
+from src.context.curator import ContextCurator
+from src.context.topic_scores import TopicScoreIndex, location_key
+from src.database.models import Article, ArticlePlace, ArticleTopicScore, RSSFeed
+
+FAIRFAX = {"city": "Fairfax", "state": "Virginia", "region": "Northern Virginia"}
+
+
+def _add_articles(session, titles):
+    feed = RSSFeed(url="https://example.com/rss", name="Feed")
+    session.add(feed)
+    session.flush()
+    articles = [
+        Article(feed_id=feed.id, guid=f"g{i}", title=title) for i, title in enumerate(titles)
+    ]
+    session.add_all(articles)
+    session.commit()
+    return articles
+
+
+class TestTopicScoreIndex:
+    """Tests for persisting and querying scores"""
+
+    def test_location_key_is_case_insensitive(self):
+        """Keys should not depend on profile capitalization"""
+        assert location_key(FAIRFAX) == location_key(
+            {"city": "fairfax", "state": "VIRGINIA", "region": "northern virginia"}
+        )
+        assert location_key(None) == "||"
+
+    def test_score_articles_stores_topics_places_and_marker(self, test_session):
+        """Each article should get topic rows, place rows and a scored marker"""
+        (article,) = _add_articles(test_session, ["Ransomware attack hits Fairfax County schools"])
+
+        scored = TopicScoreIndex(FAIRFAX).score_articles(test_session, [article])
+
+        rows = {
+            (row.dimension, row.name): row.score
+            for row in test_session.query(ArticleTopicScore).filter_by(article_id=article.id)
+        }
+        places = {row.place_id for row in test_session.query(ArticlePlace)}
+        assert scored == 1
+        assert rows[("topic", "cybersecurity")] >= 3.0
+        assert rows[("meta", "scored")] == 1.0
+        assert places == {"us-va/fairfax-county"}
+
+    def test_places_are_kept_per_location(self, test_session):
+        """Scoring under another location should not replace this location's places"""
+        (article,) = _add_articles(test_session, ["Ransomware attack hits Fairfax County schools"])
+        fairfax = TopicScoreIndex(FAIRFAX)
+        fairfax.score_articles(test_session, [article])
+
+        TopicScoreIndex({"city": "Austin", "state": "Texas"}).score_articles(
+            test_session, [article]
+        )
+
+        assert test_session.query(ArticlePlace).count() == 2
+        assert fairfax.article_scopes(test_session, [article.id]) == {article.id: {"local"}}
+
+    def test_rescoring_replaces_rows(self, test_session):
+        """Scoring the same article twice should not duplicate rows"""
+        (article,) = _add_articles(test_session, ["Ransomware attack"])
+        index = TopicScoreIndex(FAIRFAX)
+
+        index.score_articles(test_session, [article])
+        first = test_session.query(ArticleTopicScore).count()
+        index.score_articles(test_session, [article])
+
+        assert test_session.query(ArticleTopicScore).count() == first
+
+    def test_score_unscored_only_scores_missing_articles(self, test_session):
+        """Already-scored articles should be skipped; a new location rescores"""
+        articles = _add_articles(test_session, ["Ransomware attack", "School board vote"])
+        index = TopicScoreIndex(FAIRFAX)
+        index.score_articles(test_session, articles[:1])
+
+        since = datetime.utcnow() - timedelta(hours=1)
+        assert index.score_unscored(test_session, since) == 1
+        assert index.score_unscored(test_session, since) == 0
+        assert TopicScoreIndex({"city": "Austin"}).score_unscored(test_session, since) == 2
+
+    def test_rescore_replaces_existing_scores(self, test_session):
+        """Rescoring should refresh every article in the window without duplicates"""
+        articles = _add_articles(test_session, ["Ransomware attack", "School board vote"])
+        index = TopicScoreIndex(FAIRFAX)
+        index.score_articles(test_session, articles)
+        before = test_session.query(ArticleTopicScore).count()
+
+        rescored = index.rescore(test_session, datetime.utcnow() - timedelta(hours=1))
+
+        assert rescored == 2
+        assert test_session.query(ArticleTopicScore).count() == before
+
+
+class TestCuratorSqlFiltering:
+    """Tests for curation against stored scores"""
+
+    def test_narrow_filter_finds_matches_beyond_candidate_window(
+        self, test_session, sample_user_profile
+    ):
+        """Matches older than the newest max_articles * 2 articles should still be returned"""
+        titles = ["Ransomware attack disrupts Fairfax county services"] * 3
+        titles += [f"Weekend farmers market recipe {i}" for i in range(20)]
+        articles = _add_articles(test_session, titles)
+        # Matching articles are the oldest in the window
+        for offset, article in enumerate(articles):
+            article.fetched_at = datetime.utcnow() - timedelta(minutes=len(articles) - offset)
+        test_session.commit()
+
+        curator = ContextCurator(
+            user_profile=sample_user_profile,
+            topic_filters={"topics": ["cybersecurity"], "scopes": ["local"]},
+        )
+        result = curator._get_recent_articles(test_session, hours=24, max_articles=5)
+
+        assert {a.id for a in result} == {a.id for a in articles[:3]}
+
+    def test_scope_filter_uses_place_containment(self, test_session, sample_user_profile):
+        """Places inside the user's region count as local; other states do not"""
+        articles = _add_articles(
+            test_session,
+            [
+                "Ransomware attack on Loudoun County data centers",
+                "Ransomware attack on West Virginia hospital",
+            ],
+        )
+
+        curator = ContextCurator(
+            user_profile=sample_user_profile,
+            topic_filters={"topics": ["cybersecurity"], "scopes": ["local"]},
+        )
+        result = curator._get_recent_articles(test_session, hours=24, max_articles=5)
+
+        assert [a.id for a in result] == [articles[0].id]
+
+    def test_unknown_scope_disables_scope_filtering(self, test_session, sample_user_profile):
+        """An unknown scope should behave like no scope filter"""
+        articles = _add_articles(test_session, ["Ransomware attack on hospital network"])
+
+        curator = ContextCurator(
+            user_profile=sample_user_profile,
+            topic_filters={"topics": ["cybersecurity"], "scopes": ["galactic"]},
+        )
+        result = curator._get_recent_articles(test_session, hours=24, max_articles=5)
+
+        assert [a.id for a in result] == [articles[0].id]
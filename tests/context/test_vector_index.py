@@ -0,0 +1,98 @@
+"""
+Tests for Vector Index
+"""
+
+from datetime import datetime, timedelta
+
+from src.context.vector_index import (
+    DIMENSIONS,
+    VectorIndex,
+    embed_text,
+    interest_vectors,
+    pack,
+    similarity,
+    unpack,
+)
+from src.database.models import Article, ArticleVector, RSSFeed
+
+
+def _add_articles(session, titles):
+    feed = RSSFeed(url="https://example.com/rss", name="Feed")
+    session.add(feed)
+    session.flush()
+    articles = [
+        Article(feed_id=feed.id, guid=f"g{i}", title=title) for i, title in enumerate(titles)
+    ]
+    session.add_all(articles)
+    session.commit()
+    return articles
+
+
+class TestEmbedding:
+    """Tests for hashed term-frequency vectors"""
+
+    def test_vectors_are_unit_length_and_stable(self):
+        """Embeddings should be normalized and identical across calls"""
+        vector = embed_text("Ransomware attack on the county hospital network")
+
+        assert abs(similarity(vector, vector) - 1.0) < 1e-9
+        assert embed_text("Ransomware attack on the county hospital network") == vector
+        assert all(0 <= slot < DIMENSIONS for slot in vector)
+        assert embed_text("") == {}
+
+    def test_pack_round_trips(self):
+        """Packed vectors should unpack to the same slots and (float32) weights"""
+        vector = embed_text("Hackers breach school district systems")
+
+        unpacked = unpack(pack(vector))
+
+        assert unpacked.keys() == vector.keys()
+        assert all(abs(unpacked[slot] - vector[slot]) < 1e-6 for slot in vector)
+
+    def test_related_text_is_closer_than_unrelated(self):
+        """Texts sharing vocabulary with an interest should score higher against it"""
+        cyber = interest_vectors(["cybersecurity"])["cybersecurity"]
+
+        related = similarity(
+            embed_text("Hackers exploit a vulnerability in hospital systems"), cyber
+        )
+        unrelated = similarity(embed_text("Celebrity wedding photos from the coast"), cyber)
+
+        assert related > 0.1
+        assert related > unrelated
+
+
+class TestVectorIndex:
+    """Tests for storing and searching vectors"""
+
+    def test_index_missing_and_search(self, test_session):
+        """Missing articles should be embedded once and searched by similarity"""
+        articles = _add_articles(
+            test_session,
+            ["Ransomware attack on hospital network", "School board approves budget", "Bake sale"],
+        )
+        index = VectorIndex(test_session)
+        since = datetime.utcnow() - timedelta(hours=1)
+
+        assert index.index_missing(since) == 3
+        assert index.index_missing(since) == 0
+        results = index.search(embed_text("hospital ransomware"), k=2, since=since)
+
+        assert results[0][0] == articles[0].id
+        assert results[0][1] > results[1][1]
+        assert test_session.query(ArticleVector).count() == 3
+        assert index.vectors([articles[1].id]).keys() == {articles[1].id}
+
+    def test_index_articles_replaces_stale_vectors(self, test_session):
+        """Re-indexing should overwrite an older version's vector in place"""
+        (article,) = _add_articles(test_session, ["Ransomware attack on hospital network"])
+        test_session.add(ArticleVector(article_id=article.id, vector=b"", version="old"))
+        test_session.commit()
+        index = VectorIndex(test_session)
+
+        assert index.index_missing(datetime.utcnow() - timedelta(hours=1)) == 1
+        assert index.index_articles([article, article]) == 1
+
+        (stored,) = test_session.query(ArticleVector.vector, ArticleVector.version).all()
+        assert stored.version != "old"
+        assert unpack(stored.vector) == embed_text(article.title)
@@ -0,0 +1,96 @@
+"""
+Tests for Article Search Index
+"""
+
+from datetime import datetime, timedelta
+
+from src.database.models import Article, RSSFeed
+from src.database.search_index import ArticleSearchIndex, match_all, match_any
+
+
+def _add_articles(session, rows):
+    feed = RSSFeed(url="https://example.com/rss", name="Feed")
+    session.add(feed)
+    session.flush()
+    articles = [
+        Article(feed_id=feed.id, guid=f"g{i}", title=title, normalized_content=body)
+        for i, (title, body) in enumerate(rows)
+    ]
+    session.add_all(articles)
+    session.commit()
+    return articles
+
+
+class TestMatchExpressions:
+    """Tests for building FTS5 expressions"""
+
+    def test_match_all_quotes_words(self):
+        """Operators and punctuation in user input should not be parsed as syntax"""
+        assert match_all('C++ AND "zero-day') == '"c" "and" "zero" "day"'
+        assert match_all("  ") == ""
+
+    def test_match_any_joins_distinct_phrases(self):
+        """Phrases that tokenize the same should appear once"""
+        assert match_any(["zero day", "zero-day", "hack"]) == '"hack" OR "zero day"'
+
+
+class TestArticleSearchIndex:
+    """Tests for indexing and querying articles"""
+
+    def test_search_ranks_title_matches_first(self, test_session):
+        """Body text should be searchable, and title matches should rank higher"""
+        body_match, title_match, _ = _add_articles(
+            test_session,
+            [
+                ("County budget", "Officials discussed ransomware insurance"),
+                ("Ransomware hits hospital", "Systems were offline"),
+                ("Farmers market", "Fresh produce"),
+            ],
+        )
+        index = ArticleSearchIndex(test_session)
+        index.index_missing(datetime.utcnow() - timedelta(hours=1))
+
+        results = index.search(match_all("ransomware"))
+
+        assert [a.id for a in results] == [title_match.id, body_match.id]
+
+    def test_stemming_matches_word_forms(self, test_session):
+        """Porter stemming should let 'hacking' find 'hacked'"""
+        (article,) = _add_articles(test_session, [("Utilities hacked overnight", "")])
+        index = ArticleSearchIndex(test_session)
+        index.index_articles([article])
+
+        assert [a.id for a in index.search(match_all("hacking"))] == [article.id]
+
+    def test_reindexing_replaces_rows(self, test_session):
+        """Indexing an article twice should leave one row with the latest text"""
+        (article,) = _add_articles(test_session, [("Old title", "")])
+        index = ArticleSearchIndex(test_session)
+        index.index_articles([article])
+        article.title = "New title"
+        index.index_articles([article])
+
+        assert index.search(match_all("old")) == []
+        assert [a.id for a in index.search(match_all("new"))] == [article.id]
+
+    def test_index_missing_skips_indexed_articles(self, test_session):
+        """Backfill should only index articles without a row"""
+        articles = _add_articles(test_session, [("First", ""), ("Second", "")])
+        index = ArticleSearchIndex(test_session)
+        index.index_articles(articles[:1])
+
+        since = datetime.utcnow() - timedelta(hours=1)
+        assert index.index_missing(since) == 1
+        assert index.index_missing(since) == 0
+
+    def test_search_respects_since(self, test_session):
+        """Articles fetched before the cutoff should be excluded"""
+        old, new = _add_articles(test_session, [("Ransomware old", ""), ("Ransomware new", "")])
+        old.fetched_at = datetime.utcnow() - timedelta(days=10)
+        test_session.commit()
+        index = ArticleSearchIndex(test_session)
+        index.index_articles([old, new])
+
+        results = index.search(match_all("ransomware"), since=datetime.utcnow() - timedelta(days=1))
+
+        assert [a.id for a in results] == [new.id]
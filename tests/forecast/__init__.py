@@ -0,0 +1 @@
+"""Forecast tests package"""
@@ -0,0 +1,86 @@
+"""
+Tests for Forecast Context Curator
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy import event
+
+from src.context.relevance import rank_key
+from src.database.models import Article, RSSFeed
+from src.forecast.context_curator import ForecastContextCurator
+
+
+def _add_month(session, feeds, days_ago, relevances):
+    """Articles fetched days_ago, one per (feed, base relevance) pair"""
+    fetched = datetime.utcnow() - timedelta(days=days_ago)
+    articles = []
+    for feed, relevance in relevances:
+        article = Article(
+            feed_id=feeds[feed].id,
+            guid=f"{days_ago}-{feed}-{relevance}",
+            title=f"Feed {feed} relevance {relevance}",
+            fetched_at=fetched,
+            published_date=fetched,
+            relevance_score=rank_key(relevance, fetched),
+        )
+        articles.append(article)
+    session.add_all(articles)
+    return articles
+
+
+class TestStratifiedArticles:
+    """Tests for the windowed per-month sample"""
+
+    @patch("src.context.curator.get_user_profile")
+    def test_samples_each_month_by_source_then_relevance(
+        self, mock_get_profile, test_session, test_engine
+    ):
+        """Each month should take the best article of each feed before seconds"""
+        mock_get_profile.side_effect = FileNotFoundError()
+        feeds = [RSSFeed(url=f"https://example.com/{i}", name=f"Feed {i}") for i in range(2)]
+        test_session.add_all(feeds)
+        test_session.flush()
+        _add_month(test_session, feeds, 5, [(0, 0.9), (0, 0.8), (0, 0.1), (1, 0.2)])
+        _add_month(test_session, feeds, 40, [(0, 0.3), (1, 0.7), (1, 0.6)])
+        _add_month(test_session, feeds, 100, [(0, 0.9)])
+        test_session.commit()
+
+        statements = []
+
+        def count_statement(_conn, _cursor, statement, *_args):
+            statements.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", count_statement)
+        try:
+            articles = ForecastContextCurator()._get_stratified_articles(
+                test_session, months=2, articles_per_month=2
+            )
+        finally:
+            event.remove(test_engine, "before_cursor_execute", count_statement)
+
+        assert {a.title for a in articles} == {
+            "Feed 0 relevance 0.9",
+            "Feed 1 relevance 0.2",
+            "Feed 1 relevance 0.7",
+            "Feed 0 relevance 0.3",
+        }
+        assert all(a.feed is not None for a in articles)
+        assert len(statements) == 1
+
+
+class TestFitArticles:
+    """Tests for trimming articles to the token budget"""
+
+    def test_trims_largest_month_first(self):
+        """Months should lose their lowest-ranked articles in turn"""
+        curator = ForecastContextCurator()
+        articles = [{"id": i} for i in range(7)]
+        months = [0, 0, 0, 0, 1, 1, 2]
+
+        with patch.object(curator.token_counter, "count_article", return_value=9):
+            kept = curator._fit_articles(articles, months, target_tokens=41)
+
+        # Four articles fit; month 0 gives up two before month 1 gives up one
+        assert [a["id"] for a in kept] == [0, 1, 4, 6]
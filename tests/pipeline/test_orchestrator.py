@@ -268,7 +268,7 @@ class TestFilterContent:
         # Mock database session
         mock_db = MagicMock()
         mock_session.return_value = mock_db
-        mock_db.query.return_value.filter.return_value.all.return_value = []
+        mock_db.query.return_value.options.return_value.filter.return_value.all.return_value = []
 
         # Mock content filter
         mock_filter = MagicMock()
@@ -301,6 +301,40 @@ class TestFilterContent:
         assert result["skipped"] is True
         assert "User profile not found" in result["reason"]
 
+    @pytest.mark.asyncio
+    async def test_filter_content_evaluates_each_article_once(self, test_session):
+        """Articles evaluated under the current filter version should not be reloaded"""
+        from src.database.models import Article, RSSFeed
+        from src.processors.content_filter import ContentFilter
+
+        feed = RSSFeed(url="https://example.com/rss", name="Feed")
+        test_session.add(feed)
+        test_session.flush()
+        test_session.add(Article(feed_id=feed.id, guid="kept", title="County budget vote"))
+        test_session.commit()
+
+        orchestrator = PipelineOrchestrator()
+        orchestrator.content_filter = ContentFilter()
+
+        with patch("src.database.connection.get_db_session", return_value=test_session):
+            first = await orchestrator._filter_content()
+            second = await orchestrator._filter_content()
+            profile = MagicMock()
+            profile.get_excluded_topics.return_value = ["budget"]
+            profile.get_primary_location.return_value = {}
+            orchestrator.content_filter = ContentFilter(profile)
+            third = await orchestrator._filter_content()
+            orchestrator.content_filter = ContentFilter()
+            fourth = await orchestrator._filter_content()
+
+        assert first["kept_count"] == 1
+        assert second["articles_evaluated"] == 0
+        assert third["filtered_count"] == 1
+        assert fourth["kept_count"] == 1
+        article = test_session.query(Article).one()
+        assert article.filtered is False
+        assert article.filter_reason is None
+
 
 class TestSynthesizeNarrative:
     """Tests for narrative synthesis stage"""
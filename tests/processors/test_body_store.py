@@ -0,0 +1,135 @@
+"""
+Tests for Article Body Store
+"""
+
+from src.database.models import Article, ArticleBody, RSSFeed
+from src.processors.body_store import BodyStore
+from src.rss.fetcher import RSSFetcher
+
+
+def _add_feed(session, name="Feed"):
+    feed = RSSFeed(url=f"https://example.com/{name}/rss", name=name)
+    session.add(feed)
+    session.flush()
+    return feed
+
+
+class TestBodyStore:
+    """Tests for interning normalized text"""
+
+    def test_identical_text_shares_one_body(self, test_session):
+        """Two articles with the same text should reference one compressed body"""
+        feed = _add_feed(test_session)
+        bodies = BodyStore(test_session)
+
+        first, created_first = bodies.intern("Wire copy carried by many outlets")
+        second, created_second = bodies.intern("Wire copy carried by many outlets")
+        test_session.add_all(
+            [
+                Article(feed_id=feed.id, guid="a", title="A", body=first),
+                Article(feed_id=feed.id, guid="b", title="B", body=second),
+            ]
+        )
+        test_session.commit()
+
+        assert created_first is True
+        assert created_second is False
+        assert test_session.query(ArticleBody).count() == 1
+        assert first.ref_count == 2
+        assert first.text == "Wire copy carried by many outlets"
+
+    def test_reference_taken_in_later_session_is_counted(self, test_session):
+        """Existing bodies should be incremented in SQL"""
+        bodies = BodyStore(test_session)
+        bodies.intern("Shared text")
+        test_session.commit()
+
+        body, created = BodyStore(test_session).intern("Shared text")
+        test_session.commit()
+        test_session.refresh(body)
+
+        assert created is False
+        assert body.ref_count == 2
+
+    def test_empty_text_is_not_stored(self, test_session):
+        """Empty bodies should not create rows"""
+        assert BodyStore(test_session).intern("") == (None, False)
+
+    def test_recount_removes_orphans(self, test_session):
+        """Bodies no longer referenced by any article should be dropped"""
+        feed = _add_feed(test_session)
+        bodies = BodyStore(test_session)
+        kept, _ = bodies.intern("kept")
+        # A reference taken for an article that was never stored
+        bodies.intern("kept")
+        bodies.intern("orphan")
+        test_session.add(Article(feed_id=feed.id, guid="a", title="A", body=kept))
+        test_session.commit()
+
+        result = BodyStore(test_session).recount()
+        test_session.refresh(kept)
+
+        assert result == {"counts_corrected": 2, "orphans_removed": 1}
+        assert kept.ref_count == 1
+        assert [b.text for b in test_session.query(ArticleBody).all()] == ["kept"]
+
+
+class TestArticleNormalizedContent:
+    """Tests for reading text through the body reference"""
+
+    def test_reads_shared_body_and_matches_sql_filter(self, test_session):
+        """normalized_content should resolve from the body in Python and SQL filters"""
+        feed = _add_feed(test_session)
+        body, _ = BodyStore(test_session).intern("Body text")
+        test_session.add_all(
+            [
+                Article(feed_id=feed.id, guid="shared", title="A", body=body),
+                Article(feed_id=feed.id, guid="inline", title="B", normalized_content="Inline"),
+                Article(feed_id=feed.id, guid="empty", title="C"),
+            ]
+        )
+        test_session.commit()
+
+        shared = test_session.query(Article).filter(Article.guid == "shared").one()
+        with_text = test_session.query(Article).filter(Article.normalized_content.isnot(None))
+
+        assert shared.normalized_content == "Body text"
+        assert {a.guid for a in with_text} == {"shared", "inline"}
+
+
+class TestFetcherBodies:
+    """Tests for body interning during ingest"""
+
+    def test_syndicated_copy_drops_duplicate_raw_content(self, test_session):
+        """A second feed carrying the same body should not store it again"""
+        first_feed = _add_feed(test_session, "first")
+        second_feed = _add_feed(test_session, "second")
+        fetcher = RSSFetcher(known_articles=None)
+        bodies = BodyStore(test_session)
+        data = {
+            "guid": "g",
+            "title": "Title",
+            "content": "<p>Press release</p>",
+            "normalized_content": "Press release",
+        }
+
+        original = fetcher._build_article(first_feed.id, data, bodies)
+        copy = fetcher._build_article(second_feed.id, data, bodies)
+
+        assert original.body is copy.body
+        assert original.content == "<p>Press release</p>"
+        assert copy.content is None
+        assert copy.normalized_content == "Press release"
+
+    def test_normalization_is_memoized_by_raw_html(self):
+        """Identical raw HTML should be cleaned once per fetcher"""
+        fetcher = RSSFetcher(known_articles=None)
+        calls = []
+        original_clean = fetcher.clean_html
+        fetcher.clean_html = lambda html: calls.append(html) or original_clean(html)
+
+        fetcher._normalize_cached("<p>Same</p>")
+        result = fetcher._normalize_cached("<p>Same</p>")
+
+        assert result == "Same"
+        assert len(calls) == 1
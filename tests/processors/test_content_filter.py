@@ -245,3 +245,121 @@ class TestGetFilterStats:
         assert stats["filtered_count"] == 0
         assert stats["filter_rate"] == 0
         assert stats["reasons"] == {}
+
+
+def _substring_reason(content_filter, title, description):
+    """Reference oracle: the previous substring-scan implementation"""
+    text = f"{title} {description}".lower()
+    for topic in content_filter.excluded_topics:
+        if topic in text:
+            return f"excluded_topic:{topic}"
+    if sum(1 for k in ContentFilter.SPORTS_KEYWORDS if k in text) >= 2:
+        return "sports"
+    title_lower = title.lower()
+    if any(k in title_lower for k in ContentFilter.CLICKBAIT_KEYWORDS):
+        return "clickbait"
+    if content_filter._clickbait_heuristics(title):
+        return "clickbait"
+    if any(k in text for k in ContentFilter.ENTERTAINMENT_KEYWORDS):
+        return "entertainment"
+    return None
+
+
+PARITY_HEADLINES = [
+    ("NFL Quarterback Throws Touchdown in Playoff Game", "Football action"),
+    ("Stanley Cup Final: Goalie Stops 40 Shots", "Hockey night"),
+    ("You Won't Believe What This Expert Discovered", "Normal content"),
+    ("Amazing Discovery!! Shocking News!!", ""),
+    ("10 Reasons You Need to Read This Now", ""),
+    ("Celebrity Fashion at the Oscars Red Carpet", "Hollywood event"),
+    ("New Crypto Trading Platform Launches", "Cryptocurrency news"),
+    ("NFT Marketplace Sees Record Volume", "Digital collectibles"),
+    ("City Council Approves New Infrastructure Plan", "Local government news"),
+    ("Fed Signals Pause as Inflation Cools", "Markets react to central bank"),
+    ("Box Office Weekend: Sequel Tops Charts", "Hollywood studios celebrate"),
+    ("Tennis and Golf Tournaments Draw Crowds", "Weekend sports roundup"),
+]
+
+
+class TestKeywordAutomatonParity:
+    """Parity and word-boundary tests for the compiled keyword automaton"""
+
+    @pytest.mark.parametrize(("title", "description"), PARITY_HEADLINES)
+    def test_reasons_match_substring_scan(self, mock_user_profile, title, description):
+        """Should give the same reason as the previous implementation on ordinary headlines"""
+        filter = ContentFilter(user_profile=mock_user_profile)
+
+        _should_filter, reason = filter.should_filter(title, description)
+
+        assert reason == _substring_reason(filter, title, description)
+
+    def test_keywords_do_not_match_inside_words(self):
+        """'nfl' in 'inflation' and 'mls' in 'realms' should no longer count as sports"""
+        filter = ContentFilter()
+        title = "Inflation Fears Spread Across Realms of Policy"
+        description = "Tennis tournament postponed"
+
+        should_filter, _reason = filter.should_filter(title, description)
+
+        assert _substring_reason(filter, title, description) == "sports"
+        assert should_filter is False
+
+    def test_plural_keywords_still_match(self):
+        """A trailing plural 's' should still count as the keyword"""
+        filter = ContentFilter()
+
+        should_filter, reason = filter.should_filter("Quarterbacks and Pitchers Trade Places")
+
+        assert should_filter is True
+        assert reason == "sports"
+
+    def test_match_categories_returns_every_hit(self, mock_user_profile):
+        """All categories should be reported, not just the first reason"""
+        filter = ContentFilter(user_profile=mock_user_profile)
+
+        hits = filter.match_categories(
+            "Crypto Influencer Drama Goes Viral at NFL Super Bowl", "Celebrity gossip"
+        )
+
+        assert hits["excluded_topic"] == {"crypto"}
+        assert hits["sports"] == {"nfl", "super bowl"}
+        assert "goes viral" in hits["clickbait"]
+        assert hits["entertainment"] == {"influencer drama", "celebrity", "celebrity gossip"}
+
+    def test_clickbait_phrases_only_count_in_title(self):
+        """Clickbait keywords in the description should not filter the article"""
+        filter = ContentFilter()
+
+        should_filter, _reason = filter.should_filter(
+            "Council Passes Budget", "The vote goes viral among residents"
+        )
+
+        assert should_filter is False
+
+    def test_automaton_shared_across_instances(self, mock_user_profile):
+        """The same profile topics should reuse one compiled automaton"""
+        first = ContentFilter(user_profile=mock_user_profile)
+        second = ContentFilter(user_profile=mock_user_profile)
+
+        assert first.automaton is second.automaton
+
+
+class TestFilterVersion:
+    """Tests for filter configuration versioning"""
+
+    def test_version_is_stable_for_same_profile(self, mock_user_profile):
+        """The same configuration should always hash to the same version"""
+        assert ContentFilter(mock_user_profile).version == ContentFilter(mock_user_profile).version
+
+    def test_version_changes_with_excluded_topics(self, mock_user_profile):
+        """Changing excluded topics should invalidate earlier evaluations"""
+        assert ContentFilter(mock_user_profile).version != ContentFilter().version
+
+    def test_filter_articles_stamps_version(self, sports_article, normal_article):
+        """Kept and filtered articles should both record the version they were evaluated under"""
+        filter = ContentFilter()
+
+        filter.filter_articles([sports_article, normal_article])
+
+        assert sports_article.filter_version == filter.version
+        assert normal_article.filter_version == filter.version
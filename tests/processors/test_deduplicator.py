@@ -4,6 +4,8 @@ Tests for Article Deduplicator
 
 from unittest.mock import MagicMock, patch
 
+from src.database.models import Article, RSSFeed
+from src.processors.body_store import BodyStore
 from src.processors.deduplicator import ArticleDeduplicator, run_deduplication
 
 
@@ -194,6 +196,37 @@ class TestFindExactDuplicates:
 
         assert result == []
 
+    def test_matches_shared_and_inline_bodies(self, test_session):
+        """Should match normalized text across shared bodies, inline text and formatting"""
+        feed = RSSFeed(url="https://example.com/rss", name="Feed")
+        test_session.add(feed)
+        test_session.flush()
+        body, _created = BodyStore(test_session).intern("Wire copy carried by many outlets")
+        article = Article(feed_id=feed.id, guid="a", title="Budget Vote", body=body)
+        shared = Article(feed_id=feed.id, guid="b", title="Budget vote!", body=body)
+        inline = Article(
+            feed_id=feed.id,
+            guid="c",
+            title="Budget vote",
+            normalized_content="Wire copy carried by many outlets",
+        )
+        retitled = Article(feed_id=feed.id, guid="d", title="Other story", body=body)
+        other = Article(
+            feed_id=feed.id, guid="e", title="Budget vote", normalized_content="Different text"
+        )
+        reformatted = Article(
+            feed_id=feed.id,
+            guid="f",
+            title="BUDGET VOTE",
+            normalized_content="Wire copy, carried by  MANY outlets.",
+        )
+        test_session.add_all([article, shared, inline, retitled, other, reformatted])
+        test_session.commit()
+
+        result = ArticleDeduplicator().find_exact_duplicates(article, test_session)
+
+        assert sorted(a.guid for a in result) == ["b", "c", "f"]
+
 
 class TestFindNearDuplicates:
     """Tests for near-duplicate detection"""
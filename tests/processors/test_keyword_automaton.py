@@ -0,0 +1,43 @@
+"""
+Tests for Keyword Automaton
+"""
+
+from src.processors.keyword_automaton import KeywordAutomaton, tokenize
+
+
+class TestTokenize:
+    """Tests for tokenization"""
+
+    def test_punctuation_splits_words(self):
+        """Punctuation should act as whitespace"""
+        assert tokenize("NFL's Mind-Blowing Season!") == ["nfl", "s", "mind", "blowing", "season"]
+
+
+class TestKeywordAutomaton:
+    """Tests for multi-pattern matching"""
+
+    def test_finds_overlapping_patterns_in_one_pass(self):
+        """Patterns sharing suffixes should all be reported"""
+        automaton = KeywordAutomaton({"a": {"red carpet", "carpet"}, "b": {"red"}})
+
+        hits = automaton.find(tokenize("the red carpet event"))
+
+        assert sorted(hits) == [
+            ("a", "carpet", 2, 3),
+            ("a", "red carpet", 1, 3),
+            ("b", "red", 1, 2),
+        ]
+
+    def test_failure_links_recover_partial_matches(self):
+        """A partial match should fall back to a shorter pattern"""
+        automaton = KeywordAutomaton({"sports": {"world series", "series finale"}})
+
+        hits = automaton.match("the world series finale")
+
+        assert hits == {"sports": {"world series", "series finale"}}
+
+    def test_no_match_inside_words(self):
+        """Matches must fall on word boundaries"""
+        automaton = KeywordAutomaton({"sports": {"nfl"}})
+
+        assert automaton.match("inflation and influence") == {}
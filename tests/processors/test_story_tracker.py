@@ -0,0 +1,154 @@
+"""
+Tests for Story Tracker
+"""
+
+from datetime import datetime, timedelta
+
+from src.database.models import Article, RSSFeed
+from src.processors.story_tracker import StoryTracker, UnionFind, get_story_stats
+
+
+def _add_articles(session, count, feeds=1):
+    """Create feeds and articles, returning the article ids in insertion order"""
+    feed_rows = [
+        RSSFeed(url=f"https://feed{i}.example.com/rss", name=f"Feed {i}") for i in range(feeds)
+    ]
+    session.add_all(feed_rows)
+    session.flush()
+
+    now = datetime.utcnow()
+    articles = [
+        Article(
+            feed_id=feed_rows[i % feeds].id,
+            guid=f"guid-{i}",
+            title=f"Article {i}",
+            fetched_at=now - timedelta(days=count - i),
+        )
+        for i in range(count)
+    ]
+    session.add_all(articles)
+    session.commit()
+    return [a.id for a in articles]
+
+
+class TestUnionFind:
+    """Tests for the disjoint-set forest"""
+
+    def test_find_unknown_item_is_own_root(self):
+        """Unseen items should be their own set"""
+        forest = UnionFind()
+
+        assert forest.find(7) == 7
+
+    def test_union_uses_smallest_id_as_root(self):
+        """Merged sets should be represented by the smallest id"""
+        forest = UnionFind()
+
+        forest.union(5, 3)
+        forest.union(9, 5)
+
+        assert forest.find(9) == 3
+        assert forest.groups() == {3: {3, 5, 9}}
+
+    def test_long_chain_does_not_recurse(self):
+        """Deep chains should resolve without hitting the recursion limit"""
+        forest = UnionFind()
+        for i in range(5000, 0, -1):
+            forest.parent[i] = i - 1
+        forest.parent[0] = 0
+
+        assert forest.find(5000) == 0
+
+
+class TestStoryTracker:
+    """Tests for persistent story assignment"""
+
+    def test_singletons_get_own_story(self, test_session):
+        """Articles without duplicates should become single-article stories"""
+        ids = _add_articles(test_session, 3)
+
+        StoryTracker().apply(test_session, ids)
+        test_session.commit()
+
+        stories = [test_session.get(Article, i).story_id for i in ids]
+        assert stories == ids
+
+    def test_edges_merge_into_oldest_story(self, test_session):
+        """Duplicate edges should place articles in the story of the smallest id"""
+        a, b, c = _add_articles(test_session, 3)
+        tracker = StoryTracker()
+        tracker.add_edge(a, b)
+        tracker.add_edge(b, c)
+
+        result = tracker.apply(test_session, [a, b, c])
+        test_session.commit()
+
+        assert {test_session.get(Article, i).story_id for i in (a, b, c)} == {a}
+        assert result["stories_assigned"] == 3
+
+    def test_stories_persist_across_runs(self, test_session):
+        """A later run should link new duplicates to a story found on an earlier day"""
+        a, b, c, d = _add_articles(test_session, 4)
+
+        day_one = StoryTracker()
+        day_one.add_edge(a, b)
+        day_one.apply(test_session, [a, b])
+        test_session.commit()
+
+        # Day two only sees b (still in window) and its new duplicates
+        day_two = StoryTracker()
+        day_two.add_edge(b, c)
+        day_two.add_edge(c, d)
+        day_two.apply(test_session, [b, c, d])
+        test_session.commit()
+        test_session.expire_all()
+
+        assert {test_session.get(Article, i).story_id for i in (a, b, c, d)} == {a}
+
+    def test_merging_two_existing_stories_relabels_members(self, test_session):
+        """Joining two stories should move every member of the younger story"""
+        a, b, c, d = _add_articles(test_session, 4)
+
+        first = StoryTracker()
+        first.add_edge(a, b)
+        first.add_edge(c, d)
+        first.apply(test_session, [a, b, c, d])
+        test_session.commit()
+
+        bridge = StoryTracker()
+        bridge.add_edge(b, c)
+        result = bridge.apply(test_session, [b, c])
+        test_session.commit()
+        test_session.expire_all()
+
+        assert test_session.get(Article, d).story_id == a
+        assert result["stories_merged"] == 1
+
+    def test_apply_without_work_is_noop(self, test_session):
+        """Empty runs should not touch the database"""
+        result = StoryTracker().apply(test_session, [])
+
+        assert result == {"stories_assigned": 0, "stories_merged": 0}
+
+
+class TestGetStoryStats:
+    """Tests for story coverage statistics"""
+
+    def test_counts_feeds_and_first_seen(self, test_session):
+        """Should report distinct feeds and earliest fetch per story"""
+        a, b, c = _add_articles(test_session, 3, feeds=2)
+        tracker = StoryTracker()
+        tracker.add_edge(a, b)
+        tracker.add_edge(a, c)
+        tracker.apply(test_session, [a, b, c])
+        test_session.commit()
+
+        stats = get_story_stats(test_session, [a])
+
+        assert stats[a]["article_count"] == 3
+        assert stats[a]["feed_count"] == 2
+        assert stats[a]["first_seen"] == test_session.get(Article, a).fetched_at.isoformat()
+
+    def test_empty_ids(self, test_session):
+        """Should return an empty dict without querying"""
+        assert get_story_stats(test_session, [None]) == {}
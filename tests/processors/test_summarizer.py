@@ -0,0 +1,84 @@
+"""
+Tests for Extractive Summarizer
+"""
+
+from src.database.models import Article, RSSFeed
+from src.processors.summarizer import (
+    MIN_SUMMARY_WORDS,
+    split_sentences,
+    summarize,
+    summarize_missing,
+)
+
+ARTICLE = " ".join(
+    [
+        "Fairfax County supervisors approved a new budget for county schools on Tuesday.",
+        "The budget raises teacher pay and funds new school construction across the county.",
+        "Several parents attended the meeting wearing matching shirts.",
+        "Supervisors said the school budget depends on a higher county property tax rate.",
+        "The weather was mild and sunny for most of the afternoon.",
+        "County schools will hire more teachers once the budget takes effect in July.",
+        "A local bakery handed out free cookies outside the government center.",
+    ]
+    * 3
+)
+
+
+class TestSummarize:
+    """Tests for TextRank sentence extraction"""
+
+    def test_split_sentences(self):
+        """Sentences should split on terminal punctuation before a capital"""
+        assert split_sentences('He said "Yes." Then left. Version 2.5 ships. 3 more.') == [
+            'He said "Yes."',
+            "Then left.",
+            "Version 2.5 ships.",
+            "3 more.",
+        ]
+
+    def test_picks_central_sentences_in_order(self):
+        """The summary should keep on-topic sentences and drop the asides"""
+        summary = summarize(ARTICLE)
+
+        sentences = split_sentences(summary)
+        assert len(sentences) == 3
+        assert all("budget" in s or "schools" in s or "county" in s for s in sentences)
+        assert "cookies" not in summary and "weather" not in summary
+        assert len(summary.split()) < len(ARTICLE.split()) / 4
+
+    def test_short_text_is_not_summarized(self):
+        """Articles shorter than the threshold should keep their full text"""
+        assert summarize("A short article. It has two sentences.") is None
+        assert summarize(None) is None
+
+
+class TestSummarizeMissing:
+    """Tests for the backfill"""
+
+    def test_fills_only_long_unsummarized_articles(self, test_session):
+        """Long articles without summaries should be summarized once"""
+        feed = RSSFeed(url="https://example.com/rss", name="Feed")
+        test_session.add(feed)
+        test_session.flush()
+        long_article = Article(
+            feed_id=feed.id,
+            guid="long",
+            title="Budget",
+            normalized_content=ARTICLE,
+            word_count=len(ARTICLE.split()),
+        )
+        short_article = Article(
+            feed_id=feed.id,
+            guid="short",
+            title="Brief",
+            normalized_content="Short text.",
+            word_count=MIN_SUMMARY_WORDS - 1,
+        )
+        test_session.add_all([long_article, short_article])
+        test_session.commit()
+
+        assert summarize_missing(test_session) == 1
+        assert summarize_missing(test_session) == 0
+        summaries = dict(test_session.query(Article.guid, Article.embedding_summary))
+        assert summaries["long"] == summarize(ARTICLE)
+        assert summaries["short"] is None
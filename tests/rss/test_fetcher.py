@@ -135,6 +135,29 @@ class TestNormalizeArticle:
 
         assert result["language"] == "en"
 
+    @patch("src.rss.fetcher.summarize")
+    def test_normalize_article_defers_summary(self, mock_summarize, sample_feedparser_entry):
+        """Should leave summarizing to new articles, not every polled entry"""
+        fetcher = RSSFetcher()
+
+        result = fetcher.normalize_article(sample_feedparser_entry, {})
+
+        assert "embedding_summary" not in result
+        mock_summarize.assert_not_called()
+
+    @patch("src.rss.fetcher.summarize", return_value="Summary.")
+    def test_build_article_summarizes_content(self, mock_summarize, sample_feedparser_entry):
+        """Should summarize the normalized text of a new article"""
+        fetcher = RSSFetcher()
+        article_data = fetcher.normalize_article(sample_feedparser_entry, {})
+        bodies = MagicMock()
+        bodies.intern.return_value = (None, False)
+
+        article = fetcher._build_article(1, article_data, bodies)
+
+        assert article.embedding_summary == "Summary."
+        mock_summarize.assert_called_once_with(article_data["normalized_content"])
+
 
 class TestCleanHtml:
     """Tests for HTML cleaning"""
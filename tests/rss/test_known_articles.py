@@ -0,0 +1,121 @@
+"""
+Tests for Known Article Filter
+"""
+
+import time
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.database.models import Article, RSSFeed
+from src.rss.fetcher import RSSFetcher
+from src.rss.known_articles import BloomFilter, KnownArticleFilter
+
+
+class TestBloomFilter:
+    """Tests for the Bloom filter"""
+
+    def test_no_false_negatives(self):
+        """Every inserted key must be reported as present"""
+        bloom = BloomFilter(1000)
+        keys = [f"key-{i}" for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(key in bloom for key in keys)
+
+    def test_false_positive_rate_near_target(self):
+        """Unseen keys should rarely be reported as present"""
+        bloom = BloomFilter(1000, false_positive_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"key-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+
+class TestKnownArticleFilter:
+    """Tests for persistence and rebuild"""
+
+    def _add_article(self, session, guid="guid-1", url="https://example.com/a"):
+        feed = RSSFeed(url=f"https://example.com/{guid}/rss", name="Feed")
+        session.add(feed)
+        session.flush()
+        session.add(Article(feed_id=feed.id, guid=guid, url=url, title="Title"))
+        session.commit()
+        return feed.id
+
+    def test_rebuild_from_database(self, test_session, tmp_path):
+        """Stored articles should be maybe-present after a rebuild"""
+        feed_id = self._add_article(test_session)
+        known = KnownArticleFilter(path=tmp_path / "known.bloom")
+
+        known.ensure_ready(test_session)
+
+        assert known.might_contain(feed_id, "guid-1")
+        assert not known.might_contain(feed_id, "new-guid")
+
+    def test_round_trip_through_disk(self, test_session, tmp_path):
+        """A saved filter should load without touching the database"""
+        path = tmp_path / "known.bloom"
+        first = KnownArticleFilter(path=path)
+        first.ensure_ready(test_session)
+        first.add(7, "guid-7")
+        first.save()
+
+        second = KnownArticleFilter(path=path)
+        assert second.load()
+        assert second.might_contain(7, "guid-7")
+        assert not second.is_stale()
+
+    def test_stale_filter_is_rebuilt(self, test_session, tmp_path):
+        """Filters older than the rebuild interval should be rebuilt"""
+        known = KnownArticleFilter(path=tmp_path / "known.bloom", rebuild_hours=1)
+        known.ensure_ready(test_session)
+        known.built_at = time.time() - 7200
+
+        assert known.is_stale()
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        """Unreadable files should fall back to a rebuild"""
+        path = tmp_path / "known.bloom"
+        path.write_bytes(b"not a filter")
+
+        assert KnownArticleFilter(path=path).load() is False
+
+
+class TestFetcherPrefilter:
+    """Tests for the ingest-time prefilter in fetch_and_store_feed"""
+
+    @pytest.mark.asyncio
+    async def test_new_entries_skip_lookup_and_known_entries_are_confirmed(
+        self, test_session, tmp_path, sample_rss_response
+    ):
+        """Definite misses should insert directly; hits should be confirmed and skipped"""
+        feed = RSSFeed(url="https://example.com/rss", name="Test Feed")
+        test_session.add(feed)
+        test_session.commit()
+
+        @contextmanager
+        def fake_get_db():
+            yield test_session
+
+        known = KnownArticleFilter(path=tmp_path / "known.bloom")
+        fetcher = RSSFetcher(known_articles=known)
+        response = MagicMock(content=sample_rss_response, raise_for_status=MagicMock())
+
+        with (
+            patch("src.rss.fetcher.get_db", fake_get_db),
+            patch.object(fetcher.session, "get", new_callable=AsyncMock, return_value=response),
+        ):
+            _, first_count, _ = await fetcher.fetch_and_store_feed(feed.id)
+            _, second_count, _ = await fetcher.fetch_and_store_feed(feed.id)
+
+        await fetcher.close()
+
+        assert first_count == 2
+        assert second_count == 0
+        assert test_session.query(Article).count() == 2
+        assert known.might_contain(feed.id, "article-1")
+        assert (tmp_path / "known.bloom").exists()